@@ -0,0 +1,216 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+""" Compact, picklable snapshots of parsed metadata records """
+
+from __future__ import (absolute_import, division, print_function)
+
+import multiprocessing
+
+import six
+from six.moves import intern
+
+from owslib.etree import etree
+from owslib import util, iso, fgdc, dif
+from owslib.namespaces import Namespaces
+
+# strings up to this length, such as codelist values, languages or roles,
+# are interned: repeated across records, they are then stored once
+INTERN_LENGTH = 64
+
+_classes = {}
+
+# interned strings that intern does not accept
+_strings = {}
+
+
+class CompactRecord(object):
+    """ Base class of compact records: slotted, without __dict__, and
+    picklable whatever their fields """
+
+    __slots__ = ()
+    _fields = ()
+    _source = None
+
+    def __reduce__(self):
+        return (_restore, (self._source, self._fields, tuple(getattr(self, f) for f in self._fields)))
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactRecord) and self._source == other._source and
+                self._fields == other._fields and
+                all(getattr(self, f) == getattr(other, f) for f in self._fields))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<compact %s>' % self._source[1]
+
+
+def _compactclass(source, fields):
+    """ Return the slotted class of a source class and fields """
+    key = (source, fields)
+    cls = _classes.get(key)
+    if cls is None:
+        cls = type(str(source[1]), (CompactRecord,), {
+            '__slots__': fields, '_fields': fields, '_source': source})
+        cls = _classes.setdefault(key, cls)
+    return cls
+
+
+def _restore(source, fields, values):
+    record = _compactclass(source, fields).__new__(_compactclass(source, fields))
+    for field, value in zip(fields, values):
+        setattr(record, field, value)
+    return record
+
+
+def _fieldnames(obj):
+    """ Return the public fields of a parsed object, lazy ones included """
+    names = set(vars(obj)).union(util.cached_properties(obj))
+    return sorted(k for k in names if not k.startswith('_'))
+
+
+def _intern(value):
+    try:
+        return intern(value)
+    except TypeError:  # unicode on Python 2
+        return _strings.setdefault(value, value)
+
+
+def _compactvalue(value, xml):
+    if isinstance(value, six.string_types):
+        return _intern(value) if len(value) <= INTERN_LENGTH else value
+    if isinstance(value, (list, tuple)):
+        return tuple(_compactvalue(v, xml) for v in value)
+    if isinstance(value, dict):
+        return dict((_compactvalue(k, xml), _compactvalue(v, xml)) for k, v in value.items())
+    if isinstance(value, CompactRecord) or not type(value).__module__.startswith('owslib.'):
+        return value
+    return compact(value, xml=xml)
+
+
+def compact(record, fields=None, xml=False):
+    """
+
+    Return a compact snapshot of a parsed metadata record, such as an
+    iso.MD_Metadata, csw.CswRecord, dif.DIF or fgdc.Metadata, and of the
+    objects it holds.
+
+    The snapshot is an instance of a slotted CompactRecord class, with the
+    public fields of the record as attributes.  Lists become tuples, short
+    strings are interned, and the raw XML is dropped unless xml is True.
+    Snapshots are picklable.
+
+    Parameters
+    ----------
+
+    - record: the parsed record
+    - fields: optional list of the fields to keep, as a projection of the
+      record skipping the parsing of the others (default is all of them)
+    - xml: whether to keep the raw XML of the record (default is False)
+
+    """
+
+    names = _fieldnames(record) if fields is None else list(fields)
+    if not xml and 'xml' in names:
+        names.remove('xml')
+    source = (type(record).__module__, type(record).__name__)
+    cls = _compactclass(source, tuple(names))
+    snapshot = cls.__new__(cls)
+    for name in names:
+        value = getattr(record, name, None)
+        setattr(snapshot, name, value if name == 'xml' else _compactvalue(value, xml))
+    return snapshot
+
+
+def _parser(root):
+    """ Return the parser class of a metadata document root element """
+    n = Namespaces()
+    parsers = {
+        '{%s}MD_Metadata' % n.get_namespace('gmd'): iso.MD_Metadata,
+        '{%s}MI_Metadata' % n.get_namespace('gmi'): iso.MD_Metadata,
+        '{%s}DIF' % n.get_namespace('dif'): dif.DIF,
+        'metadata': fgdc.Metadata,
+    }
+    try:
+        return parsers[root.tag]
+    except KeyError:
+        raise ValueError('Unsupported metadata document: %s' % root.tag)
+
+
+def _isdocument(source):
+    """ Whether a source is the bytes of a document rather than a path """
+    return isinstance(source, six.binary_type) and source.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'<')
+
+
+def _parsedocument(source):
+    """ Parse a metadata document from a path or from bytes """
+    if _isdocument(source):
+        root = etree.fromstring(source)
+    else:
+        root = etree.parse(source).getroot()
+    return _parser(root)(root)
+
+
+def _parsebatch(batch):
+    """ Parse a batch of documents in a worker process """
+    keys, sources, fields, xml, skip = batch
+    records = []
+    for key, source in zip(keys, sources):
+        try:
+            records.append((key, compact(_parsedocument(source), fields=fields, xml=xml)))
+        except Exception as err:
+            if not skip:
+                raise ValueError('%s: %s' % (key, err))
+            records.append((key, None))
+    return records
+
+
+def _batches(sources, batchsize, fields, xml, skip):
+    keys, batch = [], []
+    for i, source in enumerate(sources):
+        keys.append(i if _isdocument(source) else source)
+        batch.append(source)
+        if len(batch) == batchsize:
+            yield keys, batch, fields, xml, skip
+            keys, batch = [], []
+    if batch:
+        yield keys, batch, fields, xml, skip
+
+
+def bulkparse(sources, workers=None, batchsize=50, fields=None, xml=False, skip=False):
+    """
+
+    Parse ISO (gmd:MD_Metadata, gmi:MI_Metadata), FGDC and DIF metadata
+    documents in a pool of worker processes, yielding (key, record) tuples
+    of compact snapshots as batches of documents are parsed, in completion
+    order.  The key is the path of the document, or its position in sources
+    when given as bytes
+
+    Parameters
+    ----------
+
+    - sources: iterable of paths or bytes of metadata documents, read
+      as they are sent to the workers
+    - workers: the number of worker processes (default is the number of CPUs)
+    - batchsize: the number of documents sent to a worker at once (default is 50)
+    - fields: optional list of the fields to keep of every record, see compact
+    - xml: whether to keep the raw XML of the records (default is False)
+    - skip: whether unparseable documents are yielded with a None record
+      (default is False: a ValueError is raised)
+
+    """
+
+    workers = workers or multiprocessing.cpu_count()
+    batches = _batches(sources, max(1, batchsize), fields, xml, skip)
+    for records in util.process_map(_parsebatch, batches, workers=workers,
+                                    ordered=False, prefetch=2 * workers):
+        for key, record in records:
+            yield key, record
@@ -11,7 +11,10 @@
 
 from __future__ import (absolute_import, division, print_function)
 
+import copy
 import inspect
+import threading
+import time
 import warnings
 import six
 try:
@@ -45,6 +48,7 @@ def get_namespaces():
 namespaces = get_namespaces()
 schema = 'http://schemas.opengis.net/csw/2.0.2/CSW-discovery.xsd'
 schema_location = '%s %s' % (namespaces['csw'], schema)
+_paths = util.ElementPaths(namespaces)
 
 class CatalogueServiceWeb(object):
     """ csw request class """
@@ -296,7 +300,7 @@ class CatalogueServiceWeb(object):
             self.records = OrderedDict()
             self._parserecords(outputschema, esn)
 
-    def getrecords2(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary', outputschema=namespaces['csw'], format=outputformat, startposition=0, maxrecords=10, cql=None, xml=None, resulttype='results'):
+    def getrecords2(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary', outputschema=namespaces['csw'], format=outputformat, startposition=0, maxrecords=10, cql=None, xml=None, resulttype='results', stream=False):
         """
 
         Construct and process a  GetRecords request
@@ -315,6 +319,11 @@ class CatalogueServiceWeb(object):
         - cql: common query language text.  Note this overrides bbox, qtype, keywords
         - xml: raw XML request.  Note this overrides all other options
         - resulttype: the resultType 'hits', 'results', 'validate' (default is 'results')
+        - stream: whether to parse the records one at a time (default is False).  When True, self.records
+          is left empty and an iterator of (identifier, record) tuples is returned instead, the response
+          being read from the connection as records are requested and each record element freed once
+          the next one is requested, so that memory stays bounded whatever maxrecords.  self.results is
+          set before the iterator is returned, and self.response is the response being read
 
         """
 
@@ -361,31 +370,80 @@ class CatalogueServiceWeb(object):
 
             self.request = node0
 
+        if stream:
+            self._invoke(parse=False, stream=True)
+            return self._streamrecords(outputschema, esn)
+
         self._invoke()
  
         if self.exceptionreport is None:
-            self.results = {}
-    
-            # process search results attributes
-            val = self._exml.find(util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsMatched')
-            self.results['matches'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsReturned')
-            self.results['returned'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('nextRecord')
-            if val is not None:
-                 self.results['nextrecord'] = int(util.testXMLValue(val, True))
-            else:
-                warnings.warn("""CSW Server did not supply a nextRecord value (it is optional), so the client
-                should page through the results in another way.""")
-                # For more info, see:
-                # https://github.com/geopython/OWSLib/issues/100
-                self.results['nextrecord'] = None
+            self._parsesearchresults(self._exml.find(util.nspath_eval('csw:SearchResults', namespaces)))
 
             # process list of matching records
             self.records = OrderedDict()
 
             self._parserecords(outputschema, esn)
 
+    def iterrecords(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary', outputschema=namespaces['csw'], format=outputformat, startposition=0, maxrecords=None, cql=None, pagesize=100, workers=4, ordered=True):
+        """
+
+        Iterate over the records of a GetRecords query, across all pages
+
+        The first page is requested, and its numberOfRecordsMatched used
+        to request the following pages concurrently, at most 2 * workers
+        pages ahead of the consumer.  Pages returning fewer records than
+        requested, as capped by the server, are completed by further
+        requests.  Yields (identifier, record) tuples, as in self.records,
+        which is left untouched.
+
+        Parameters
+        ----------
+
+        - constraints, sortby, typenames, esn, outputschema, format, cql: as in getrecords2
+        - startposition: the position of the first record (default is 0, the first record)
+        - maxrecords: the maximum number of records to return (default is None, all of them)
+        - pagesize: the number of records requested per page (default is 100)
+        - workers: the number of pages requested concurrently (default is 4)
+        - ordered: whether records are yielded in the order of the result set (default), or as pages complete
+
+        Paging relies on the server returning records in a stable order,
+        which a sortby helps guarantee.
+
+        """
+
+        query = dict(constraints=constraints, sortby=sortby, typenames=typenames, esn=esn,
+                     outputschema=outputschema, format=format, cql=cql)
+        first = max(1, startposition)
+
+        def fetch(position, size):
+            records = []
+            while len(records) < size:
+                # a copy of the service, so that pages are requested
+                # concurrently without replacing self.records
+                csw = copy.copy(self)
+                csw.getrecords2(startposition=position + len(records),
+                                maxrecords=size - len(records), **query)
+                if not csw.records:
+                    break
+                records.extend(csw.records.items())
+            return records, csw.results['matches']
+
+        size = pagesize if maxrecords is None else min(pagesize, maxrecords)
+        if size <= 0:
+            return
+        records, matches = fetch(first, size)
+        for record in records:
+            yield record
+        last = first + matches - 1
+        if maxrecords is not None:
+            last = min(last, first + maxrecords - 1)
+        pages = [(position, min(pagesize, last - position + 1))
+                 for position in range(first + size, last + 1, pagesize)]
+        for records, matches in util.threaded_map(lambda page: fetch(*page), pages, workers,
+                                                  ordered=ordered, prefetch=2 * workers):
+            for record in records:
+                yield record
+
     def transaction(self, ttype=None, typename='csw:Record', record=None, propertyname=None, propertyvalue=None, bbox=None, keywords=[], cql=None, identifier=None):
         """
 
@@ -529,27 +587,100 @@ class CatalogueServiceWeb(object):
             for j in i.findall(util.nspath_eval('csw:BriefRecord/dc:identifier', namespaces)):
                 self.results['insertresults'].append(util.testXMLValue(j))
 
+    def _parsesearchresults(self, elem):
+        self.results = {}
+
+        # process search results attributes
+        val = elem.attrib.get('numberOfRecordsMatched')
+        self.results['matches'] = int(util.testXMLValue(val, True))
+        val = elem.attrib.get('numberOfRecordsReturned')
+        self.results['returned'] = int(util.testXMLValue(val, True))
+        val = elem.attrib.get('nextRecord')
+        if val is not None:
+             self.results['nextrecord'] = int(util.testXMLValue(val, True))
+        else:
+            warnings.warn("""CSW Server did not supply a nextRecord value (it is optional), so the client
+            should page through the results in another way.""")
+            # For more info, see:
+            # https://github.com/geopython/OWSLib/issues/100
+            self.results['nextrecord'] = None
+
     def _parserecords(self, outputschema, esn):
         if outputschema == namespaces['gmd']: # iso 19139
-            for i in self._exml.findall('.//'+util.nspath_eval('gmd:MD_Metadata', namespaces)) or self._exml.findall('.//'+util.nspath_eval('gmi:MI_Metadata', namespaces)):
-                val = i.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
-                identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = MD_Metadata(i)
+            elems = self._exml.findall('.//'+util.nspath_eval('gmd:MD_Metadata', namespaces)) or self._exml.findall('.//'+util.nspath_eval('gmi:MI_Metadata', namespaces))
+        else:
+            elems = self._exml.findall('.//'+self._setrecordtags(outputschema, esn)[0])
+        for i in elems:
+            identifier, record = self._parserecord(i, outputschema)
+            self.records[identifier] = record
+
+    def _parserecord(self, elem, outputschema):
+        """ Return the identifier and record of a record element """
+        if outputschema == namespaces['gmd']: # iso 19139
+            val = _paths.find(elem, 'gmd:fileIdentifier/gco:CharacterString')
+            record = MD_Metadata(elem)
         elif outputschema == namespaces['fgdc']: # fgdc csdgm
-            for i in self._exml.findall('.//metadata'):
-                val = i.find('idinfo/datasetid')
-                identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = Metadata(i)
+            val = _paths.find(elem, 'idinfo/datasetid')
+            record = Metadata(elem)
         elif outputschema == namespaces['dif']: # nasa dif
-            for i in self._exml.findall('.//'+util.nspath_eval('dif:DIF', namespaces)):
-                val = i.find(util.nspath_eval('dif:Entry_ID', namespaces))
-                identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = DIF(i)
+            val = _paths.find(elem, 'dif:Entry_ID')
+            record = DIF(elem)
         else: # process default
-            for i in self._exml.findall('.//'+util.nspath_eval('csw:%s' % self._setesnel(esn), namespaces)):
-                val = i.find(util.nspath_eval('dc:identifier', namespaces))
-                identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = CswRecord(i)
+            val = _paths.find(elem, 'dc:identifier')
+            record = CswRecord(elem)
+        return self._setidentifierkey(util.testXMLValue(val)), record
+
+    def _setrecordtags(self, outputschema, esn):
+        """ Set the record element names to parse depending on the outputSchema and ElementSetName """
+        if outputschema == namespaces['gmd']: # iso 19139
+            return [util.nspath_eval('gmd:MD_Metadata', namespaces), util.nspath_eval('gmi:MI_Metadata', namespaces)]
+        elif outputschema == namespaces['fgdc']: # fgdc csdgm
+            return ['metadata']
+        elif outputschema == namespaces['dif']: # nasa dif
+            return [util.nspath_eval('dif:DIF', namespaces)]
+        return [util.nspath_eval('csw:%s' % self._setesnel(esn), namespaces)]
+
+    def _streamrecords(self, outputschema, esn):
+        """ Parse the search results of the streamed response, and return an
+        iterator parsing its records one at a time, as they are read """
+        events = etree.iterparse(self.response, events=('start', 'end'))
+        searchresults = util.nspath_eval('csw:SearchResults', namespaces)
+        event, elem = next(events)
+        if elem.tag == util.nspath_eval('ows:ExceptionReport', namespaces):
+            for event, _ in events:  # reports are parsed whole
+                pass
+            self._exml = etree.ElementTree(elem)
+            raise ows.ExceptionReport(self._exml, self.owscommon.namespace)
+        if elem.tag != util.nspath_eval('csw:GetRecordsResponse', namespaces):
+            raise RuntimeError('Document is XML, but not CSW-ish')
+        for event, elem in events:
+            if event == 'start' and elem.tag == searchresults:
+                break
+        if elem.tag != searchresults:
+            raise RuntimeError('GetRecords response without csw:SearchResults')
+
+        self.exceptionreport = None
+        self._parsesearchresults(elem)
+        self.records = OrderedDict()
+        return self._iterrecords(events, elem, self._setrecordtags(outputschema, esn), outputschema)
+
+    def _iterrecords(self, events, parent, tags, outputschema):
+        depth = 0
+        for event, elem in events:
+            if event == 'start':
+                depth += 1
+                continue
+            if depth == 0:  # end of csw:SearchResults
+                break
+            depth -= 1
+            if depth == 0:
+                parent.remove(elem)
+                if elem.tag in tags:
+                    # records parse their fields lazily, from the element
+                    # now only referenced by them
+                    yield self._parserecord(elem, outputschema)
+                else:
+                    elem.clear()
 
     def _parsetransactionsummary(self):
         val = self._exml.find(util.nspath_eval('csw:TransactionSummary', namespaces))
@@ -600,8 +731,8 @@ class CatalogueServiceWeb(object):
                 flt = fes.FilterRequest()
                 node0.append(flt.set(qtype=qtype, keywords=keywords, propertyname=propertyname,bbox=bbox))
     
-    def _invoke(self):
-        # do HTTP request
+    def _invoke(self, parse=True, stream=False):
+        # do HTTP request, the response being left unread when streamed
 
         request_url = self.url
 
@@ -638,7 +769,9 @@ class CatalogueServiceWeb(object):
 
         if isinstance(self.request, six.string_types):  # GET KVP
             self.request = '%s%s' % (bind_url(request_url), self.request)
-            self.response = openURL(self.request, None, 'Get', username=self.username, password=self.password, timeout=self.timeout).read()
+            self.response = openURL(self.request, None, 'Get', username=self.username, password=self.password, timeout=self.timeout, stream=stream)
+            if not stream:
+                self.response = self.response.read()
         else:
             self.request = cleanup_namespaces(self.request)
             # Add any namespaces used in the "typeNames" attribute of the
@@ -653,7 +786,10 @@ class CatalogueServiceWeb(object):
 
             self.request = util.element_to_string(self.request, encoding='utf-8')
 
-            self.response = util.http_post(request_url, self.request, self.lang, self.timeout, self.username, self.password)
+            self.response = util.http_post(request_url, self.request, self.lang, self.timeout, self.username, self.password, stream=stream)
+
+        if not parse:  # parsed by the caller
+            return
 
         # parse result see if it's XML
         self._exml = etree.parse(BytesIO(self.response))
@@ -685,132 +821,307 @@ class CswRecord(object):
     def __init__(self, record):
 
         if hasattr(record, 'getroot'):  # standalone document
-            self.xml = etree.tostring(record.getroot())
-        else:  # part of a larger document
-            self.xml = etree.tostring(record)
+            record = record.getroot()
+        self._elem = record
 
         # check to see if Dublin Core record comes from
         # rdf:RDF/rdf:Description container
         # (child content model is identical)
         self.rdf = False
-        rdf = record.find(util.nspath_eval('rdf:Description', namespaces))
+        rdf = _paths.find(record, 'rdf:Description')
         if rdf is not None:
             self.rdf = True
             record = rdf
-
-        # some CSWs return records with multiple identifiers based on 
-        # different schemes.  Use the first dc:identifier value to set
-        # self.identifier, and set self.identifiers as a list of dicts
-        val = record.find(util.nspath_eval('dc:identifier', namespaces))
-        self.identifier = util.testXMLValue(val)
-
-        self.identifiers = []
-        for i in record.findall(util.nspath_eval('dc:identifier', namespaces)):
+        # fields are parsed from the element on first access
+        self._record = record
+
+    def __getstate__(self):
+        return util.resolved_state(self, '_elem', '_record')
+
+    @util.cached_property
+    def xml(self):
+        return etree.tostring(self._elem)
+
+    # some CSWs return records with multiple identifiers based on 
+    # different schemes.  Use the first dc:identifier value to set
+    # self.identifier, and set self.identifiers as a list of dicts
+    @util.cached_property
+    def identifier(self):
+        val = _paths.find(self._record, 'dc:identifier')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def identifiers(self):
+        identifiers = []
+        for i in _paths.findall(self._record, 'dc:identifier'):
             d = {}
             d['scheme'] = i.attrib.get('scheme')
             d['identifier'] = i.text
-            self.identifiers.append(d)
-
-        val = record.find(util.nspath_eval('dc:type', namespaces))
-        self.type = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dc:title', namespaces))
-        self.title = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dct:alternative', namespaces))
-        self.alternative = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dct:isPartOf', namespaces))
-        self.ispartof = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dct:abstract', namespaces))
-        self.abstract = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dc:date', namespaces))
-        self.date = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dct:created', namespaces))
-        self.created = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dct:issued', namespaces))
-        self.issued = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dc:relation', namespaces))
-        self.relation = util.testXMLValue(val)
-
-        val = record.find(util.nspath_eval('dct:temporal', namespaces))
-        self.temporal = util.testXMLValue(val)
-
-        self.uris = []  # list of dicts
-        for i in record.findall(util.nspath_eval('dc:URI', namespaces)):
+            identifiers.append(d)
+        return identifiers
+
+    @util.cached_property
+    def type(self):
+        val = _paths.find(self._record, 'dc:type')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def title(self):
+        val = _paths.find(self._record, 'dc:title')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def alternative(self):
+        val = _paths.find(self._record, 'dct:alternative')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def ispartof(self):
+        val = _paths.find(self._record, 'dct:isPartOf')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def abstract(self):
+        val = _paths.find(self._record, 'dct:abstract')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def date(self):
+        val = _paths.find(self._record, 'dc:date')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def created(self):
+        val = _paths.find(self._record, 'dct:created')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def issued(self):
+        val = _paths.find(self._record, 'dct:issued')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def relation(self):
+        val = _paths.find(self._record, 'dc:relation')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def temporal(self):
+        val = _paths.find(self._record, 'dct:temporal')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def uris(self):
+        uris = []  # list of dicts
+        for i in _paths.findall(self._record, 'dc:URI'):
             uri = {}
             uri['protocol'] = util.testXMLValue(i.attrib.get('protocol'), True)
             uri['name'] = util.testXMLValue(i.attrib.get('name'), True)
             uri['description'] = util.testXMLValue(i.attrib.get('description'), True)
             uri['url'] = util.testXMLValue(i)
 
-            self.uris.append(uri)
+            uris.append(uri)
+        return uris
 
-        self.references = []  # list of dicts
-        for i in record.findall(util.nspath_eval('dct:references', namespaces)):
+    @util.cached_property
+    def references(self):
+        references = []  # list of dicts
+        for i in _paths.findall(self._record, 'dct:references'):
             ref = {}
             ref['scheme'] = util.testXMLValue(i.attrib.get('scheme'), True)
             ref['url'] = util.testXMLValue(i)
 
-            self.references.append(ref)
+            references.append(ref)
+        return references
+
+    @util.cached_property
+    def modified(self):
+        val = _paths.find(self._record, 'dct:modified')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def creator(self):
+        val = _paths.find(self._record, 'dc:creator')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def publisher(self):
+        val = _paths.find(self._record, 'dc:publisher')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def coverage(self):
+        val = _paths.find(self._record, 'dc:coverage')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def contributor(self):
+        val = _paths.find(self._record, 'dc:contributor')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def language(self):
+        val = _paths.find(self._record, 'dc:language')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def source(self):
+        val = _paths.find(self._record, 'dc:source')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def rightsholder(self):
+        val = _paths.find(self._record, 'dct:rightsHolder')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def accessrights(self):
+        val = _paths.find(self._record, 'dct:accessRights')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def license(self):
+        val = _paths.find(self._record, 'dct:license')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def format(self):
+        val = _paths.find(self._record, 'dc:format')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def subjects(self):
+        subjects = []
+        for i in _paths.findall(self._record, 'dc:subject'):
+            subjects.append(util.testXMLValue(i))
+        return subjects
+
+    @util.cached_property
+    def rights(self):
+        rights = []
+        for i in _paths.findall(self._record, 'dc:rights'):
+            rights.append(util.testXMLValue(i))
+        return rights
+
+    @util.cached_property
+    def spatial(self):
+        val = _paths.find(self._record, 'dct:spatial')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def bbox(self):
+        val = _paths.find(self._record, 'ows:BoundingBox')
+        if val is not None:
+            return ows.BoundingBox(val, namespaces['ows'])
+        return None
 
-        val = record.find(util.nspath_eval('dct:modified', namespaces))
-        self.modified = util.testXMLValue(val)
+    @util.cached_property
+    def bbox_wgs84(self):
+        val = _paths.find(self._record, 'ows:WGS84BoundingBox')
+        if val is not None:
+            return ows.WGS84BoundingBox(val, namespaces['ows'])
+        return None
 
-        val = record.find(util.nspath_eval('dc:creator', namespaces))
-        self.creator = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:publisher', namespaces))
-        self.publisher = util.testXMLValue(val)
+class FederatedCatalogue(object):
+    """
 
-        val = record.find(util.nspath_eval('dc:coverage', namespaces))
-        self.coverage = util.testXMLValue(val)
+    Search several CatalogueServiceWeb instances at once
 
-        val = record.find(util.nspath_eval('dc:contributor', namespaces))
-        self.contributor = util.testXMLValue(val)
+    Parameters
+    ----------
 
-        val = record.find(util.nspath_eval('dc:language', namespaces))
-        self.language = util.testXMLValue(val)
+    - services: the CatalogueServiceWeb instances to search
+    - timeout: the time in seconds each service is given to answer, for all of them or as a dict by
+      URL, services without one being given their own timeout (default is None)
 
-        val = record.find(util.nspath_eval('dc:source', namespaces))
-        self.source = util.testXMLValue(val)
+    """
 
-        val = record.find(util.nspath_eval('dct:rightsHolder', namespaces))
-        self.rightsholder = util.testXMLValue(val)
+    def __init__(self, services, timeout=None):
+        self.services = list(services)
+        self.timeout = timeout
+        self.sources = OrderedDict()
+        self.errors = OrderedDict()
 
-        val = record.find(util.nspath_eval('dct:accessRights', namespaces))
-        self.accessrights = util.testXMLValue(val)
+    def _gettimeout(self, service):
+        """ Return the time in seconds a service is given to answer """
+        timeout = self.timeout
+        if isinstance(timeout, dict):
+            timeout = timeout.get(service.url)
+        return service.timeout if timeout is None else timeout
 
-        val = record.find(util.nspath_eval('dct:license', namespaces))
-        self.license = util.testXMLValue(val)
+    def getrecords2(self, **kwargs):
+        """
 
-        val = record.find(util.nspath_eval('dc:format', namespaces))
-        self.format = util.testXMLValue(val)
+        Send a GetRecords request to every service concurrently, yielding
+        (identifier, record, service) tuples as services answer, so that
+        the search takes as long as the slowest service answering
 
-        self.subjects = []
-        for i in record.findall(util.nspath_eval('dc:subject', namespaces)):
-            self.subjects.append(util.testXMLValue(i))
+        Records found by several services are yielded once, from the first
+        service answering, and the URLs of all the services holding them
+        are kept in self.sources, by identifier.  Services failing, or not
+        answering within their timeout, are left out and their error kept
+        in self.errors, by URL; their requests are abandoned.  The timeout
+        of a service applies to its request, and counts from it, whatever
+        the time spent on the records yielded meanwhile.
 
-        self.rights = []
-        for i in record.findall(util.nspath_eval('dc:rights', namespaces)):
-            self.rights.append(util.testXMLValue(i))
+        Parameters
+        ----------
 
-        val = record.find(util.nspath_eval('dct:spatial', namespaces))
-        self.spatial = util.testXMLValue(val)
+        - kwargs: the parameters of CatalogueServiceWeb.getrecords2, such as
+          constraints, esn, outputschema or maxrecords
 
-        val = record.find(util.nspath_eval('ows:BoundingBox', namespaces))
-        if val is not None:
-            self.bbox = ows.BoundingBox(val, namespaces['ows'])
-        else:
-            self.bbox = None
+        """
 
-        val = record.find(util.nspath_eval('ows:WGS84BoundingBox', namespaces))
-        if val is not None:
-            self.bbox_wgs84 = ows.WGS84BoundingBox(val, namespaces['ows'])
-        else:
-            self.bbox_wgs84 = None
+        self.sources = OrderedDict()
+        self.errors = OrderedDict()
+        answers = six.moves.queue.Queue()
+        timeouts = [self._gettimeout(service) for service in self.services]
+
+        def search(index, service):
+            # a copy of the service, so that its records are left untouched
+            csw = copy.copy(service)
+            csw.timeout = timeouts[index]
+            try:
+                csw.getrecords2(**kwargs)
+                answers.put((index, csw.records, None, time.time()))
+            except Exception as err:
+                answers.put((index, None, err, time.time()))
+
+        # daemon threads rather than a pool, so that requests of services
+        # not answering in time are abandoned rather than waited for
+        deadlines = []
+        for index, service in enumerate(self.services):
+            thread = threading.Thread(target=search, args=(index, service))
+            thread.daemon = True
+            deadlines.append(time.time() + timeouts[index])
+            thread.start()
+
+        pending = set(range(len(self.services)))
+        answered = set()
+        while pending:
+            try:
+                index, records, error, when = answers.get(
+                    timeout=max(0, min(deadlines[i] for i in pending) - time.time()))
+            except six.moves.queue.Empty:
+                # services past their deadline are not waited for anymore
+                pending = set(i for i in pending if deadlines[i] > time.time())
+                continue
+            pending.discard(index)
+            if when > deadlines[index]:  # answered too late
+                continue
+            answered.add(index)
+            service = self.services[index]
+            if error is not None:
+                self.errors[service.url] = error
+                continue
+            for identifier, record in records.items():
+                if identifier in self.sources:
+                    self.sources[identifier].append(service.url)
+                    continue
+                self.sources[identifier] = [service.url]
+                yield identifier, record, service
+
+        for index, service in enumerate(self.services):
+            if index not in answered:
+                self.errors[service.url] = RuntimeError('No answer within %s seconds' % timeouts[index])
@@ -8,17 +8,44 @@
 from __future__ import (absolute_import, division, print_function)
 
 from owslib.crs import Crs
+from owslib.etree import etree
+from owslib.namespaces import Namespaces
 
 try:
-    from urllib import urlencode
+    from urllib import urlencode, quote
 except ImportError:
-    from urllib.parse import urlencode
+    from urllib.parse import urlencode, quote
 import logging
-from owslib.util import log
+import math
+import time
+import requests
+from multiprocessing.pool import ThreadPool
+import six
+from six.moves import queue
+from owslib.util import log, threaded_map, OrderedDict, nspath_eval, element_to_string, openURL, ServiceException
+from owslib.feature import gml, schema, columnar
+
+class TransactionError(ServiceException):
+    """A chunk of `insertfeatures` failed after others were committed.
+
+    results holds one item per chunk sent, in order: the dict of a
+    committed chunk, or the exception of a failed one.  error is the
+    first failure.
+    """
+
+    def __init__(self, error, results):
+        ServiceException.__init__(self, str(error))
+        self.error = error
+        self.results = results
+
 
 class WebFeatureService_(object):
     """Base class for WebFeatureService implementations"""
 
+    #: seconds for which the numbers of features returned by `count` are
+    #: cached, 0 to disable the cache
+    countttl = 300
+
     def getBBOXKVP (self,bbox,typename):
         """Formate bounding box for KVP request type (HTTP GET)
 
@@ -57,6 +84,442 @@ class WebFeatureService_(object):
             return "%s,%s,%s,%s,%s" % \
                     (bbox[0],bbox[1],bbox[2],bbox[3],srs.getcode())
 
+    def tiledfeatures(self, typename=None, bbox=None, maxfeatures=1000,
+                      grid=(2, 2), maxdepth=8, workers=4, **kwargs):
+        """Iterate over the features within a large bounding box, requested
+        cell by cell.
+
+        bbox is split into a grid of cells, each requested with a
+        GetFeature request limited to maxfeatures features.  A cell whose
+        request returns maxfeatures features may have been truncated by
+        the server, so it is split into four quadrants, which are
+        requested instead, until maxdepth subdivisions.  Up to `workers`
+        requests are sent concurrently.  Features straddling cells are
+        yielded once, by gml:id, as owslib.feature.gml.Feature instances
+        in no particular order.
+
+        Parameters
+        ----------
+        typename : list
+            List of typenames (string)
+        bbox : tuple
+            (minx, miny, maxx, maxy[, srs]) in east, north order, encoded
+            for each cell by `getBBOXKVP`.
+        maxfeatures : int
+            Maximum number of features requested per cell, at most the
+            limit of the server.
+        grid : tuple
+            Number of (columns, rows) bbox is first split into.
+        maxdepth : int
+            Maximum number of times a cell is split.  Cells which still
+            reach maxfeatures at that depth are logged and kept.
+        workers : int
+            Number of requests sent concurrently.
+        **kwargs : extra arguments
+            other parameters of `getfeature`, such as propertyname
+        """
+        if bbox is None:
+            raise ValueError("bbox is mandatory (cannot be None)")
+        minx, miny, maxx, maxy = bbox[:4]
+        srs = tuple(bbox[4:])
+        columns, rows = grid
+        width, height = (maxx - minx) / columns, (maxy - miny) / rows
+        cells = [((minx + c * width, miny + r * height,
+                   minx + (c + 1) * width, miny + (r + 1) * height), 0)
+                 for r in range(rows) for c in range(columns)]
+
+        def fetch(cell):
+            try:
+                u = self._openGetFeature(typename=typename,
+                                         bbox=cell[0] + srs,
+                                         maxfeatures=maxfeatures, stream=True,
+                                         **kwargs)
+                return cell, list(gml.iterfeatures(u)), None
+            except Exception as err:
+                return cell, None, err
+
+        results = queue.Queue()
+        pool = ThreadPool(max(1, workers))
+        seen = set()
+        try:
+            for cell in cells:
+                pool.apply_async(fetch, (cell,), callback=results.put)
+            pending = len(cells)
+            while pending:
+                (box, depth), features, err = results.get()
+                pending -= 1
+                if err is not None:
+                    raise err
+                if len(features) >= maxfeatures:
+                    if depth < maxdepth:
+                        x0, y0, x1, y1 = box
+                        xm, ym = (x0 + x1) / 2.0, (y0 + y1) / 2.0
+                        for quadrant in ((x0, y0, xm, ym), (xm, y0, x1, ym),
+                                         (x0, ym, xm, y1), (xm, ym, x1, y1)):
+                            pool.apply_async(fetch, ((quadrant, depth + 1),),
+                                             callback=results.put)
+                        pending += 4
+                        continue
+                    log.warning('GetFeature bbox %s still returns %d features '
+                                'after %d subdivisions' % (box, len(features), depth))
+                for feature in features:
+                    if feature.id is not None:
+                        if feature.id in seen:
+                            continue
+                        seen.add(feature.id)
+                    yield feature
+        finally:
+            pool.terminate()
+
+    def featuresbyid(self, featureid, typename=None, maxurllength=2000,
+                     batchsize=None, workers=4, **kwargs):
+        """Iterate over features requested by id, batch by batch.
+
+        The featureid list is split into batches whose GetFeature URL
+        stays under maxurllength characters, which are requested
+        concurrently by up to `workers` requests.  Features are yielded
+        in the order of featureid as owslib.feature.gml.Feature
+        instances; ids matching no feature are skipped and requested ids
+        are only yielded once.
+
+        Parameters
+        ----------
+        featureid : list
+            List of unique feature ids (string)
+        typename : list
+            List of typenames (string)
+        maxurllength : int
+            Maximum length of the GetFeature URLs.
+        batchsize : int
+            Optional maximum number of ids per batch, for servers capping
+            the number of features returned.
+        workers : int
+            Number of requests sent concurrently.
+        **kwargs : extra arguments
+            other parameters of `getfeature`, such as propertyname
+        """
+        if typename and type(typename) == type(""):
+            typename = [typename]
+        featureid = list(OrderedDict.fromkeys(featureid))
+        # the URL of a request for no id, with the parameters sent
+        url, data = self._getFeatureKVP(typename=typename, featureid=[''], **kwargs)
+        base = len(requests.Request('GET', url, params=data).prepare().url)
+        batches, batch, length = [], [], base
+        for fid in featureid:
+            # the encoded id, and its encoded comma separator
+            size = len(quote(fid, safe='')) + (3 if batch else 0)
+            if batch and (length + size > maxurllength or len(batch) == batchsize):
+                batches.append(batch)
+                batch, length = [], base
+                size -= 3
+            batch.append(fid)
+            length += size
+        if batch:
+            batches.append(batch)
+        log.debug('GetFeature of %d ids in %d batches' % (len(featureid), len(batches)))
+
+        def fetch(batch):
+            u = self._openGetFeature(typename=typename, featureid=batch, stream=True, **kwargs)
+            return batch, list(gml.iterfeatures(u))
+
+        for batch, features in threaded_map(fetch, batches, workers,
+                                            prefetch=2 * workers):
+            found = OrderedDict((f.id, f) for f in features)
+            for fid in batch:
+                if fid in found:
+                    yield found.pop(fid)
+            # features whose id differs from the requested one
+            for feature in found.values():
+                yield feature
+
+    def count(self, typename=None, filter=None, bbox=None, featureid=None,
+              storedQueryID=None, storedQueryParams=None, ttl=None):
+        """Return the number of features matching a query, without
+        retrieving them.
+
+        A GetFeature request with resultType=hits is sent, and the
+        numberMatched (WFS 2.0) or numberOfFeatures (WFS 1.1) of the
+        response returned.  Returns None when the server does not report
+        the number of features, and with WFS 1.0, which has no hits.
+        Errors of the request, such as exception reports, are raised.
+
+        Numbers are cached per query for `ttl` seconds, countttl by
+        default; a ttl of 0 always sends the request.
+        """
+        if typename and type(typename) == type(""):
+            typename = [typename]
+        ttl = self.countttl if ttl is None else ttl
+        key = (tuple(typename or ()), filter, tuple(bbox or ()), tuple(featureid or ()),
+               storedQueryID, tuple(sorted((storedQueryParams or {}).items())))
+        counts = self._counts
+        now = time.time()
+        if ttl and key in counts and now - counts[key][0] < ttl:
+            return counts[key][1]
+        hits = self._getHits(typename=typename, filter=filter, bbox=bbox,
+                             featureid=featureid, storedQueryID=storedQueryID,
+                             storedQueryParams=storedQueryParams)
+        if hits is not None:
+            counts[key] = (now, hits)
+        return hits
+
+    def _getHits(self, **kwargs):
+        """Return the number of features matching a query, or None when
+        the server does not report it"""
+        return None
+
+    def planfeatures(self, typename=None, filter=None, bbox=None,
+                     featureid=None, storedQueryID=None,
+                     storedQueryParams=None, startindex=0, maxfeatures=None,
+                     minpagesize=100, maxpagesize=5000, maxworkers=8,
+                     ttl=None):
+        """Plan the paged retrieval of the features matching a query.
+
+        The number of features, from `count`, is split into pages of
+        minpagesize to maxpagesize features, as few as keep up to
+        maxworkers requests busy.  Returns a dict of:
+
+        hits : int
+            Number of matching features, or None when unknown.
+        features : int
+            Number of features to retrieve, or None when unknown.
+        pagesize : int
+            Number of features to request per page.
+        pages : int
+            Number of pages, or None when unknown.
+        workers : int
+            Number of pages to request concurrently.
+
+        The pagesize and workers are those of `pagedfeatures`.  When the
+        number of features is unknown, pages of maxpagesize features are
+        planned, requested one after the other.
+        """
+        hits = self.count(typename=typename, filter=filter, bbox=bbox,
+                          featureid=featureid, storedQueryID=storedQueryID,
+                          storedQueryParams=storedQueryParams, ttl=ttl)
+        return self._plan(hits, startindex, maxfeatures, minpagesize,
+                          maxpagesize, maxworkers)
+
+    def _plan(self, hits, startindex=0, maxfeatures=None, minpagesize=100,
+              maxpagesize=5000, maxworkers=8):
+        if hits is None:
+            return {'hits': None, 'features': None, 'pagesize': maxpagesize,
+                    'pages': None, 'workers': 1}
+        total = max(0, hits - (startindex or 0))
+        if maxfeatures is not None:
+            total = min(total, maxfeatures)
+        pagesize = int(math.ceil(total / float(max(1, maxworkers))))
+        pagesize = max(1, min(maxpagesize, max(minpagesize, pagesize)))
+        pages = int(math.ceil(total / float(pagesize)))
+        return {'hits': hits, 'features': total, 'pagesize': pagesize,
+                'pages': pages, 'workers': max(1, min(maxworkers, pages))}
+
+    def describefeaturetype(self, typename):
+        """Return the property kinds of a feature type.
+
+        The XML Schema returned by a DescribeFeatureType request is parsed
+        by owslib.feature.schema, once per typename and service, into an
+        OrderedDict of property names to kinds ('int', 'float', 'bool',
+        'date', 'datetime', 'geometry' or 'string').
+        """
+        schemas = self._schemas
+        if typename in schemas:
+            return schemas[typename]
+        try:
+            base_url = next((m.get('url') for m in self.getOperationByName('DescribeFeatureType').methods
+                             if m.get('type').lower() == 'get'))
+        except (AttributeError, KeyError, StopIteration):
+            base_url = self.url
+        request = {'service': 'WFS', 'version': self.version, 'request': 'DescribeFeatureType',
+                   'typeNames' if self.version.startswith('2') else 'typeName': typename}
+        data = urlencode(request)
+        log.debug('DescribeFeatureType %s?%s' % (base_url, data))
+        u = openURL(base_url, data, 'Get', username=self.username, password=self.password, timeout=self.timeout)
+        parsed = schema.parse(etree.fromstring(u.read()))
+        name = typename.split(':')[-1]
+        if name in parsed:
+            properties = parsed[name]
+        elif len(parsed) == 1:
+            properties = list(parsed.values())[0]
+        else:
+            raise ValueError('No feature type %s in the DescribeFeatureType schema' % typename)
+        schemas[typename] = properties
+        return properties
+
+    def _geometryname(self, typename):
+        """Return the name of the first geometry property of a feature
+        type, after its DescribeFeatureType schema"""
+        for name, kind in self.describefeaturetype(typename).items():
+            if kind == 'geometry':
+                return name
+        raise ValueError('No geometry property in the schema of %s' % typename)
+
+    def featuretable(self, typename=None, **kwargs):
+        """Request feature data and decode it into NumPy columns.
+
+        Takes the parameters of `getfeature`, and returns an
+        owslib.feature.columnar.FeatureTable whose property columns are
+        typed after the `describefeaturetype` schema of the typenames.
+        """
+        if typename and type(typename) == type(""):
+            typename = [typename]
+        kinds = {}
+        for name in typename or []:
+            kinds.update(self.describefeaturetype(name))
+        u = self._openGetFeature(typename=typename, stream=True, **kwargs)
+        return columnar.decode(u, schema=kinds)
+
+    def insertfeatures(self, features, typename=None, namespace=None,
+                       geometryname='geometry', srsname=None, chunksize=1000,
+                       workers=2):
+        """Insert features with WFS Transaction requests, chunk by chunk.
+
+        features are consumed lazily and encoded into wfs:Transaction
+        documents of a wfs:Insert of up to chunksize features each, which
+        are POSTed by up to `workers` concurrent requests.  Only the
+        chunks being built or sent are held in memory.
+
+        Once a chunk fails, or a feature cannot be encoded, no further
+        chunk is sent and those being sent are completed.  A
+        TransactionError then carries the results of every chunk sent,
+        unless none was committed, in which case the failure is raised
+        as is.
+
+        Parameters
+        ----------
+        features : iterable
+            Features as XML strings or elements, owslib.feature.gml.Feature
+            instances, or GeoJSON like feature dicts.
+        typename : string
+            Typename of the GeoJSON features, as 'prefix:name' or in Clark
+            notation, '{namespace}name'.
+        namespace : string
+            Namespace URI of a prefixed typename.
+        geometryname : string
+            Name of the geometry property of the GeoJSON features.
+        srsname : string
+            srsName of the geometries.
+        chunksize : int
+            Maximum number of features per Transaction request.
+        workers : int
+            Number of requests sent concurrently.
+
+        Returns a list of one dict per chunk, of the 'inserted', 'updated'
+        and 'deleted' counts reported by the server and the 'ids' of the
+        new features.
+        """
+        n = Namespaces()
+        wfsns = n.get_namespace('wfs20' if self.version.startswith('2') else 'wfs')
+        gmlversion = {'1.0.0': '2', '1.1.0': '3.1'}.get(self.version, '3.2')
+        if srsname is not None and self.version != '1.0.0':
+            header = '<wfs:Insert srsName="%s">' % srsname
+        else:
+            header = '<wfs:Insert>'
+        header = ('<wfs:Transaction xmlns:wfs="%s" service="WFS" version="%s">%s'
+                  % (wfsns, self.version, header)).encode('utf-8')
+        footer = b'</wfs:Insert></wfs:Transaction>'
+        try:
+            url = next((m.get('url') for m in self.getOperationByName('Transaction').methods
+                        if m.get('type').lower() == 'post'))
+        except (KeyError, StopIteration):
+            url = self.url
+
+        failures = []
+
+        def bodies():
+            chunk = []
+            for index, feature in enumerate(features):
+                if failures:
+                    return
+                try:
+                    chunk.append(self._encodeFeature(feature, index, typename, namespace,
+                                                     geometryname, srsname, gmlversion))
+                except Exception as err:
+                    failures.append(err)
+                    return
+                if len(chunk) == chunksize:
+                    yield b''.join([header] + chunk + [footer])
+                    chunk = []
+            if chunk and not failures:
+                yield b''.join([header] + chunk + [footer])
+
+        def post(body):
+            if failures:  # built before the failure, not sent
+                return None
+            try:
+                u = openURL(url, body, 'Post', username=self.username, password=self.password, timeout=self.timeout)
+                return self._parseTransactionResponse(u.read())
+            except Exception as err:
+                failures.append(err)
+                return err
+
+        results = [r for r in threaded_map(post, bodies(), workers, prefetch=workers)
+                   if r is not None]
+        if failures:
+            if not any(isinstance(r, dict) for r in results):
+                raise failures[0]
+            raise TransactionError(failures[0], results)
+        log.debug('Transaction inserted %d features in %d chunks'
+                  % (sum(r['inserted'] or 0 for r in results), len(results)))
+        return results
+
+    def _encodeFeature(self, feature, index, typename, namespace, geometryname,
+                       srsname, gmlversion):
+        """Serialize a feature to insert"""
+        if isinstance(feature, (six.binary_type, six.text_type)):
+            return etree.tostring(etree.fromstring(feature))
+        if hasattr(feature, 'tag'):
+            return etree.tostring(feature)
+        if isinstance(feature, gml.Feature):
+            tag, properties, geometry = feature.typename, feature.properties, feature.geometry
+            geometryname = feature.geometryname or geometryname
+            srsname = feature.srsname or srsname
+        else:
+            tag, properties, geometry = typename, feature.get('properties') or {}, feature.get('geometry')
+        if tag is None:
+            raise ValueError("typename is mandatory to insert GeoJSON features")
+        if not tag.startswith('{'):
+            if namespace is None:
+                raise ValueError("namespace is mandatory for typename %s" % tag)
+            tag = '{%s}%s' % (namespace, tag.split(':')[-1])
+        ns = tag[1:].split('}')[0]
+        elem = etree.Element(tag)
+        for name, value in properties.items():
+            if value is None:
+                continue
+            child = etree.SubElement(elem, '{%s}%s' % (ns, name))
+            if isinstance(value, dict):
+                child.append(gml.encode_geometry(value, gmlversion, srsname,
+                                                 'owslib.%d.%s' % (index, name)))
+            elif isinstance(value, bool):
+                child.text = 'true' if value else 'false'
+            else:
+                child.text = six.text_type(value)
+        if geometry is not None:
+            etree.SubElement(elem, '{%s}%s' % (ns, geometryname)).append(
+                gml.encode_geometry(geometry, gmlversion, srsname, 'owslib.%d' % index))
+        return etree.tostring(elem)
+
+    def _parseTransactionResponse(self, data):
+        """Return the counts and new feature ids of a TransactionResponse"""
+        tree = etree.fromstring(data)
+        if tree.tag in gml._EXCEPTION_TAGS:
+            gml._raise_exception(tree)
+        result = {'inserted': None, 'updated': None, 'deleted': None, 'ids': []}
+        for elem in tree.iter():
+            name = gml._split(elem.tag)[1]
+            if name in ('totalInserted', 'totalUpdated', 'totalDeleted'):
+                result[name[5:].lower()] = int(elem.text)
+            elif name == 'FeatureId':
+                result['ids'].append(elem.get('fid'))
+            elif name == 'ResourceId':
+                result['ids'].append(elem.get('rid'))
+            elif name == 'FAILED':
+                # WFS 1.0.0 TransactionResult
+                gml._raise_exception(tree)
+        if result['inserted'] is None:
+            result['inserted'] = len(result['ids'])
+        return result
+
     def getSRS(self, srsname, typename):
         """Returns None or Crs object for given name
 
@@ -81,7 +544,7 @@ class WebFeatureService_(object):
 
     def getGETGetFeatureRequest(self, typename=None, filter=None, bbox=None, featureid=None,
                    featureversion=None, propertyname=None, maxfeatures=None,storedQueryID=None, storedQueryParams=None,
-                   outputFormat=None, method='Get', startindex=None):
+                   outputFormat=None, method='Get', startindex=None, resultType=None):
         """Formulate proper GetFeature request using KVP encoding
         ----------
         typename : list
@@ -104,6 +567,8 @@ class WebFeatureService_(object):
             Requested response format of the request.
         startindex: int (optional)
             Start position to return feature set (paging in combination with maxfeatures)
+        resultType: string (optional)
+            'results' (the default) or 'hits', to only count the matching features.
 
         There are 3 different modes of use
 
@@ -142,7 +607,112 @@ class WebFeatureService_(object):
                 request[param]=storedQueryParams[param]
         if outputFormat is not None:
             request["outputFormat"] = outputFormat
+        if resultType is not None:
+            request['resultType'] = resultType
 
         data = urlencode(request)
 
         return base_url+data
+
+    def getPOSTGetFeatureRequest(self, typename=None, filter=None, bbox=None, featureid=None,
+                   featureversion=None, propertyname=None, maxfeatures=None,storedQueryID=None, storedQueryParams=None,
+                   outputFormat=None, method='Post', startindex=None, resultType=None, srsname=None,
+                   geometryname=None):
+        """Formulate proper GetFeature request using XML encoding (HTTP POST)
+
+        Takes the parameters of `getGETGetFeatureRequest`, plus srsname,
+        and returns a (url, data) tuple, data being a wfs:GetFeature
+        document with one wfs:Query per typename, or a wfs:StoredQuery.
+        featureid, bbox or filter are encoded, in that order of
+        precedence, as the filter of the queries.
+
+        WFS 1.0.0 queries have no srsName, which is then left out, and
+        their bounding boxes compare a geometry property: geometryname, or
+        the first geometry property of the DescribeFeatureType schema.
+        """
+        n = Namespaces()
+        wfs2 = self.version.startswith('2')
+        namespaces = {
+            'wfs': n.get_namespace('wfs20' if wfs2 else 'wfs'),
+            'fes': n.get_namespace('fes' if wfs2 else 'ogc'),
+            'gml': n.get_namespace('gml32' if wfs2 else 'gml'),
+        }
+        try:
+            base_url = next((m.get('url') for m in self.getOperationByName('GetFeature').methods
+                             if m.get('type').lower() == method.split('}')[-1].lower()))
+        except StopIteration:
+            base_url = self.url
+
+        root = etree.Element(nspath_eval('wfs:GetFeature', namespaces),
+                             service='WFS', version=self.version)
+        if outputFormat is not None:
+            root.set('outputFormat', outputFormat)
+        if maxfeatures:
+            root.set('count' if wfs2 else 'maxFeatures', str(maxfeatures))
+        if startindex:
+            root.set('startIndex', str(startindex))
+        if resultType is not None:
+            root.set('resultType', resultType)
+
+        if storedQueryID:
+            query = etree.SubElement(root, nspath_eval('wfs:StoredQuery', namespaces), id=str(storedQueryID))
+            for name, value in (storedQueryParams or {}).items():
+                etree.SubElement(query, nspath_eval('wfs:Parameter', namespaces), name=name).text = str(value)
+            return base_url, element_to_string(root, encoding='utf-8')
+
+        if not typename:
+            raise ValueError("typename is mandatory for POST GetFeature requests")
+        typename = [typename] if type(typename) == type("") else typename
+        if propertyname is not None and not isinstance(propertyname, list):
+            propertyname = [propertyname]
+        propertyname = [p for p in propertyname or [] if p != '*']
+
+        for name in typename:
+            query = etree.SubElement(root, nspath_eval('wfs:Query', namespaces))
+            query.set('typeNames' if wfs2 else 'typeName', name)
+            if srsname is not None and self.version != '1.0.0':
+                srs = self.getSRS(srsname, name)
+                query.set('srsName', srs.id if srs is not None else str(srsname))
+            if featureversion is not None and not wfs2:
+                query.set('featureVersion', str(featureversion))
+            # WFS 1.0.0 takes ogc:PropertyName, later versions wfs:PropertyName
+            prefix = 'fes' if self.version == '1.0.0' else 'wfs'
+            for pname in propertyname:
+                etree.SubElement(query, nspath_eval('%s:PropertyName' % prefix, namespaces)).text = pname
+            if featureid:
+                node = etree.SubElement(query, nspath_eval('fes:Filter', namespaces))
+                for fid in featureid:
+                    if wfs2:
+                        etree.SubElement(node, nspath_eval('fes:ResourceId', namespaces), rid=fid)
+                    elif self.version == '1.0.0':
+                        etree.SubElement(node, nspath_eval('fes:FeatureId', namespaces), fid=fid)
+                    else:
+                        etree.SubElement(node, nspath_eval('fes:GmlObjectId', namespaces)).set(
+                            nspath_eval('gml:id', namespaces), fid)
+            elif bbox:
+                node = etree.SubElement(query, nspath_eval('fes:Filter', namespaces))
+                node = etree.SubElement(node, nspath_eval('fes:BBOX', namespaces))
+                if self.version == '1.0.0':  # mandatory in Filter 1.0
+                    etree.SubElement(node, nspath_eval('fes:PropertyName', namespaces)).text = \
+                        geometryname or self._geometryname(name)
+                # reuse the KVP encoding for the axis order and srs
+                values = self.getBBOXKVP(bbox, [name]).split(',')
+                corners = (' '.join(values[0:2]), ' '.join(values[2:4]))
+                srs = ','.join(values[4:])
+                if self.version == '1.0.0':
+                    box = etree.SubElement(node, nspath_eval('gml:Box', namespaces), srsName=srs)
+                    etree.SubElement(box, nspath_eval('gml:coordinates', namespaces)).text = \
+                        '%s,%s %s,%s' % tuple(values[:4])
+                else:
+                    box = etree.SubElement(node, nspath_eval('gml:Envelope', namespaces), srsName=srs)
+                    etree.SubElement(box, nspath_eval('gml:lowerCorner', namespaces)).text = corners[0]
+                    etree.SubElement(box, nspath_eval('gml:upperCorner', namespaces)).text = corners[1]
+            elif filter:
+                node = etree.fromstring(str(filter))
+                if node.tag.split('}')[-1] != 'Filter':
+                    parent = etree.Element(nspath_eval('fes:Filter', namespaces))
+                    parent.append(node)
+                    node = parent
+                query.append(node)
+
+        return base_url, element_to_string(root, encoding='utf-8')
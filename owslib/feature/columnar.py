@@ -0,0 +1,286 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+"""
+Columnar decoding of GML feature collections into NumPy arrays.
+
+Rather than building Python objects for every coordinate, the coordinates
+of all features are gathered into one contiguous float64 array, with
+three levels of offset arrays locating the parts of each feature, the
+rings of each part and the coordinates of each ring.  A point is one
+part of one ring of one coordinate, a line string one part of one ring,
+a polygon one part of several rings and multi geometries several parts.
+gml:posList, gml:pos and gml:coordinates are parsed in bulk by NumPy.
+
+Property values are gathered into one array per property: int64 or
+float64 when all the values are numbers, bool for xsd:boolean values,
+otherwise an object array of strings.  Missing numbers are NaN, which
+makes an integer column float64.  Given the property kinds of a
+DescribeFeatureType schema (owslib.feature.schema), columns are typed
+after the schema instead, dates and times becoming datetime64 columns
+with NaT for missing values.
+
+NumPy is required.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+from owslib.feature import gml, schema as fschema
+from owslib.util import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class FeatureTable(object):
+    """Features decoded into columns
+
+    Attributes
+    ----------
+    ids : array
+        The gml:id of each feature.
+    geometrytypes : array
+        The GeoJSON type of the geometry of each feature, or None.
+    coordinates : array
+        (n, dimension) float64 array of all the coordinates.  Positions of
+        lower dimension than others are padded with NaN.
+    featureoffsets, partoffsets, ringoffsets : array
+        int64 offsets, such that the parts of feature i are
+        featureoffsets[i]:featureoffsets[i + 1], the rings of part j are
+        partoffsets[j]:partoffsets[j + 1] and the coordinates of ring k
+        are ringoffsets[k]:ringoffsets[k + 1].
+    columns : OrderedDict
+        A typed array of values per property, keyed by local name.
+    srsname : string
+        The srsName of the first geometry.
+    """
+
+    def __init__(self, ids, geometrytypes, coordinates, featureoffsets,
+                 partoffsets, ringoffsets, columns, srsname=None):
+        self.ids = ids
+        self.geometrytypes = geometrytypes
+        self.coordinates = coordinates
+        self.featureoffsets = featureoffsets
+        self.partoffsets = partoffsets
+        self.ringoffsets = ringoffsets
+        self.columns = columns
+        self.srsname = srsname
+
+    def __len__(self):
+        return len(self.ids)
+
+    def geometry(self, index):
+        """Return the parts of a feature, as lists of ring coordinate views"""
+        parts = []
+        for part in range(self.featureoffsets[index], self.featureoffsets[index + 1]):
+            parts.append([self.coordinates[self.ringoffsets[ring]:self.ringoffsets[ring + 1]]
+                          for ring in range(self.partoffsets[part], self.partoffsets[part + 1])])
+        return parts
+
+
+def _array(elem, dim):
+    """Parse a GML coordinate element into an (n, dimension) array"""
+    name = gml._split(elem.tag)[1]
+    if name == 'posList':
+        size = int(elem.get('srsDimension', elem.get('dimension', dim)))
+        return np.fromstring(elem.text, dtype=np.float64, sep=' ').reshape(-1, size)
+    if name == 'coordinates':
+        text = elem.text.strip()
+        decimal = elem.get('decimal', '.')
+        cs, ts = elem.get('cs', ','), elem.get('ts', ' ')
+        first = text.split(None, 1) if ts.isspace() else text.split(ts, 1)
+        size = first[0].count(cs) + 1
+        if decimal != '.':
+            text = text.replace(decimal, '.')
+        text = text.replace(cs, ' ').replace(ts, ' ')
+        return np.fromstring(text, dtype=np.float64, sep=' ').reshape(-1, size)
+    if name == 'coord':
+        return np.array([[float(c.text) for c in elem]])
+    # pos, lowerCorner, upperCorner
+    return np.fromstring(elem.text, dtype=np.float64, sep=' ').reshape(1, -1)
+
+
+_COORDINATE_NAMES = frozenset(['pos', 'posList', 'coordinates', 'coord',
+                               'lowerCorner', 'upperCorner'])
+
+
+def _ring(elem, dim):
+    arrays = [_array(child, dim) for child in elem.iter()
+              if gml._split(child.tag)[1] in _COORDINATE_NAMES and
+              gml._split(child.tag)[0] in gml._GML_NAMESPACES]
+    if len(arrays) == 1:
+        return arrays[0]
+    if not arrays:
+        return np.empty((0, dim))
+    return np.concatenate(arrays)
+
+
+def _parts(elem, dim):
+    """Return the parts of a GML geometry, as lists of ring arrays"""
+    name = gml._split(elem.tag)[1]
+    dim = int(elem.get('srsDimension', dim))
+    kind = gml._GEOMETRY_TYPES[name]
+    if kind in ('Point', 'LineString'):
+        return [[_ring(elem, dim)]]
+    if name in ('Box', 'Envelope'):
+        (x0, y0), (x1, y1) = _ring(elem, dim)[:2, :2]
+        return [[np.array([(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)])]]
+    if kind == 'Polygon':
+        exterior, interiors = None, []
+        for child in elem.iter():
+            childname = gml._split(child.tag)[1]
+            if childname in gml._EXTERIOR:
+                exterior = _ring(child, dim)
+            elif childname in gml._INTERIOR:
+                interiors.append(_ring(child, dim))
+        return [[exterior] + interiors]
+    parts = []
+    for member in elem:
+        if gml._split(member.tag)[1].endswith(('Member', 'Members')):
+            for child in member:
+                if gml.geometry_type(child) is not None:
+                    parts.extend(_parts(child, dim))
+    return parts
+
+
+def _infer(values):
+    """Return the array of a column of text values, typed after them"""
+    present = [v for v in values if v is not None]
+    if not present:
+        return np.array(values, dtype=object)
+    missing = len(present) < len(values)
+    text = np.array(present)
+    if not missing:
+        try:
+            return text.astype(np.int64)
+        except (ValueError, OverflowError):
+            pass
+    try:
+        numbers = text.astype(np.float64)
+    except ValueError:
+        pass
+    else:
+        if not missing:
+            return numbers
+        column = np.full(len(values), np.nan)
+        column[[v is not None for v in values]] = numbers
+        return column
+    if not missing and set(present) <= set(['true', 'false']):
+        return text == 'true'
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _typed(values, kind):
+    """Return the array of a column of text values of a schema kind"""
+    present = [v for v in values if v is not None]
+    missing = len(present) < len(values)
+    if kind == 'int' and not missing:
+        return np.array(present).astype(np.int64)
+    if kind in ('int', 'float'):
+        column = np.full(len(values), np.nan)
+        if present:
+            column[[v is not None for v in values]] = np.array(present).astype(np.float64)
+        return column
+    if kind == 'bool' and not missing:
+        return np.array([v in ('true', '1') for v in present])
+    if kind == 'date':
+        return np.array([v[:10] if v is not None else 'NaT' for v in values],
+                        dtype='datetime64[D]')
+    if kind == 'datetime':
+        text = [v[:-1] if v is not None and v.endswith('Z') else v for v in values]
+        if any(v is not None and len(v) > 19 and v[-6] in '+-' for v in text):
+            # UTC offsets, not parsed by NumPy
+            return np.array([fschema.convert(v, kind) if v is not None else None
+                             for v in values], dtype='datetime64[us]')
+        return np.array([v if v is not None else 'NaT' for v in text],
+                        dtype='datetime64[us]')
+    column = np.empty(len(values), dtype=object)
+    column[:] = [fschema.convert(v, kind) for v in values]
+    return column
+
+
+def _column(values, kind=None):
+    """Return the typed array of a column of text values"""
+    if kind is not None:
+        try:
+            return _typed(values, kind)
+        except ValueError:
+            # values not matching the schema, inferred instead
+            pass
+    return _infer(values)
+
+
+def decode(source, schema=None):
+    """Decode a GML feature collection into a FeatureTable
+
+    source is a filename or a file-like object, such as the response of a
+    WFS GetFeature request.  It is parsed incrementally, so only the
+    resulting arrays are held in memory.  Only the first geometry
+    property of each feature is decoded.
+
+    schema is an optional mapping of property names to kinds, as parsed
+    by owslib.feature.schema, typing the columns.  Columns whose values do
+    not match their kind, or without a kind, are typed after their
+    values.
+
+    Raises ServiceException when source is an OGC or OWS exception report.
+    """
+    if np is None:
+        raise RuntimeError('NumPy is required to decode features into columns')
+    ids, types, rings = [], [], []
+    featureoffsets, partoffsets, ringoffsets = [0], [0], [0]
+    columns = OrderedDict()
+    srsname = None
+    count = 0
+    for elem in gml.iterelements(source):
+        row = {}
+        kind = None
+        for child in elem:
+            namespace, name = gml._split(child.tag)
+            if name == 'boundedBy' and namespace in gml._GML_NAMESPACES:
+                continue
+            if len(child) and gml.geometry_type(child[0]) is not None:
+                if kind is None:
+                    kind = gml.geometry_type(child[0])
+                    if srsname is None:
+                        srsname = child[0].get('srsName')
+                    for part in _parts(child[0], 2):
+                        rings.extend(part)
+                        ringoffsets.extend(ringoffsets[-1] + np.cumsum([len(r) for r in part]))
+                        partoffsets.append(partoffsets[-1] + len(part))
+                continue
+            row[name] = child.text.strip() if child.text is not None else None
+        featureoffsets.append(len(partoffsets) - 1)
+        ids.append(gml.feature_id(elem))
+        types.append(kind)
+        for name in row:
+            if name not in columns:
+                columns[name] = [None] * count
+        for name, values in columns.items():
+            values.append(row.get(name))
+        count += 1
+
+    if not rings:
+        coordinates = np.empty((0, 2))
+    elif len(set(r.shape[1] for r in rings)) == 1:
+        coordinates = np.concatenate(rings)
+    else:
+        coordinates = np.full((ringoffsets[-1], max(r.shape[1] for r in rings)), np.nan)
+        for ring, start in zip(rings, ringoffsets):
+            coordinates[start:start + len(ring), :ring.shape[1]] = ring
+
+    return FeatureTable(np.array(ids, dtype=object), np.array(types, dtype=object),
+                        coordinates, np.array(featureoffsets, dtype=np.int64),
+                        np.array(partoffsets, dtype=np.int64),
+                        np.array(ringoffsets, dtype=np.int64),
+                        OrderedDict((name, _column(values, (schema or {}).get(name)))
+                                    for name, values in columns.items()),
+                        srsname)
@@ -0,0 +1,157 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+"""
+Streaming decoding of GeoJSON feature collections, as returned by WFS
+GetFeature requests with a JSON outputFormat, such as application/json.
+
+The response is read in chunks and the members of its "features" array
+decoded one at a time, as soon as they have been received, so memory use
+is bounded by the size of a single feature rather than of the whole
+response.  Other members of the collection are skipped.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+import codecs
+import json
+
+from owslib.etree import etree
+from owslib.feature import gml
+
+_WHITESPACE = ' \t\n\r'
+
+
+def isjson(outputFormat):
+    """Return whether a WFS outputFormat is a GeoJSON format"""
+    return outputFormat is not None and 'json' in outputFormat.lower()
+
+
+class _Reader(object):
+    """A text buffer over a stream of bytes or text, refilled on demand"""
+
+    def __init__(self, stream, chunksize):
+        self.stream = stream
+        self.chunksize = chunksize
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size=None):
+        """Read at least size more characters, or up to the end of stream
+
+        Returns False at the end of stream.
+        """
+        if self.eof:
+            return False
+        if self.pos > len(self.buffer) // 2:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        wanted = len(self.buffer) + (size or self.chunksize)
+        while len(self.buffer) < wanted:
+            chunk = self.stream.read(max(self.chunksize, wanted - len(self.buffer)))
+            if not chunk:
+                self.buffer += self.decoder.decode(b'', True)
+                self.eof = True
+                break
+            if not isinstance(chunk, bytes):
+                self.buffer += chunk
+            else:
+                self.buffer += self.decoder.decode(chunk)
+        return True
+
+    def peek(self):
+        """Return the next character which is not whitespace, or ''"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, characters):
+        """Consume the next character, one of characters"""
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError('Expected %s at character %d of GeoJSON, got %r'
+                             % (' or '.join(characters), self.pos, character))
+        self.pos += 1
+        return character
+
+    def value(self, decoder):
+        """Decode the next JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                value = end = None
+            # a value at the end of the buffer may continue, like numbers
+            if end is not None and (end < len(self.buffer) or self.eof):
+                self.pos = end
+                return value
+            # read as much again as the value so far, to decode it once
+            # more only a logarithmic number of times
+            if not self.fill(len(self.buffer) - self.pos):
+                if end is not None:
+                    self.pos = end
+                    return value
+                decoder.raw_decode(self.buffer, self.pos)
+
+
+def _raise_exception(reader):
+    """Raise the XML exception report a server returned instead of JSON"""
+    while reader.fill():
+        pass
+    tree = etree.fromstring(reader.buffer[reader.pos:].encode('utf-8'))
+    if tree.tag in gml._EXCEPTION_TAGS:
+        gml._raise_exception(tree)
+    raise ValueError('Response is XML, not GeoJSON: %s' % tree.tag)
+
+
+def iterfeatures(source, chunksize=65536):
+    """Iterate over the features of a GeoJSON feature collection
+
+    source is a filename or a file-like object, such as the response of a
+    WFS GetFeature request, read chunksize bytes at a time.  Features are
+    yielded one at a time as GeoJSON dicts, as decoded by json.loads.
+
+    Raises ServiceException when source is an OGC or OWS exception report,
+    and ValueError when it is not a GeoJSON object.
+    """
+    if not hasattr(source, 'read'):
+        with open(source, 'rb') as stream:
+            for feature in iterfeatures(stream, chunksize):
+                yield feature
+        return
+    decoder = json.JSONDecoder()
+    reader = _Reader(source, chunksize)
+    if reader.peek() == '<':
+        _raise_exception(reader)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.value(decoder)
+        reader.expect(':')
+        if key == 'features':
+            reader.expect('[')
+            if reader.peek() != ']':
+                while True:
+                    yield reader.value(decoder)
+                    if reader.expect(',]') == ']':
+                        break
+            else:
+                reader.pos += 1
+        elif key == 'type':
+            kind = reader.value(decoder)
+            if kind == 'Feature':
+                raise ValueError('GeoJSON is a single Feature, not a FeatureCollection')
+        else:
+            reader.value(decoder)
+        if reader.expect(',}') == '}':
+            return
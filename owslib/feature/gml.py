@@ -0,0 +1,376 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+"""
+Streaming decoding of GML feature collections, as returned by WFS
+GetFeature requests.
+
+Features are parsed incrementally from gml:featureMember,
+gml:featureMembers and wfs:member elements of GML 2, 3.1 and 3.2
+documents and are discarded once yielded, so memory use is bounded by
+the size of a single feature rather than of the whole response.
+
+Geometries are decoded into GeoJSON like dicts, {'type': 'Polygon',
+'coordinates': [...]}, with positions as tuples of floats in the axis
+order of the response, and encoded back into GML by encode_geometry.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+import itertools
+
+from owslib.etree import etree
+from owslib.namespaces import Namespaces
+from owslib.util import ServiceException, OrderedDict
+
+n = Namespaces()
+GML_NAMESPACE = n.get_namespace('gml')
+GML32_NAMESPACE = n.get_namespace('gml32')
+WFS20_NAMESPACE = n.get_namespace('wfs20')
+OGC_NAMESPACE = n.get_namespace('ogc')
+OWS_NAMESPACE = n.get_namespace('ows')
+OWS110_NAMESPACE = n.get_namespace('ows110')
+
+_GML_NAMESPACES = (GML_NAMESPACE, GML32_NAMESPACE)
+
+# elements whose children are features
+_MEMBER_TAGS = frozenset([
+    '{%s}featureMember' % GML_NAMESPACE,
+    '{%s}featureMembers' % GML_NAMESPACE,
+    '{%s}featureMember' % GML32_NAMESPACE,
+    '{%s}featureMembers' % GML32_NAMESPACE,
+    '{%s}member' % WFS20_NAMESPACE,
+])
+
+# feature collections nested in members, when several queries are answered
+_COLLECTION_TAGS = frozenset([
+    '{%s}FeatureCollection' % WFS20_NAMESPACE,
+    '{%s}FeatureCollection' % GML32_NAMESPACE,
+    '{%s}FeatureCollection' % GML_NAMESPACE,
+])
+
+_EXCEPTION_TAGS = frozenset([
+    '{%s}ServiceExceptionReport' % OGC_NAMESPACE,
+    '{%s}ExceptionReport' % OWS_NAMESPACE,
+    '{%s}ExceptionReport' % OWS110_NAMESPACE,
+])
+
+_ID_ATTRIBUTES = ('{%s}id' % GML32_NAMESPACE, '{%s}id' % GML_NAMESPACE, 'fid')
+
+# GML geometry names and their GeoJSON types
+_GEOMETRY_TYPES = {
+    'Point': 'Point',
+    'LineString': 'LineString',
+    'Curve': 'LineString',
+    'LinearRing': 'LineString',
+    'Polygon': 'Polygon',
+    'Surface': 'Polygon',
+    'Box': 'Polygon',
+    'Envelope': 'Polygon',
+    'MultiPoint': 'MultiPoint',
+    'MultiLineString': 'MultiLineString',
+    'MultiCurve': 'MultiLineString',
+    'MultiPolygon': 'MultiPolygon',
+    'MultiSurface': 'MultiPolygon',
+    'MultiGeometry': 'GeometryCollection',
+}
+
+_EXTERIOR = frozenset(['exterior', 'outerBoundaryIs'])
+_INTERIOR = frozenset(['interior', 'innerBoundaryIs'])
+
+
+def _split(tag):
+    """Return the (namespace, local name) of a Clark notation tag"""
+    if tag[0] == '{':
+        namespace, name = tag[1:].split('}', 1)
+        return namespace, name
+    return None, tag
+
+
+class Feature(object):
+    """A feature decoded from a GML feature collection
+
+    Attributes are the feature id (gml:id, or fid for GML 2), its typename
+    as a Clark notation tag, its properties as an OrderedDict of text
+    values keyed by local name, and its first geometry property as a
+    GeoJSON like dict, with its name and srsName.  Further geometry
+    properties are kept in properties, decoded.
+    """
+
+    __slots__ = ('id', 'typename', 'properties', 'geometry', 'geometryname',
+                 'srsname')
+
+    def __init__(self, id, typename, properties, geometry=None,
+                 geometryname=None, srsname=None):
+        self.id = id
+        self.typename = typename
+        self.properties = properties
+        self.geometry = geometry
+        self.geometryname = geometryname
+        self.srsname = srsname
+
+    def __repr__(self):
+        return '<Feature %s>' % self.id
+
+
+def _positions(elem, dim):
+    """Return the positions held by the coordinate elements below elem"""
+    positions = []
+    for child in elem.iter():
+        namespace, name = _split(child.tag)
+        if namespace not in _GML_NAMESPACES:
+            continue
+        if name == 'pos':
+            positions.append(tuple(float(v) for v in child.text.split()))
+        elif name == 'posList':
+            size = int(child.get('srsDimension', child.get('dimension', dim)))
+            values = [float(v) for v in child.text.split()]
+            positions.extend(tuple(values[i:i + size])
+                             for i in range(0, len(values), size))
+        elif name == 'coordinates':
+            decimal = child.get('decimal', '.')
+            cs, ts = child.get('cs', ','), child.get('ts', ' ')
+            text = child.text.strip()
+            if decimal != '.':
+                text = text.replace(decimal, '.')
+            # tuples separated by whitespace may be split by any whitespace,
+            # such as newlines
+            tuples = text.split() if ts.isspace() else text.split(ts)
+            positions.extend(tuple(float(v) for v in pos.split(cs))
+                             for pos in tuples if pos)
+        elif name == 'coord':
+            positions.append(tuple(float(c.text) for c in child))
+        elif name in ('lowerCorner', 'upperCorner'):
+            positions.append(tuple(float(v) for v in child.text.split()))
+    return positions
+
+
+def _polygon(elem, dim):
+    exterior, interiors = None, []
+    for child in elem.iter():
+        name = _split(child.tag)[1]
+        if name in _EXTERIOR:
+            exterior = _positions(child, dim)
+        elif name in _INTERIOR:
+            interiors.append(_positions(child, dim))
+    return [exterior] + interiors
+
+
+def _members(elem, dim):
+    """Return the geometries held by the members of a multi geometry"""
+    geometries = []
+    for member in elem:
+        if _split(member.tag)[1].endswith(('Member', 'Members')):
+            geometries.extend(geometry(child, dim) for child in member)
+    return geometries
+
+
+def geometry_type(elem):
+    """Return the GeoJSON type of a GML geometry element, or None when
+    elem is not a supported GML geometry"""
+    namespace, name = _split(elem.tag)
+    if namespace not in _GML_NAMESPACES:
+        return None
+    return _GEOMETRY_TYPES.get(name)
+
+
+def geometry(elem, dim=2):
+    """Decode a GML geometry element into a GeoJSON like dict
+
+    Returns None when elem is not a supported GML geometry.
+    """
+    kind = geometry_type(elem)
+    if kind is None:
+        return None
+    name = _split(elem.tag)[1]
+    dim = int(elem.get('srsDimension', dim))
+    if kind == 'Point':
+        coordinates = _positions(elem, dim)[0]
+    elif kind == 'LineString':
+        coordinates = _positions(elem, dim)
+    elif name in ('Box', 'Envelope'):
+        (x0, y0), (x1, y1) = [pos[:2] for pos in _positions(elem, dim)]
+        coordinates = [[(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]]
+    elif kind == 'Polygon':
+        coordinates = _polygon(elem, dim)
+    elif kind == 'GeometryCollection':
+        return {'type': kind, 'geometries': _members(elem, dim)}
+    else:
+        coordinates = [g['coordinates'] for g in _members(elem, dim)]
+    return {'type': kind, 'coordinates': coordinates}
+
+
+def feature_id(elem):
+    """Return the gml:id, or GML 2 fid, of a feature element"""
+    for attribute in _ID_ATTRIBUTES:
+        fid = elem.get(attribute)
+        if fid is not None:
+            return fid
+    return None
+
+
+def decode_feature(elem):
+    """Decode a feature element into a Feature"""
+    properties = OrderedDict()
+    feature = Feature(feature_id(elem), elem.tag, properties)
+    for child in elem:
+        namespace, name = _split(child.tag)
+        if name == 'boundedBy' and namespace in _GML_NAMESPACES:
+            continue
+        value = None
+        if len(child):
+            value = geometry(child[0])
+            if value is not None and feature.geometry is None:
+                feature.geometry = value
+                feature.geometryname = name
+                feature.srsname = child[0].get('srsName')
+                continue
+        if value is None and child.text is not None:
+            value = child.text.strip()
+        properties[name] = value
+    return feature
+
+
+# GML encodings of GeoJSON types, by GML version: element and member names
+_ENCODINGS = {
+    '2': {
+        'MultiPoint': ('MultiPoint', 'pointMember'),
+        'MultiLineString': ('MultiLineString', 'lineStringMember'),
+        'MultiPolygon': ('MultiPolygon', 'polygonMember'),
+        'GeometryCollection': ('MultiGeometry', 'geometryMember'),
+    },
+    '3': {
+        'MultiPoint': ('MultiPoint', 'pointMember'),
+        'MultiLineString': ('MultiCurve', 'curveMember'),
+        'MultiPolygon': ('MultiSurface', 'surfaceMember'),
+        'GeometryCollection': ('MultiGeometry', 'geometryMember'),
+    },
+}
+
+
+def _text(positions, gml2):
+    if gml2:
+        return ' '.join(','.join(repr(float(c)) for c in pos) for pos in positions)
+    return ' '.join(' '.join(repr(float(c)) for c in pos) for pos in positions)
+
+
+def encode_geometry(geometry, version='3.2', srsname=None, gmlid=None):
+    """Encode a GeoJSON like geometry dict into a GML geometry element
+
+    version is the GML version, '2', '3.1' or '3.2'.  srsname is set on
+    the geometry, and gmlid, or ids derived from it, on the geometry and
+    its members, as required by GML 3.2.
+    """
+    gml2 = version.startswith('2')
+    ns = GML32_NAMESPACE if version == '3.2' else GML_NAMESPACE
+    kind = geometry['type']
+    ids = ('%s.%d' % (gmlid, i) for i in itertools.count(1)) if gmlid else None
+
+    def element(name, parent=None, **attributes):
+        tag = '{%s}%s' % (ns, name)
+        elem = etree.Element(tag) if parent is None else etree.SubElement(parent, tag)
+        for key, value in attributes.items():
+            elem.set(key, value)
+        return elem
+
+    def positions(parent, coordinates):
+        if gml2:
+            element('coordinates', parent).text = _text(coordinates, True)
+        elif len(coordinates) == 1:
+            element('pos', parent).text = _text(coordinates, False)
+        else:
+            poslist = element('posList', parent)
+            poslist.text = _text(coordinates, False)
+            if coordinates and len(coordinates[0]) != 2:
+                poslist.set('srsDimension', str(len(coordinates[0])))
+
+    def encode(kind, coordinates, gmlid=None):
+        if kind == 'Point':
+            elem = element('Point')
+            positions(elem, [coordinates])
+        elif kind == 'LineString':
+            elem = element('LineString')
+            positions(elem, coordinates)
+        elif kind == 'Polygon':
+            elem = element('Polygon')
+            for i, ring in enumerate(coordinates):
+                if gml2:
+                    boundary = element('outerBoundaryIs' if i == 0 else 'innerBoundaryIs', elem)
+                else:
+                    boundary = element('exterior' if i == 0 else 'interior', elem)
+                positions(element('LinearRing', boundary), ring)
+        elif kind in _ENCODINGS['2']:
+            name, member = _ENCODINGS['2' if gml2 else '3'][kind]
+            elem = element(name)
+            if kind == 'GeometryCollection':
+                members = [(g['type'], g.get('coordinates'), g) for g in coordinates]
+            else:
+                members = [(kind[5:], c, None) for c in coordinates]
+            for memberkind, membercoordinates, collected in members:
+                if collected is not None and memberkind == 'GeometryCollection':
+                    membercoordinates = collected['geometries']
+                child = encode(memberkind, membercoordinates,
+                               next(ids) if ids is not None else None)
+                element(member, elem).append(child)
+        else:
+            raise ValueError('Unsupported geometry type %s' % kind)
+        if gmlid is not None and not gml2:
+            elem.set('{%s}id' % ns, gmlid)
+        return elem
+
+    if kind == 'GeometryCollection':
+        elem = encode(kind, geometry['geometries'], gmlid)
+    else:
+        elem = encode(kind, geometry['coordinates'], gmlid)
+    if srsname is not None:
+        elem.set('srsName', srsname)
+    return elem
+
+
+def _raise_exception(tree):
+    messages = [text.strip() for text in tree.itertext() if text.strip()]
+    raise ServiceException('\n'.join(messages))
+
+
+def iterfeatures(source):
+    """Iterate over the features of a GML feature collection
+
+    source is a filename or a file-like object, such as the response of a
+    WFS GetFeature request.  Features are yielded one at a time as
+    Feature instances, and their elements freed once decoded.
+
+    Raises ServiceException when source is an OGC or OWS exception report.
+    """
+    for elem in iterelements(source):
+        yield decode_feature(elem)
+
+
+def iterelements(source):
+    """Iterate over the feature elements of a GML feature collection
+
+    Like iterfeatures, but yields the parsed elements, which are freed
+    when the next one is requested.
+    """
+    stack = []
+    events = etree.iterparse(source, events=('start', 'end'))
+    for event, elem in events:
+        if event == 'start':
+            if not stack and elem.tag in _EXCEPTION_TAGS:
+                for event, elem in events:
+                    pass
+                _raise_exception(elem)
+            stack.append(elem)
+            continue
+        stack.pop()
+        if not stack:
+            break
+        parent = stack[-1]
+        if elem.tag in _MEMBER_TAGS:
+            parent.remove(elem)
+        elif parent.tag in _MEMBER_TAGS and elem.tag not in _COLLECTION_TAGS:
+            yield elem
+            parent.remove(elem)
@@ -0,0 +1,163 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+"""
+Feature type schemas, as returned by WFS DescribeFeatureType requests.
+
+The XML Schema of a feature type is reduced to the kind of each of its
+properties, one of 'int', 'float', 'bool', 'date', 'datetime',
+'geometry' or 'string', which drives the decoding of property values,
+value by value with `convert`, or column by column in
+owslib.feature.columnar.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+
+from owslib.etree import etree
+from owslib.util import OrderedDict
+from owslib.feature import gml
+
+XS_NAMESPACE = 'http://www.w3.org/2001/XMLSchema'
+
+_KINDS = {
+    'boolean': 'bool',
+    'date': 'date',
+    'dateTime': 'datetime',
+    'decimal': 'float',
+    'double': 'float',
+    'float': 'float',
+}
+for _name in ('byte', 'int', 'integer', 'long', 'negativeInteger',
+              'nonNegativeInteger', 'nonPositiveInteger', 'positiveInteger',
+              'short', 'unsignedByte', 'unsignedInt', 'unsignedLong',
+              'unsignedShort'):
+    _KINDS[_name] = 'int'
+for _name in list(gml._GEOMETRY_TYPES) + ['Geometry', 'MultiGeometry']:
+    _KINDS[_name + 'PropertyType'] = 'geometry'
+_KINDS['GeometryAssociationType'] = 'geometry'
+
+
+def _xs(name):
+    return '{%s}%s' % (XS_NAMESPACE, name)
+
+
+def _local(qname):
+    """Return the local part of a prefixed name"""
+    return qname.split(':')[-1] if qname else qname
+
+
+def _kind(elem, simpletypes):
+    """Return the kind of a property element declaration"""
+    typename = _local(elem.get('type'))
+    if typename is None:
+        restriction = elem.find('%s/%s' % (_xs('simpleType'), _xs('restriction')))
+        if restriction is not None:
+            typename = _local(restriction.get('base'))
+        elif elem.find(_xs('complexType')) is not None:
+            # anonymous property type, geometric when it refers to gml
+            for child in elem.iter(_xs('element')):
+                if _KINDS.get(_local(child.get('ref', '')) + 'PropertyType') == 'geometry':
+                    return 'geometry'
+            return 'string'
+    # named simple types of the schema, restricting others
+    seen = set()
+    while typename in simpletypes and typename not in seen:
+        seen.add(typename)
+        typename = simpletypes[typename]
+    return _KINDS.get(typename, 'string')
+
+
+_GROUPS = frozenset([_xs(name) for name in ('complexContent', 'extension',
+                                              'sequence', 'choice', 'all')])
+
+
+def _declarations(elem):
+    """Iterate over the element declarations of a complex type"""
+    for child in elem:
+        if child.tag == _xs('element'):
+            yield child
+        elif child.tag in _GROUPS:
+            for declaration in _declarations(child):
+                yield declaration
+
+
+def parse(source):
+    """Parse a DescribeFeatureType XML Schema
+
+    source is a filename, a file-like object or an element.  Returns an
+    OrderedDict keyed by the element name of each feature type, of
+    OrderedDicts of the kind of each property, keyed by property name.
+    """
+    if hasattr(source, 'tag'):
+        root = source
+    else:
+        root = etree.parse(source).getroot()
+
+    simpletypes = {}
+    for elem in root.findall(_xs('simpleType')):
+        restriction = elem.find(_xs('restriction'))
+        if restriction is not None:
+            simpletypes[elem.get('name')] = _local(restriction.get('base'))
+
+    complextypes = dict((elem.get('name'), elem) for elem in root.findall(_xs('complexType')))
+
+    schemas = OrderedDict()
+    for elem in root.findall(_xs('element')):
+        complextype = elem.find(_xs('complexType'))
+        if complextype is None:
+            complextype = complextypes.get(_local(elem.get('type')))
+        if complextype is None:
+            continue
+        properties = OrderedDict()
+        for child in _declarations(complextype):
+            name = child.get('name') or _local(child.get('ref'))
+            if name is not None:
+                properties[name] = _kind(child, simpletypes)
+        schemas[elem.get('name')] = properties
+    return schemas
+
+
+def _datetime(value):
+    """Parse an xsd:dateTime into a naive UTC datetime"""
+    value = value.strip()
+    offset = datetime.timedelta(0)
+    if value.endswith('Z'):
+        value = value[:-1]
+    elif len(value) > 6 and value[-6] in '+-' and value[-3] == ':':
+        sign = -1 if value[-6] == '-' else 1
+        offset = sign * datetime.timedelta(hours=int(value[-5:-3]), minutes=int(value[-2:]))
+        value = value[:-6]
+    if '.' in value:
+        value, fraction = value.split('.', 1)
+        microseconds = int((fraction + '000000')[:6])
+    else:
+        microseconds = 0
+    result = datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S')
+    return result.replace(microsecond=microseconds) - offset
+
+
+def convert(value, kind):
+    """Convert the text of a property value to its kind
+
+    Returns None for missing values.  Geometries and strings are returned
+    unchanged.
+    """
+    if value is None:
+        return None
+    if kind == 'int':
+        return int(value)
+    if kind == 'float':
+        return float(value)
+    if kind == 'bool':
+        return value.strip() in ('true', '1')
+    if kind == 'date':
+        return datetime.datetime.strptime(value.strip()[:10], '%Y-%m-%d').date()
+    if kind == 'datetime':
+        return _datetime(value)
+    return value
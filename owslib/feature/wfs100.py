@@ -21,6 +21,7 @@ from owslib.fgdc import Metadata
 from owslib.iso import MD_Metadata
 from owslib.crs import Crs
 from owslib.namespaces import Namespaces
+from owslib.feature import WebFeatureService_, gml, geojson
 from owslib.util import log
 
 import pyproj
@@ -51,12 +52,13 @@ def nspath(path, ns=WFS_NAMESPACE):
     return "/".join(components)
 
 
-class WebFeatureService_1_0_0(object):
+class WebFeatureService_1_0_0(WebFeatureService_):
     """Abstraction for OGC Web Feature Service (WFS).
 
     Implements IWebFeatureService.
     """
-    def __new__(self,url, version, xml, parse_remote_metadata=False, timeout=30):
+    def __new__(self,url, version, xml, parse_remote_metadata=False, timeout=30,
+                username=None, password=None):
         """ overridden __new__ method 
         
         @type url: string
@@ -66,10 +68,12 @@ class WebFeatureService_1_0_0(object):
         @type parse_remote_metadata: boolean
         @param parse_remote_metadata: whether to fully process MetadataURL elements
         @param timeout: time (in seconds) after which requests should timeout
+        @param username: optional username for HTTP authentication
+        @param password: optional password for HTTP authentication
         @return: initialized WebFeatureService_1_0_0 object
         """
         obj=object.__new__(self)
-        obj.__init__(url, version, xml, parse_remote_metadata, timeout)
+        obj.__init__(url, version, xml, parse_remote_metadata, timeout, username, password)
         return obj
     
     def __getitem__(self,name):
@@ -80,17 +84,23 @@ class WebFeatureService_1_0_0(object):
             raise KeyError("No content named %s" % name)
     
     
-    def __init__(self, url, version, xml=None, parse_remote_metadata=False, timeout=30):
+    def __init__(self, url, version, xml=None, parse_remote_metadata=False, timeout=30,
+                 username=None, password=None):
         """Initialize."""
         self.url = url
         self.version = version
         self.timeout = timeout
+        self.username = username
+        self.password = password
         self._capabilities = None
+        self._schemas = {}
+        self._counts = {}
         reader = WFSCapabilitiesReader(self.version)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
-            self._capabilities = reader.read(self.url)
+            self._capabilities = reader.read(self.url, username=self.username,
+                                             password=self.password)
         self._buildMetadata(parse_remote_metadata)
     
     def _buildMetadata(self, parse_remote_metadata=False):
@@ -127,7 +137,7 @@ class WebFeatureService_1_0_0(object):
         file-like object.
         NOTE: this is effectively redundant now"""
         reader = WFSCapabilitiesReader(self.version)
-        return openURL(reader.capabilities_url(self.url), timeout=self.timeout)
+        return openURL(reader.capabilities_url(self.url), username=self.username, password=self.password, timeout=self.timeout)
     
     def items(self):
         '''supports dict-like items() access'''
@@ -185,43 +195,10 @@ class WebFeatureService_1_0_0(object):
         2) typename and filter (more expressive)
         3) featureid (direct access to known features)
         """
-        try:
-            base_url = next((m.get('url') for m in self.getOperationByName('GetFeature').methods if m.get('type').lower() == method.lower()))
-        except StopIteration:
-            base_url = self.url
-        request = {'service': 'WFS', 'version': self.version, 'request': 'GetFeature'}
+        u = self._openGetFeature(typename, filter, bbox, featureid,
+                                 featureversion, propertyname, maxfeatures,
+                                 srsname, outputFormat, method, startindex)
 
-        # check featureid
-        if featureid:
-            request['featureid'] = ','.join(featureid)
-        elif bbox and typename:
-            request['bbox'] = ','.join([repr(x) for x in bbox])
-        elif filter and typename:
-            request['filter'] = str(filter)
-        
-        if srsname:
-            request['srsname'] = str(srsname)
-            
-        assert len(typename) > 0
-        request['typename'] = ','.join(typename)
-        
-        if propertyname is not None:
-            if not isinstance(propertyname, list):
-                propertyname = [propertyname]
-            request['propertyname'] = ','.join(propertyname)
-
-        if featureversion: request['featureversion'] = str(featureversion)
-        if maxfeatures: request['maxfeatures'] = str(maxfeatures)
-        if startindex: request['startindex'] = str(startindex)
-
-        if outputFormat is not None:
-            request["outputFormat"] = outputFormat
-
-        data = urlencode(request)
-        log.debug("Making request: %s?%s" % (base_url, data))
-        u = openURL(base_url, data, method, timeout=self.timeout)
-        
-        
         # check for service exceptions, rewrap, and return
         # We're going to assume that anything with a content-length > 32k
         # is data. We'll check anything smaller.
@@ -254,6 +231,82 @@ class WebFeatureService_1_0_0(object):
                 return self._makeStringIO(data)
             return u
 
+    def iterfeatures(self, *args, **kwargs):
+        """Request feature data and iterate over the features returned.
+
+        Takes the parameters of `getfeature`.  The GML response is decoded
+        incrementally and each feature yielded as an
+        owslib.feature.gml.Feature, so that large responses can be
+        processed in bounded memory.  With a JSON outputFormat, such as
+        application/json, features are decoded incrementally from the
+        GeoJSON response and yielded as GeoJSON dicts.
+        """
+        u = self._openGetFeature(*args, stream=True, **kwargs)
+        if geojson.isjson(kwargs.get('outputFormat')):
+            return geojson.iterfeatures(u)
+        return gml.iterfeatures(u)
+
+    def _openGetFeature(self, typename=None, filter=None, bbox=None, featureid=None,
+                        featureversion=None, propertyname='*', maxfeatures=None,
+                        srsname=None, outputFormat=None, method='{http://www.opengis.net/wfs}Get',
+                        startindex=None, stream=False):
+        """Send a GetFeature request and return the response, streamed
+        from the connection when stream is True"""
+        if method.split('}')[-1].lower() == 'post':
+            (url, data) = self.getPOSTGetFeatureRequest(typename, filter, bbox, featureid,
+                                                        featureversion, propertyname,
+                                                        maxfeatures, None, None,
+                                                        outputFormat, method, startindex,
+                                                        srsname=srsname)
+            log.debug("Making request: %s %s" % (url, data))
+            return openURL(url, data, method, username=self.username, password=self.password, timeout=self.timeout, stream=stream)
+        base_url, data = self._getFeatureKVP(typename, filter, bbox, featureid, featureversion,
+                                             propertyname, maxfeatures, srsname, outputFormat,
+                                             method, startindex)
+        log.debug("Making request: %s?%s" % (base_url, data))
+        u = openURL(base_url, data, method, username=self.username, password=self.password, timeout=self.timeout, stream=stream)
+        return u
+
+    def _getFeatureKVP(self, typename=None, filter=None, bbox=None, featureid=None,
+                       featureversion=None, propertyname='*', maxfeatures=None,
+                       srsname=None, outputFormat=None, method='{http://www.opengis.net/wfs}Get',
+                       startindex=None):
+        """Return the base URL and the KVP encoded parameters of a GetFeature
+        request sent with HTTP GET"""
+        try:
+            base_url = next((m.get('url') for m in self.getOperationByName('GetFeature').methods if m.get('type').lower() == method.lower()))
+        except StopIteration:
+            base_url = self.url
+        request = {'service': 'WFS', 'version': self.version, 'request': 'GetFeature'}
+
+        # check featureid
+        if featureid:
+            request['featureid'] = ','.join(featureid)
+        elif bbox and typename:
+            request['bbox'] = ','.join([repr(x) for x in bbox])
+        elif filter and typename:
+            request['filter'] = str(filter)
+        
+        if srsname:
+            request['srsname'] = str(srsname)
+            
+        assert len(typename) > 0
+        request['typename'] = ','.join(typename)
+        
+        if propertyname is not None:
+            if not isinstance(propertyname, list):
+                propertyname = [propertyname]
+            request['propertyname'] = ','.join(propertyname)
+
+        if featureversion: request['featureversion'] = str(featureversion)
+        if maxfeatures: request['maxfeatures'] = str(maxfeatures)
+        if startindex: request['startindex'] = str(startindex)
+
+        if outputFormat is not None:
+            request["outputFormat"] = outputFormat
+
+        return base_url, urlencode(request)
+
     def getOperationByName(self, name):
         """Return a named content item."""
         for item in self.operations:
@@ -404,7 +457,7 @@ class WFSCapabilitiesReader(object):
         urlqs = urlencode(tuple(qs))
         return service_url.split('?')[0] + '?' + urlqs
 
-    def read(self, url, timeout=30):
+    def read(self, url, timeout=30, username=None, password=None):
         """Get and parse a WFS capabilities document, returning an
         instance of WFSCapabilitiesInfoset
 
@@ -416,7 +469,7 @@ class WFSCapabilitiesReader(object):
             A timeout value (in seconds) for the request.
         """
         request = self.capabilities_url(url)
-        u = openURL(request, timeout=timeout)
+        u = openURL(request, username=username, password=password, timeout=timeout)
         return etree.fromstring(u.read())
 
     def readString(self, st):
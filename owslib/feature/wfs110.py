@@ -23,7 +23,7 @@ from owslib.iso import MD_Metadata
 from owslib.ows import *
 from owslib.fes import *
 from owslib.crs import Crs
-from owslib.feature import WebFeatureService_
+from owslib.feature import WebFeatureService_, gml, geojson
 from owslib.namespaces import Namespaces
 from owslib.util import log
 
@@ -37,7 +37,8 @@ class WebFeatureService_1_1_0(WebFeatureService_):
 
     Implements IWebFeatureService.
     """
-    def __new__(self,url, version, xml, parse_remote_metadata=False, timeout=30):
+    def __new__(self,url, version, xml, parse_remote_metadata=False, timeout=30,
+                username=None, password=None):
         """ overridden __new__ method
 
         @type url: string
@@ -47,10 +48,12 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         @type parse_remote_metadata: boolean
         @param parse_remote_metadata: whether to fully process MetadataURL elements
         @param timeout: time (in seconds) after which requests should timeout
+        @param username: optional username for HTTP authentication
+        @param password: optional password for HTTP authentication
         @return: initialized WebFeatureService_1_1_0 object
         """
         obj=object.__new__(self)
-        obj.__init__(url, version, xml, parse_remote_metadata, timeout)
+        obj.__init__(url, version, xml, parse_remote_metadata, timeout, username, password)
         return obj
 
     def __getitem__(self,name):
@@ -61,18 +64,24 @@ class WebFeatureService_1_1_0(WebFeatureService_):
             raise KeyError("No content named %s" % name)
 
 
-    def __init__(self, url, version, xml=None, parse_remote_metadata=False, timeout=30):
+    def __init__(self, url, version, xml=None, parse_remote_metadata=False, timeout=30,
+                 username=None, password=None):
         """Initialize."""
         self.url = url
         self.version = version
         self.timeout = timeout
+        self.username = username
+        self.password = password
         self._capabilities = None
+        self._schemas = {}
+        self._counts = {}
         self.owscommon = OwsCommon('1.0.0')
         reader = WFSCapabilitiesReader(self.version)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
-            self._capabilities = reader.read(self.url)
+            self._capabilities = reader.read(self.url, username=self.username,
+                                             password=self.password)
         self._buildMetadata(parse_remote_metadata)
 
     def _buildMetadata(self, parse_remote_metadata=False):
@@ -111,7 +120,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         file-like object.
         NOTE: this is effectively redundant now"""
         reader = WFSCapabilitiesReader(self.version)
-        return openURL(reader.capabilities_url(self.url), timeout=self.timeout)
+        return openURL(reader.capabilities_url(self.url), username=self.username, password=self.password, timeout=self.timeout)
 
     def items(self):
         '''supports dict-like items() access'''
@@ -169,6 +178,98 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         2) typename and filter (more expressive)
         3) featureid (direct access to known features)
         """
+        u = self._openGetFeature(typename, filter, bbox, featureid,
+                                 featureversion, propertyname, maxfeatures,
+                                 srsname, outputFormat, method, startindex)
+
+        # check for service exceptions, rewrap, and return
+        # We're going to assume that anything with a content-length > 32k
+        # is data. We'll check anything smaller.
+        if 'Content-Length' in u.info():
+            length = int(u.info()['Content-Length'])
+            have_read = False
+        else:
+            data = u.read()
+            have_read = True
+            length = len(data)
+
+        if length < 32000:
+            if not have_read:
+                data = u.read()
+
+            try:
+                tree = etree.fromstring(data)
+            except BaseException:
+                # Not XML
+                return self._makeStringIO(data)
+            else:
+                if tree.tag == "{%s}ServiceExceptionReport" % namespaces["ogc"]:
+                    se = tree.find(nspath_eval('ServiceException', namespaces["ogc"]))
+                    raise ServiceException(str(se.text).strip())
+                else:
+                    return self._makeStringIO(data)
+        else:
+            if have_read:
+                return self._makeStringIO(data)
+            return u
+
+    def iterfeatures(self, *args, **kwargs):
+        """Request feature data and iterate over the features returned.
+
+        Takes the parameters of `getfeature`.  The GML response is decoded
+        incrementally and each feature yielded as an
+        owslib.feature.gml.Feature, so that large responses can be
+        processed in bounded memory.  With a JSON outputFormat, such as
+        application/json, features are decoded incrementally from the
+        GeoJSON response and yielded as GeoJSON dicts.
+        """
+        u = self._openGetFeature(*args, stream=True, **kwargs)
+        if geojson.isjson(kwargs.get('outputFormat')):
+            return geojson.iterfeatures(u)
+        return gml.iterfeatures(u)
+
+    def _getHits(self, typename=None, filter=None, bbox=None, featureid=None,
+                 featureversion=None, propertyname=None, storedQueryID=None,
+                 storedQueryParams=None):
+        """Return the number of features matching a query, or None when
+        the server does not report it"""
+        if typename and type(typename) == type(""):
+            typename = [typename]
+        u = self._openGetFeature(typename, filter, bbox, featureid, featureversion,
+                                 propertyname, resultType='hits')
+        tree = etree.fromstring(u.read())
+        try:
+            return int(tree.get('numberOfFeatures'))
+        except (TypeError, ValueError):
+            return None
+
+    def _openGetFeature(self, typename=None, filter=None, bbox=None, featureid=None,
+                        featureversion=None, propertyname='*', maxfeatures=None,
+                        srsname=None, outputFormat=None, method='Get',
+                        startindex=None, resultType=None, stream=False):
+        """Send a GetFeature request and return the response, streamed
+        from the connection when stream is True"""
+        if method.split('}')[-1].lower() == 'post':
+            (url, data) = self.getPOSTGetFeatureRequest(typename, filter, bbox, featureid,
+                                                        featureversion, propertyname,
+                                                        maxfeatures, None, None,
+                                                        outputFormat, method, startindex,
+                                                        srsname=srsname)
+            log.debug("Making request: %s %s" % (url, data))
+            return openURL(url, data, method, username=self.username, password=self.password, timeout=self.timeout, stream=stream)
+        base_url, data = self._getFeatureKVP(typename, filter, bbox, featureid, featureversion,
+                                             propertyname, maxfeatures, srsname, outputFormat,
+                                             method, startindex, resultType)
+        log.debug("Making request: %s?%s" % (base_url, data))
+        u = openURL(base_url, data, method, username=self.username, password=self.password, timeout=self.timeout, stream=stream)
+        return u
+
+    def _getFeatureKVP(self, typename=None, filter=None, bbox=None, featureid=None,
+                       featureversion=None, propertyname='*', maxfeatures=None,
+                       srsname=None, outputFormat=None, method='Get',
+                       startindex=None, resultType=None):
+        """Return the base URL and the KVP encoded parameters of a GetFeature
+        request sent with HTTP GET"""
         try:
             base_url = next((m.get('url') for m in self.getOperationByName('GetFeature').methods if m.get('type').lower() == method.lower()))
         except StopIteration:
@@ -219,41 +320,10 @@ class WebFeatureService_1_1_0(WebFeatureService_):
             request['startindex'] = str(startindex)
         if outputFormat is not None:
             request["outputFormat"] = outputFormat
+        if resultType is not None:
+            request['resultType'] = resultType
 
-        data = urlencode(request)
-        log.debug("Making request: %s?%s" % (base_url, data))
-        u = openURL(base_url, data, method, timeout=self.timeout)
-
-        # check for service exceptions, rewrap, and return
-        # We're going to assume that anything with a content-length > 32k
-        # is data. We'll check anything smaller.
-        if 'Content-Length' in u.info():
-            length = int(u.info()['Content-Length'])
-            have_read = False
-        else:
-            data = u.read()
-            have_read = True
-            length = len(data)
-
-        if length < 32000:
-            if not have_read:
-                data = u.read()
-
-            try:
-                tree = etree.fromstring(data)
-            except BaseException:
-                # Not XML
-                return self._makeStringIO(data)
-            else:
-                if tree.tag == "{%s}ServiceExceptionReport" % namespaces["ogc"]:
-                    se = tree.find(nspath_eval('ServiceException', namespaces["ogc"]))
-                    raise ServiceException(str(se.text).strip())
-                else:
-                    return self._makeStringIO(data)
-        else:
-            if have_read:
-                return self._makeStringIO(data)
-            return u
+        return base_url, urlencode(request)
 
     def getOperationByName(self, name):
         """Return a named content item."""
@@ -353,7 +423,7 @@ class WFSCapabilitiesReader(object):
         urlqs = urlencode(tuple(qs))
         return service_url.split('?')[0] + '?' + urlqs
 
-    def read(self, url, timeout=30):
+    def read(self, url, timeout=30, username=None, password=None):
         """Get and parse a WFS capabilities document, returning an
         instance of WFSCapabilitiesInfoset
 
@@ -365,7 +435,7 @@ class WFSCapabilitiesReader(object):
             A timeout value (in seconds) for the request.
         """
         request = self.capabilities_url(url)
-        u = openURL(request, timeout=timeout)
+        u = openURL(request, username=username, password=password, timeout=timeout)
         return etree.fromstring(u.read())
 
     def readString(self, st):
@@ -11,13 +11,14 @@ from __future__ import (absolute_import, division, print_function)
 #owslib imports:
 from owslib.ows import ServiceIdentification, ServiceProvider, OperationsMetadata
 from owslib.etree import etree
-from owslib.util import nspath, testXMLValue, openURL
+from owslib.util import nspath, testXMLValue, openURL, threaded_map, OrderedDict
 from owslib.crs import Crs
-from owslib.feature import WebFeatureService_
+from owslib.feature import WebFeatureService_, gml, geojson, columnar
 from owslib.namespaces import Namespaces
 
 #other imports
 import cgi
+import threading
 from six import PY2
 from six.moves import cStringIO as StringIO
 try:
@@ -36,16 +37,50 @@ GML_NAMESPACE = n.get_namespace("gml")
 FES_NAMESPACE = n.get_namespace("fes")
 
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class ServiceException(Exception):
     pass
 
 
+def _itervalues(source):
+    """Iterate over the values of a wfs:ValueCollection, parsed
+    incrementally.  Values are text, GeoJSON like dicts for geometries, or
+    None when empty."""
+    stack = []
+    events = etree.iterparse(source, events=('start', 'end'))
+    for event, elem in events:
+        if event == 'start':
+            if not stack and elem.tag in gml._EXCEPTION_TAGS:
+                for event, elem in events:
+                    pass
+                gml._raise_exception(elem)
+            stack.append(elem)
+            continue
+        stack.pop()
+        if len(stack) == 1 and elem.tag == nspath('member', WFS_NAMESPACE):
+            value = elem.text.strip() if elem.text and elem.text.strip() else None
+            if value is None and len(elem):
+                value = gml.geometry(elem[0])
+                if value is None and elem[0].text and elem[0].text.strip():
+                    value = elem[0].text.strip()
+            yield value
+            # detached from the collection, so that memory is bounded by
+            # one member rather than by the response
+            stack[0].remove(elem)
+
+
 class WebFeatureService_2_0_0(WebFeatureService_):
     """Abstraction for OGC Web Feature Service (WFS).
 
     Implements IWebFeatureService.
     """
-    def __new__(self,url, version, xml, parse_remote_metadata=False, timeout=30):
+    def __new__(self,url, version, xml, parse_remote_metadata=False, timeout=30,
+                username=None, password=None):
         """ overridden __new__ method 
         
         @type url: string
@@ -55,10 +90,12 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         @type parse_remote_metadata: boolean
         @param parse_remote_metadata: whether to fully process MetadataURL elements
         @param timeout: time (in seconds) after which requests should timeout
+        @param username: optional username for HTTP authentication
+        @param password: optional password for HTTP authentication
         @return: initialized WebFeatureService_2_0_0 object
         """
         obj=object.__new__(self)
-        obj.__init__(url, version, xml, parse_remote_metadata, timeout)
+        obj.__init__(url, version, xml, parse_remote_metadata, timeout, username, password)
         return obj
     
     def __getitem__(self,name):
@@ -69,19 +106,27 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             raise KeyError("No content named %s" % name)
     
     
-    def __init__(self, url,  version, xml=None, parse_remote_metadata=False, timeout=30):
+    def __init__(self, url,  version, xml=None, parse_remote_metadata=False, timeout=30,
+                 username=None, password=None):
         """Initialize."""
         if log.isEnabledFor(logging.DEBUG):
             log.debug('building WFS %s'%url)
         self.url = url
         self.version = version
         self.timeout = timeout
+        self.username = username
+        self.password = password
         self._capabilities = None
+        self._schemas = {}
+        self._counts = {}
+        self._storedqueries = None
+        self._storedquerieslock = threading.Lock()
         reader = WFSCapabilitiesReader(self.version)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
-            self._capabilities = reader.read(self.url)
+            self._capabilities = reader.read(self.url, username=self.username,
+                                             password=self.password)
         self._buildMetadata(parse_remote_metadata)
     
     def _buildMetadata(self, parse_remote_metadata=False):
@@ -131,7 +176,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         file-like object.
         NOTE: this is effectively redundant now"""
         reader = WFSCapabilitiesReader(self.version)
-        return openURL(reader.capabilities_url(self.url), timeout=self.timeout)
+        return openURL(reader.capabilities_url(self.url), username=self.username, password=self.password, timeout=self.timeout)
     
     def items(self):
         '''supports dict-like items() access'''
@@ -185,23 +230,10 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         2) typename and filter (==query) (more expressive)
         3) featureid (direct access to known features)
         """
-        storedQueryParams = storedQueryParams or {}
-        url = data = None
-        if typename and type(typename) == type(""):
-            typename = [typename]
-        if method.upper() == "GET":
-            (url) = self.getGETGetFeatureRequest(typename, filter, bbox, featureid,
-                                                 featureversion, propertyname,
-                                                 maxfeatures, storedQueryID,
-                                                 storedQueryParams, outputFormat, 'Get', startindex)
-            if log.isEnabledFor(logging.DEBUG):
-                log.debug('GetFeature WFS GET url %s'% url)
-        else:
-            (url,data) = self.getPOSTGetFeatureRequest()
-
-
-        # If method is 'Post', data will be None here
-        u = openURL(url, data, method, timeout=self.timeout)
+        u = self._openGetFeature(typename, filter, bbox, featureid,
+                                 featureversion, propertyname, maxfeatures,
+                                 storedQueryID, storedQueryParams, method,
+                                 outputFormat, startindex)
 
         # check for service exceptions, rewrap, and return
         # We're going to assume that anything with a content-length > 32k
@@ -234,12 +266,179 @@ class WebFeatureService_2_0_0(WebFeatureService_):
                 return self._makeStringIO(data)
             return u
 
+    def iterfeatures(self, *args, **kwargs):
+        """Request feature data and iterate over the features returned.
+
+        Takes the parameters of `getfeature`.  The GML response is decoded
+        incrementally and each feature yielded as an
+        owslib.feature.gml.Feature, so that large responses can be
+        processed in bounded memory.  With a JSON outputFormat, such as
+        application/json, features are decoded incrementally from the
+        GeoJSON response and yielded as GeoJSON dicts.
+        """
+        u = self._openGetFeature(*args, stream=True, **kwargs)
+        if geojson.isjson(kwargs.get('outputFormat')):
+            return geojson.iterfeatures(u)
+        return gml.iterfeatures(u)
+
+    def pagedfeatures(self, typename=None, filter=None, bbox=None,
+                      featureid=None, featureversion=None, propertyname=None,
+                      maxfeatures=None, storedQueryID=None,
+                      storedQueryParams=None, startindex=0, pagesize=1000,
+                      workers=4):
+        """Iterate over the features of a query retrieved page by page.
+
+        The number of matching features is taken first from `count`,
+        which requests it with resultType=hits unless it is cached, then
+        the pages are fetched concurrently by up to `workers` requests,
+        at most 2 * `workers` pages ahead of the consumer.  When the server does not report the number of
+        matching features, pages are fetched one after the other until a
+        short page is returned.  Features are yielded in order as
+        owslib.feature.gml.Feature instances.
+
+        Takes the parameters of `getfeature`, with maxfeatures limiting
+        the total number of features, plus:
+
+        startindex : int
+            Index of the first feature to return.
+        pagesize : int
+            Number of features requested per page.  Servers capping pages
+            to fewer features are detected and the remainder of the page
+            requested again.  None plans it with `planfeatures`.
+        workers : int
+            Number of pages fetched concurrently.  None plans it with
+            `planfeatures`.
+
+        Paging relies on the server returning features in a stable order.
+        """
+        query = dict(typename=typename, filter=filter, bbox=bbox,
+                     featureid=featureid, featureversion=featureversion,
+                     propertyname=propertyname, storedQueryID=storedQueryID,
+                     storedQueryParams=storedQueryParams)
+
+        def fetch(offset, size):
+            features = []
+            while len(features) < size:
+                u = self._openGetFeature(maxfeatures=size - len(features),
+                                         startindex=offset + len(features),
+                                         stream=True, **query)
+                page = list(gml.iterfeatures(u))
+                if not page:
+                    break
+                features.extend(page)
+            return features
+
+        hits = self.count(typename=typename, filter=filter, bbox=bbox,
+                          featureid=featureid, storedQueryID=storedQueryID,
+                          storedQueryParams=storedQueryParams)
+        if pagesize is None or workers is None:
+            plan = self._plan(hits, startindex, maxfeatures)
+            pagesize = pagesize or plan['pagesize']
+            workers = workers or plan['workers']
+        if hits is None:
+            return self._sequentialpages(fetch, startindex, pagesize,
+                                         maxfeatures)
+        total = max(0, hits - startindex)
+        if maxfeatures is not None:
+            total = min(total, maxfeatures)
+        pages = [(offset, min(pagesize, startindex + total - offset))
+                 for offset in range(startindex, startindex + total, pagesize)]
+        log.debug('GetFeature paging %d features in %d pages' % (total, len(pages)))
+        return self._parallelpages(fetch, pages, workers)
+
+    def _parallelpages(self, fetch, pages, workers):
+        for features in threaded_map(lambda page: fetch(*page), pages,
+                                     workers, prefetch=2 * workers):
+            for feature in features:
+                yield feature
+
+    def _sequentialpages(self, fetch, offset, pagesize, maxfeatures):
+        remaining = maxfeatures
+        while remaining is None or remaining > 0:
+            size = pagesize if remaining is None else min(pagesize, remaining)
+            features = fetch(offset, size)
+            for feature in features:
+                yield feature
+            if len(features) < size:
+                break
+            offset += size
+            if remaining is not None:
+                remaining -= size
+
+    def _getHits(self, typename=None, filter=None, bbox=None, featureid=None,
+                 featureversion=None, propertyname=None, storedQueryID=None,
+                 storedQueryParams=None):
+        """Return the number of features matching a query, or None when
+        the server does not report it"""
+        if typename and type(typename) == type(""):
+            typename = [typename]
+        url = self.getGETGetFeatureRequest(typename, filter, bbox, featureid,
+                                           featureversion, propertyname,
+                                           None, storedQueryID,
+                                           storedQueryParams or {}, None,
+                                           'Get', None, 'hits')
+        tree = etree.fromstring(openURL(url, username=self.username, password=self.password, timeout=self.timeout).read())
+        matched = tree.get('numberMatched', tree.get('numberOfFeatures'))
+        try:
+            return int(matched)
+        except (TypeError, ValueError):
+            # missing, or 'unknown'
+            return None
+
+    def _openGetFeature(self, typename=None, filter=None, bbox=None, featureid=None,
+                        featureversion=None, propertyname=None, maxfeatures=None,storedQueryID=None, storedQueryParams=None,
+                        method='Get', outputFormat=None, startindex=None, stream=False):
+        """Send a GetFeature request and return the response, streamed
+        from the connection when stream is True"""
+        storedQueryParams = storedQueryParams or {}
+        url = data = None
+        if typename and type(typename) == type(""):
+            typename = [typename]
+        if storedQueryID:
+            self._checkStoredQueryParams(storedQueryID, storedQueryParams)
+        if method.upper() == "GET":
+            url, data = self._getFeatureKVP(typename, filter, bbox, featureid,
+                                            featureversion, propertyname,
+                                            maxfeatures, storedQueryID,
+                                            storedQueryParams, 'Get', outputFormat, startindex)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('GetFeature WFS GET url %s'% url)
+        else:
+            (url,data) = self.getPOSTGetFeatureRequest(typename, filter, bbox, featureid,
+                                                       featureversion, propertyname,
+                                                       maxfeatures, storedQueryID,
+                                                       storedQueryParams, outputFormat, method, startindex)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('GetFeature WFS POST url %s data %s' % (url, data))
+
+        # If method is 'Get', data will be None here
+        u = openURL(url, data, method, username=self.username, password=self.password, timeout=self.timeout, stream=stream)
+        return u
+
+    def _getFeatureKVP(self, typename=None, filter=None, bbox=None, featureid=None,
+                       featureversion=None, propertyname=None, maxfeatures=None, storedQueryID=None,
+                       storedQueryParams=None, method='Get', outputFormat=None, startindex=None):
+        """Return the URL of a GetFeature request sent with HTTP GET, and
+        None as its parameters are in the URL"""
+        if typename and type(typename) == type(""):
+            typename = [typename]
+        url = self.getGETGetFeatureRequest(typename, filter, bbox, featureid,
+                                           featureversion, propertyname,
+                                           maxfeatures, storedQueryID,
+                                           storedQueryParams or {}, outputFormat, 'Get', startindex)
+        return url, None
 
     def getpropertyvalue(self, query=None, storedquery_id=None, valuereference=None, typename=None, method=nspath('Get'),**kwargs):
         ''' the WFS GetPropertyValue method'''
+        u = self._openGetPropertyValue(query, storedquery_id, valuereference, typename, method, **kwargs)
+        return u.read()
+
+    def _openGetPropertyValue(self, query=None, storedquery_id=None, valuereference=None, typename=None, method=nspath('Get'), stream=False, **kwargs):
+        ''' sends a GetPropertyValue request and returns the response, streamed when stream is True '''
+        method = method.split('}')[-1]
         try:
             base_url = next((m.get('url') for m in self.getOperationByName('GetPropertyValue').methods if m.get('type').lower() == method.lower()))
-        except StopIteration:
+        except (KeyError, StopIteration):
             base_url = self.url
         request = {'service': 'WFS', 'version': self.version, 'request': 'GetPropertyValue'}
         if query:
@@ -254,49 +453,134 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             for kw in kwargs.keys():
                 request[kw]=str(kwargs[kw])
         encoded_request=urlencode(request)
-        u = openURL(base_url + encoded_request)
-        return u.read()
-        
-        
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('GetPropertyValue WFS %s url %s data %s' % (method, base_url, encoded_request))
+        return openURL(base_url, encoded_request, method, username=self.username, password=self.password, timeout=self.timeout, stream=stream)
+
+    def propertyvalues(self, valuereference, typename=None, query=None, storedquery_id=None,
+                       kind=None, startindex=0, count=None, pagesize=None, workers=4, **kwargs):
+        """Return the values of a property as a NumPy array.
+
+        The wfs:ValueCollection of GetPropertyValue responses is parsed
+        incrementally and the values typed as by
+        owslib.feature.columnar: after kind, one of the kinds of
+        owslib.feature.schema such as 'int' or 'datetime', or after the
+        values themselves.
+
+        With a pagesize, the number of values is requested first with
+        resultType=hits, then pages of pagesize values are requested
+        concurrently by up to `workers` requests, with startindex and
+        count.  When the server does not report the number of values,
+        pages are requested one after the other until a short page is
+        returned.  count limits the total number of values.
+        """
+        if np is None:
+            raise RuntimeError('NumPy is required to return property values as arrays')
+        query = dict(query=query, storedquery_id=storedquery_id,
+                     valuereference=valuereference, typename=typename, **kwargs)
+
+        def fetch(offset, size):
+            options = {}
+            if offset:
+                options['startindex'] = offset
+            if size is not None:
+                options['count'] = size
+            params = dict(query, **options)
+            return list(_itervalues(self._openGetPropertyValue(stream=True, **params)))
+
+        if pagesize is None:
+            values = fetch(startindex, count)
+        else:
+            tree = etree.fromstring(self._openGetPropertyValue(resultType='hits', **query).read())
+            try:
+                hits = int(tree.get('numberMatched'))
+            except (TypeError, ValueError):
+                # missing, or 'unknown'
+                hits = None
+            values = []
+            if hits is not None:
+                total = max(0, hits - startindex)
+                if count is not None:
+                    total = min(total, count)
+                pages = [(offset, min(pagesize, startindex + total - offset))
+                         for offset in range(startindex, startindex + total, pagesize)]
+                for page in threaded_map(lambda page: fetch(*page), pages, workers,
+                                         prefetch=2 * workers):
+                    values.extend(page)
+            else:
+                offset, remaining = startindex, count
+                while remaining is None or remaining > 0:
+                    size = pagesize if remaining is None else min(pagesize, remaining)
+                    page = fetch(offset, size)
+                    values.extend(page)
+                    if len(page) < size:
+                        break
+                    offset += size
+                    if remaining is not None:
+                        remaining -= size
+        if any(isinstance(value, dict) for value in values):
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            return array
+        return columnar._column(values, kind)
+
     def _getStoredQueries(self):
-        ''' gets descriptions of the stored queries available on the server '''
-        sqs=[]
-        #This method makes two calls to the WFS - one ListStoredQueries, and one DescribeStoredQueries. The information is then
-        #aggregated in 'StoredQuery' objects
-        method=nspath('Get')
-        
-        #first make the ListStoredQueries response and save the results in a dictionary if form {storedqueryid:(title, returnfeaturetype)}
-        try:
-            base_url = next((m.get('url') for m in self.getOperationByName('ListStoredQueries').methods if m.get('type').lower() == method.lower()))
-        except StopIteration:
-            base_url = self.url
+        ''' gets descriptions of the stored queries available on the server,
+        requested once and cached until refreshstoredqueries is called '''
+        if self._storedqueries is None:
+            # discover once, even when called from several threads
+            with self._storedquerieslock:
+                if self._storedqueries is None:
+                    self._storedqueries = self._discoverStoredQueries()
+        return list(self._storedqueries.values())
+    storedqueries = property(_getStoredQueries, None)
 
-        request = {'service': 'WFS', 'version': self.version, 'request': 'ListStoredQueries'}
-        encoded_request = urlencode(request)
-        u = openURL(base_url, data=encoded_request, timeout=self.timeout)
-        tree=etree.fromstring(u.read())
-        tempdict={}       
-        for sqelem in tree[:]:
-            title=rft=id=None
+    def refreshstoredqueries(self):
+        ''' requests the descriptions of the stored queries again, and
+        returns them '''
+        storedqueries = self._discoverStoredQueries()
+        with self._storedquerieslock:
+            self._storedqueries = storedqueries
+        return list(storedqueries.values())
+
+    def getstoredquery(self, id):
+        ''' returns the StoredQuery of the given id '''
+        self._getStoredQueries()
+        try:
+            return self._storedqueries[id]
+        except KeyError:
+            raise KeyError("No stored query with id %s" % id)
+
+    def _discoverStoredQueries(self):
+        #This method makes two calls to the WFS - one ListStoredQueries, and one DescribeStoredQueries, concurrently.
+        #The information is then aggregated in 'StoredQuery' objects
+        def request(operation):
+            try:
+                base_url = next((m.get('url') for m in self.getOperationByName(operation).methods if m.get('type').lower() == 'get'))
+            except (KeyError, StopIteration):
+                base_url = self.url
+            request = {'service': 'WFS', 'version': self.version, 'request': operation}
+            encoded_request = urlencode(request)
+            u = openURL(base_url, data=encoded_request, username=self.username, password=self.password, timeout=self.timeout)
+            return etree.fromstring(u.read())
+        listing, descriptions = threaded_map(request, ['ListStoredQueries', 'DescribeStoredQueries'], 2)
+
+        #the ListStoredQueries response gives the title and returned feature type of each stored query
+        tempdict=OrderedDict()
+        for sqelem in listing[:]:
+            title=rft=None
             id=sqelem.get('id')
             for elem in sqelem[:]:
                 if elem.tag==nspath('Title', WFS_NAMESPACE):
                     title=elem.text
-                elif elem.tag==nspath('ReturnFeatureType', WFS_NAMESPACE):
+                elif elem.tag==nspath('ReturnFeatureType', WFS_NAMESPACE) and rft is None:
                     rft=elem.text
             tempdict[id]=(title,rft)        #store in temporary dictionary
-        
-        #then make the DescribeStoredQueries request and get the rest of the information about the stored queries 
-        try:
-            base_url = next((m.get('url') for m in self.getOperationByName('DescribeStoredQueries').methods if m.get('type').lower() == method.lower()))
-        except StopIteration:
-            base_url = self.url
-        request = {'service': 'WFS', 'version': self.version, 'request': 'DescribeStoredQueries'}
-        encoded_request = urlencode(request)
-        u = openURL(base_url, data=encoded_request, timeout=to)
-        tree=etree.fromstring(u.read())
-        tempdict2={} 
-        for sqelem in tree[:]:
+
+        #the DescribeStoredQueries response gives the rest of the information about the stored queries
+        tempdict2=OrderedDict()
+        for sqelem in descriptions[:]:
+            abstract=None
             params=[] #list to store parameters for the stored query description
             id =sqelem.get('id')
             for elem in sqelem[:]:
@@ -306,14 +590,26 @@ class WebFeatureService_2_0_0(WebFeatureService_):
                     newparam=Parameter(elem.get('name'), elem.get('type'))
                     params.append(newparam)
             tempdict2[id]=(abstract, params) #store in another temporary dictionary
-        
+
         #now group the results into StoredQuery objects:
-        for key in tempdict.keys(): 
-            abstract='blah'
-            parameters=[]
-            sqs.append(StoredQuery(key, tempdict[key][0], tempdict[key][1], tempdict2[key][0], tempdict2[key][1]))
+        sqs=OrderedDict()
+        for key in list(tempdict.keys()) + [k for k in tempdict2.keys() if k not in tempdict]:
+            title, rft = tempdict.get(key, (None, None))
+            abstract, params = tempdict2.get(key, (None, []))
+            sqs[key] = StoredQuery(key, title, rft, abstract, params)
         return sqs
-    storedqueries = property(_getStoredQueries, None)
+
+    def _checkStoredQueryParams(self, storedQueryID, storedQueryParams):
+        ''' checks the parameters of a stored query against its description,
+        when the stored queries have been described already '''
+        storedquery = (self._storedqueries or {}).get(storedQueryID)
+        if storedquery is None:
+            return
+        names = [p.name for p in storedquery.parameters]
+        unknown = [name for name in storedQueryParams if name not in names]
+        if unknown:
+            raise ValueError("Unknown parameters %s of stored query %s. Parameters are: %s"
+                             % (', '.join(unknown), storedQueryID, ', '.join(names)))
 
     def getOperationByName(self, name):
         """Return a named content item."""
@@ -441,7 +737,7 @@ class WFSCapabilitiesReader(object):
         urlqs = urlencode(tuple(qs))
         return service_url.split('?')[0] + '?' + urlqs
 
-    def read(self, url, timeout=30):
+    def read(self, url, timeout=30, username=None, password=None):
         """Get and parse a WFS capabilities document, returning an
         instance of WFSCapabilitiesInfoset
 
@@ -453,7 +749,7 @@ class WFSCapabilitiesReader(object):
             A timeout value (in seconds) for the request.
         """
         request = self.capabilities_url(url)
-        u = openURL(request, timeout=timeout)
+        u = openURL(request, username=username, password=password, timeout=timeout)
         return etree.fromstring(u.read())
 
     def readString(self, st):
@@ -14,6 +14,8 @@ from __future__ import (absolute_import, division, print_function)
 from owslib.etree import etree
 from owslib import util
 
+_paths = util.ElementPaths()
+
 class Metadata(object):
     """ Process metadata """
     def __init__(self, md):
@@ -33,45 +35,45 @@ class Metadata(object):
 class Idinfo(object):
     """ Process idinfo """
     def __init__(self, md):
-        val = md.find('idinfo/datasetid')
+        val = _paths.find(md, 'idinfo/datasetid')
         self.datasetid = util.testXMLValue(val)
 
-        val = md.find('idinfo/citation')
+        val = _paths.find(md, 'idinfo/citation')
         self.citation = Citation(val)
 
-        val = md.find('idinfo/descript')
+        val = _paths.find(md, 'idinfo/descript')
         if val is not None:
             self.descript = Descript(val)
 
-        val = md.find('idinfo/timeperd')
+        val = _paths.find(md, 'idinfo/timeperd')
         self.timeperd = Timeperd(val)
 
-        val = md.find('idinfo/status')
+        val = _paths.find(md, 'idinfo/status')
         if val is not None:
             self.status = Status(val)
 
-        val = md.find('idinfo/spdom')
+        val = _paths.find(md, 'idinfo/spdom')
         if val is not None:
             self.spdom = Spdom(val)
 
-        val = md.find('idinfo/keywords')
+        val = _paths.find(md, 'idinfo/keywords')
         if val is not None:
             self.keywords = Keywords(val)
 
-        val = md.find('idinfo/accconst')
+        val = _paths.find(md, 'idinfo/accconst')
         self.accconst = util.testXMLValue(val)
 
-        val = md.find('idinfo/useconst')
+        val = _paths.find(md, 'idinfo/useconst')
         self.useconst = util.testXMLValue(val)
 
-        val = md.find('idinfo/ptcontac')
+        val = _paths.find(md, 'idinfo/ptcontac')
         if val is not None:
             self.ptcontac = Ptcontac(val)
 
-        val = md.find('idinfo/datacred')
+        val = _paths.find(md, 'idinfo/datacred')
         self.datacred = util.testXMLValue(val)
 
-        val = md.find('idinfo/crossref')
+        val = _paths.find(md, 'idinfo/crossref')
         self.crossref = Citation(val)
 
 class Citation(object):
@@ -80,104 +82,104 @@ class Citation(object):
         if md is not None:
             self.citeinfo = {}
     
-            val = md.find('citeinfo/origin')
+            val = _paths.find(md, 'citeinfo/origin')
             self.citeinfo['origin'] = util.testXMLValue(val)
     
-            val = md.find('citeinfo/pubdate')
+            val = _paths.find(md, 'citeinfo/pubdate')
             self.citeinfo['pubdate'] = util.testXMLValue(val)
     
-            val = md.find('citeinfo/title')
+            val = _paths.find(md, 'citeinfo/title')
             self.citeinfo['title'] = util.testXMLValue(val)
     
-            val = md.find('citeinfo/geoform')
+            val = _paths.find(md, 'citeinfo/geoform')
             self.citeinfo['geoform'] = util.testXMLValue(val)
     
-            val = md.find('citeinfo/pubinfo/pubplace')
+            val = _paths.find(md, 'citeinfo/pubinfo/pubplace')
             self.citeinfo['pubplace'] = util.testXMLValue(val)
     
-            val = md.find('citeinfo/pubinfo/publish')
+            val = _paths.find(md, 'citeinfo/pubinfo/publish')
             self.citeinfo['publish'] = util.testXMLValue(val)
 
             self.citeinfo['onlink'] = []
-            for link in md.findall('citeinfo/onlink'):
+            for link in _paths.findall(md, 'citeinfo/onlink'):
                 self.citeinfo['onlink'].append(util.testXMLValue(link))
 
 class Descript(object):
     """ Process descript """
     def __init__(self, md):
-        val = md.find('abstract')
+        val = _paths.find(md, 'abstract')
         self.abstract = util.testXMLValue(val)
         
-        val = md.find('purpose')
+        val = _paths.find(md, 'purpose')
         self.purpose = util.testXMLValue(val)
 
-        val = md.find('supplinf')
+        val = _paths.find(md, 'supplinf')
         self.supplinf = util.testXMLValue(val)
 
 class Timeperd(object):
     """ Process timeperd """
     def __init__(self, md):
         if md is not None:
-            val = md.find('current')
+            val = _paths.find(md, 'current')
             self.current = util.testXMLValue(val)
 
-            val = md.find('timeinfo')
+            val = _paths.find(md, 'timeinfo')
             if val is not None:
                 self.timeinfo = Timeinfo(val)
 
 class Timeinfo(object):
     """ Process timeinfo """
     def __init__(self, md):
-        val = md.find('sngdate')
+        val = _paths.find(md, 'sngdate')
         if val is not None:
             self.sngdate = Sngdate(val)
 
-        val = md.find('rngdates')
+        val = _paths.find(md, 'rngdates')
         if val is not None:
             self.rngdates = Rngdates(val)
 
 class Sngdate(object):
     """ Process sngdate """
     def __init__(self, md):
-        val = md.find('caldate')
+        val = _paths.find(md, 'caldate')
         self.caldate = util.testXMLValue(val)
-        val = md.find('time')
+        val = _paths.find(md, 'time')
         self.time = util.testXMLValue(val)
 
 class Rngdates(object):
     """ Process rngdates """
     def __init__(self, md):
-        val = md.find('begdate')
+        val = _paths.find(md, 'begdate')
         self.begdate = util.testXMLValue(val)
-        val = md.find('begtime')
+        val = _paths.find(md, 'begtime')
         self.begtime = util.testXMLValue(val)
-        val = md.find('enddate')
+        val = _paths.find(md, 'enddate')
         self.enddate = util.testXMLValue(val)
-        val = md.find('endtime')
+        val = _paths.find(md, 'endtime')
         self.endtime = util.testXMLValue(val)
 
 class Status(object):
     """ Process status """
     def __init__(self, md):
-        val = md.find('progress')
+        val = _paths.find(md, 'progress')
         self.progress = util.testXMLValue(val)
 
-        val = md.find('update')
+        val = _paths.find(md, 'update')
         self.update = util.testXMLValue(val)
 
 class Spdom(object):
     """ Process spdom """
     def __init__(self, md):
-        val = md.find('bounding/westbc')
+        val = _paths.find(md, 'bounding/westbc')
         self.westbc = util.testXMLValue(val)
 
-        val = md.find('bounding/eastbc')
+        val = _paths.find(md, 'bounding/eastbc')
         self.eastbc = util.testXMLValue(val)
        
-        val = md.find('bounding/northbc')
+        val = _paths.find(md, 'bounding/northbc')
         self.northbc = util.testXMLValue(val)
 
-        val = md.find('bounding/southbc')
+        val = _paths.find(md, 'bounding/southbc')
         self.southbc = util.testXMLValue(val)
 
         if (self.southbc is not None and self.northbc is not None and
@@ -199,98 +201,98 @@ class Keywords(object):
         self.place = []
         self.temporal = []
 
-        for i in md.findall('theme'):
+        for i in _paths.findall(md, 'theme'):
             theme = {}
-            val = i.find('themekt')
+            val = _paths.find(i, 'themekt')
             theme['themekt'] = util.testXMLValue(val)
             theme['themekey'] = []
-            for j in i.findall('themekey'):
+            for j in _paths.findall(i, 'themekey'):
                 themekey = util.testXMLValue(j)
                 if themekey is not None:
                     theme['themekey'].append(themekey)
             self.theme.append(theme)
 
-        for i in md.findall('place'):
+        for i in _paths.findall(md, 'place'):
             theme = {}
             place = {}
-            val = i.find('placekt')
+            val = _paths.find(i, 'placekt')
             theme['placekt'] = util.testXMLValue(val)
             theme['placekey'] = []
-            for j in i.findall('placekey'):
+            for j in _paths.findall(i, 'placekey'):
                 theme['placekey'].append(util.testXMLValue(j))
             self.place.append(place)
 
-        for i in md.findall('temporal'):
+        for i in _paths.findall(md, 'temporal'):
             theme = {}
             temporal = {}
-            val = i.find('tempkt')
+            val = _paths.find(i, 'tempkt')
             theme['tempkt'] = util.testXMLValue(val)
             theme['tempkey'] = []
-            for j in i.findall('tempkey'):
+            for j in _paths.findall(i, 'tempkey'):
                 theme['tempkey'].append(util.testXMLValue(j))
             self.temporal.append(temporal)
 
 class Ptcontac(object):
     """ Process ptcontac """
     def __init__(self, md):
-        val = md.find('cntinfo/cntorgp/cntorg')
+        val = _paths.find(md, 'cntinfo/cntorgp/cntorg')
         self.cntorg = util.testXMLValue(val)    
 
-        val = md.find('cntinfo/cntorgp/cntper')
+        val = _paths.find(md, 'cntinfo/cntorgp/cntper')
         self.cntper = util.testXMLValue(val)    
 
-        val = md.find('cntinfo/cntpos')
+        val = _paths.find(md, 'cntinfo/cntpos')
         self.cntpos = util.testXMLValue(val)    
 
-        val = md.find('cntinfo/cntaddr/addrtype')
+        val = _paths.find(md, 'cntinfo/cntaddr/addrtype')
         self.addrtype = util.testXMLValue(val)
 
-        val = md.find('cntinfo/cntaddr/address')
+        val = _paths.find(md, 'cntinfo/cntaddr/address')
         self.address = util.testXMLValue(val)
 
-        val = md.find('cntinfo/cntaddr/city')
+        val = _paths.find(md, 'cntinfo/cntaddr/city')
         self.city = util.testXMLValue(val)
 
-        val = md.find('cntinfo/cntaddr/state')
+        val = _paths.find(md, 'cntinfo/cntaddr/state')
         self.state = util.testXMLValue(val)
 
-        val = md.find('cntinfo/cntaddr/postal')
+        val = _paths.find(md, 'cntinfo/cntaddr/postal')
         self.postal = util.testXMLValue(val)
 
-        val = md.find('cntinfo/cntaddr/country')
+        val = _paths.find(md, 'cntinfo/cntaddr/country')
         self.country = util.testXMLValue(val)
 
-        val = md.find('cntinfo/cntvoice')
+        val = _paths.find(md, 'cntinfo/cntvoice')
         self.voice = util.testXMLValue(val)
 
-        val = md.find('cntinfo/cntemail')
+        val = _paths.find(md, 'cntinfo/cntemail')
         self.email = util.testXMLValue(val)
 
 class Eainfo(object):
     """ Process eainfo """
     def __init__(self, md):
-        val = md.find('eainfo/detailed/enttyp/enttypl')
+        val = _paths.find(md, 'eainfo/detailed/enttyp/enttypl')
         self.enttypl = util.testXMLValue(val)
 
-        val = md.find('eainfo/detailed/enttyp/enttypd')
+        val = _paths.find(md, 'eainfo/detailed/enttyp/enttypd')
         self.enttypd = util.testXMLValue(val)
 
-        val = md.find('eainfo/detailed/enttyp/enttypds')
+        val = _paths.find(md, 'eainfo/detailed/enttyp/enttypds')
         self.enttypds = util.testXMLValue(val)
 
         self.attr = []
-        for i in md.findall('eainfo/detailed/attr'):
+        for i in _paths.findall(md, 'eainfo/detailed/attr'):
             attr = {}
-            val = i.find('attrlabl')
+            val = _paths.find(i, 'attrlabl')
             attr['attrlabl'] = util.testXMLValue(val)
 
-            val = i.find('attrdef')
+            val = _paths.find(i, 'attrdef')
             attr['attrdef'] = util.testXMLValue(val)
 
-            val = i.find('attrdefs')
+            val = _paths.find(i, 'attrdefs')
             attr['attrdefs'] = util.testXMLValue(val)
 
-            val = i.find('attrdomv/udom')
+            val = _paths.find(i, 'attrdomv/udom')
             attr['udom'] = util.testXMLValue(val)
 
             self.attr.append(attr)
@@ -298,38 +300,38 @@ class Eainfo(object):
 class Distinfo(object):
     """ Process distinfo """
     def __init__(self, md):
-        val = md.find('distinfo')
+        val = _paths.find(md, 'distinfo')
         if val is not None:
-            val2 = val.find('stdorder')
+            val2 = _paths.find(val, 'stdorder')
             if val2 is not None:
                 self.stdorder = {'digform': []}
-                for link in val2.findall('digform'):
+                for link in _paths.findall(val2, 'digform'):
                     digform = {}
-                    digform['name'] = util.testXMLValue(link.find('digtinfo/formname'))
-                    digform['url'] = util.testXMLValue(link.find('digtopt/onlinopt/computer/networka/networkr/'))
+                    digform['name'] = util.testXMLValue(_paths.find(link, 'digtinfo/formname'))
+                    digform['url'] = util.testXMLValue(_paths.find(link, 'digtopt/onlinopt/computer/networka/networkr'))
                     self.stdorder['digform'].append(digform)
 
 class Metainfo(object):
     """ Process metainfo """
     def __init__(self, md):
-        val = md.find('metainfo/metd')
+        val = _paths.find(md, 'metainfo/metd')
         self.metd = util.testXMLValue(val)
 
-        val = md.find('metainfo/metrd')
+        val = _paths.find(md, 'metainfo/metrd')
         self.metrd = util.testXMLValue(val)
 
-        val = md.find('metainfo/metc')        
+        val = _paths.find(md, 'metainfo/metc')        
         if val is not None:
             self.metc = Ptcontac(val)
 
-        val = md.find('metainfo/metstdn')
+        val = _paths.find(md, 'metainfo/metstdn')
         self.metstdn = util.testXMLValue(val)
 
-        val = md.find('metainfo/metstdv')
+        val = _paths.find(md, 'metainfo/metstdv')
         self.metstdv = util.testXMLValue(val)
 
-        val = md.find('metainfo/metac')
+        val = _paths.find(md, 'metainfo/metac')
         self.metac = util.testXMLValue(val)
 
-        val = md.find('metainfo/metuc')
+        val = _paths.find(md, 'metainfo/metuc')
         self.metuc = util.testXMLValue(val)
@@ -23,6 +23,7 @@ def get_namespaces():
     ns[None] = n.get_namespace("gmd")
     return ns
 namespaces = get_namespaces()
+_paths = util.ElementPaths(namespaces)
 
 
 class MD_Metadata(object):
@@ -51,100 +52,146 @@ class MD_Metadata(object):
             self.dataquality = None
         else:
             if hasattr(md, 'getroot'):  # standalone document
-                self.xml = etree.tostring(md.getroot())
-            else:  # part of a larger document
-                self.xml = etree.tostring(md)
-
-            val = md.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
-            self.identifier = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:parentIdentifier/gco:CharacterString', namespaces))
-            self.parentidentifier = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:language/gco:CharacterString', namespaces))
-            self.language = util.testXMLValue(val)
-            
-            val = md.find(util.nspath_eval('gmd:dataSetURI/gco:CharacterString', namespaces))
-            self.dataseturi = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces))
-            self.languagecode = util.testXMLValue(val)
-            
-            val = md.find(util.nspath_eval('gmd:dateStamp/gco:Date', namespaces))
-            self.datestamp = util.testXMLValue(val)
-
-            if not self.datestamp:
-                val = md.find(util.nspath_eval('gmd:dateStamp/gco:DateTime', namespaces))
-                self.datestamp = util.testXMLValue(val)
+                md = md.getroot()
+            # sections are parsed from the element on first access
+            self._md = md
+
+    def __getstate__(self):
+        return util.resolved_state(self, '_md')
+
+    @util.cached_property
+    def xml(self):
+        return etree.tostring(self._md)
+
+    @util.cached_property
+    def identifier(self):
+        val = _paths.find(self._md, 'gmd:fileIdentifier/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def parentidentifier(self):
+        val = _paths.find(self._md, 'gmd:parentIdentifier/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def language(self):
+        val = _paths.find(self._md, 'gmd:language/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def dataseturi(self):
+        val = _paths.find(self._md, 'gmd:dataSetURI/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def languagecode(self):
+        val = _paths.find(self._md, 'gmd:language/gmd:LanguageCode')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def datestamp(self):
+        val = _paths.find(self._md, 'gmd:dateStamp/gco:Date')
+        datestamp = util.testXMLValue(val)
+
+        if not datestamp:
+            val = _paths.find(self._md, 'gmd:dateStamp/gco:DateTime')
+            datestamp = util.testXMLValue(val)
+        return datestamp
+
+    @util.cached_property
+    def charset(self):
+        return _testCodeListValue(_paths.find(self._md, 'gmd:characterSet/gmd:MD_CharacterSetCode'))
+
+    @util.cached_property
+    def hierarchy(self):
+        return _testCodeListValue(_paths.find(self._md, 'gmd:hierarchyLevel/gmd:MD_ScopeCode'))
+
+    @util.cached_property
+    def contact(self):
+        contact = []
+        for i in _paths.findall(self._md, 'gmd:contact/gmd:CI_ResponsibleParty'):
+            o = CI_ResponsibleParty(i)
+            contact.append(o)
+        return contact
+
+    @util.cached_property
+    def datetimestamp(self):
+        val = _paths.find(self._md, 'gmd:dateStamp/gco:DateTime')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def stdname(self):
+        val = _paths.find(self._md, 'gmd:metadataStandardName/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def stdver(self):
+        val = _paths.find(self._md, 'gmd:metadataStandardVersion/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def referencesystem(self):
+        val = _paths.find(self._md, 'gmd:referenceSystemInfo/gmd:MD_ReferenceSystem')
+        if val is not None:
+            return MD_ReferenceSystem(val)
+        return None
 
-            self.charset = _testCodeListValue(md.find(util.nspath_eval('gmd:characterSet/gmd:MD_CharacterSetCode', namespaces)))
-      
-            self.hierarchy = _testCodeListValue(md.find(util.nspath_eval('gmd:hierarchyLevel/gmd:MD_ScopeCode', namespaces)))
+    # TODO: merge .identificationinfo into .identification
+    #warnings.warn(
+    #    'the .identification and .serviceidentification properties will merge into '
+    #    '.identification being a list of properties.  This is currently implemented '
+    #    'in .identificationinfo.  '
+    #    'Please see https://github.com/geopython/OWSLib/issues/38 for more information',
+    #    FutureWarning)
 
-            self.contact = []
-            for i in md.findall(util.nspath_eval('gmd:contact/gmd:CI_ResponsibleParty', namespaces)):
-                o = CI_ResponsibleParty(i)
-                self.contact.append(o)
-            
-            val = md.find(util.nspath_eval('gmd:dateStamp/gco:DateTime', namespaces))
-            self.datetimestamp = util.testXMLValue(val)
-            
-            val = md.find(util.nspath_eval('gmd:metadataStandardName/gco:CharacterString', namespaces))
-            self.stdname = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:metadataStandardVersion/gco:CharacterString', namespaces))
-            self.stdver = util.testXMLValue(val)
+    @util.cached_property
+    def identification(self):
+        val = _paths.find(self._md, 'gmd:identificationInfo/gmd:MD_DataIdentification')
+        val2 = _paths.find(self._md, 'gmd:identificationInfo/srv:SV_ServiceIdentification')
 
-            val = md.find(util.nspath_eval('gmd:referenceSystemInfo/gmd:MD_ReferenceSystem', namespaces))
-            if val is not None:
-                self.referencesystem = MD_ReferenceSystem(val)
-            else:
-                self.referencesystem = None
+        if val is not None:
+            return MD_DataIdentification(val, 'dataset')
+        elif val2 is not None:
+            return MD_DataIdentification(val2, 'service')
+        return None
 
-            # TODO: merge .identificationinfo into .identification
-            #warnings.warn(
-            #    'the .identification and .serviceidentification properties will merge into '
-            #    '.identification being a list of properties.  This is currently implemented '
-            #    'in .identificationinfo.  '
-            #    'Please see https://github.com/geopython/OWSLib/issues/38 for more information',
-            #    FutureWarning)
+    @util.cached_property
+    def serviceidentification(self):
+        val = _paths.find(self._md, 'gmd:identificationInfo/gmd:MD_DataIdentification')
+        val2 = _paths.find(self._md, 'gmd:identificationInfo/srv:SV_ServiceIdentification')
 
-            val = md.find(util.nspath_eval('gmd:identificationInfo/gmd:MD_DataIdentification', namespaces))
-            val2 = md.find(util.nspath_eval('gmd:identificationInfo/srv:SV_ServiceIdentification', namespaces))
+        if val is None and val2 is not None:
+            return SV_ServiceIdentification(val2)
+        return None
 
-            if val is not None:
-                self.identification = MD_DataIdentification(val, 'dataset')
-                self.serviceidentification = None
-            elif val2 is not None:
-                self.identification = MD_DataIdentification(val2, 'service')
-                self.serviceidentification = SV_ServiceIdentification(val2)
-            else:
-                self.identification = None
-                self.serviceidentification = None
+    @util.cached_property
+    def identificationinfo(self):
+        identificationinfo = []
+        for idinfo in _paths.findall(self._md, 'gmd:identificationInfo'):
+            val = list(idinfo)[0]
+            tagval = util.xmltag_split(val.tag)
+            if tagval == 'MD_DataIdentification': 
+                identificationinfo.append(MD_DataIdentification(val, 'dataset'))
+            elif tagval == 'MD_ServiceIdentification': 
+                identificationinfo.append(MD_DataIdentification(val, 'service'))
+            elif tagval == 'SV_ServiceIdentification': 
+                identificationinfo.append(SV_ServiceIdentification(val))
+        return identificationinfo
+
+    @util.cached_property
+    def distribution(self):
+        val = _paths.find(self._md, 'gmd:distributionInfo/gmd:MD_Distribution')
 
-            self.identificationinfo = []
-            for idinfo in md.findall(util.nspath_eval('gmd:identificationInfo', namespaces)):
-                val = list(idinfo)[0]
-                tagval = util.xmltag_split(val.tag)
-                if tagval == 'MD_DataIdentification': 
-                    self.identificationinfo.append(MD_DataIdentification(val, 'dataset'))
-                elif tagval == 'MD_ServiceIdentification': 
-                    self.identificationinfo.append(MD_DataIdentification(val, 'service'))
-                elif tagval == 'SV_ServiceIdentification': 
-                    self.identificationinfo.append(SV_ServiceIdentification(val))
-
-            val = md.find(util.nspath_eval('gmd:distributionInfo/gmd:MD_Distribution', namespaces))
+        if val is not None:
+            return MD_Distribution(val)
+        return None
 
-            if val is not None:
-                self.distribution = MD_Distribution(val)
-            else:
-                self.distribution = None
-            
-            val = md.find(util.nspath_eval('gmd:dataQualityInfo/gmd:DQ_DataQuality', namespaces))
-            if val is not None:
-                self.dataquality = DQ_DataQuality(val)
-            else:
-                self.dataquality = None
+    @util.cached_property
+    def dataquality(self):
+        val = _paths.find(self._md, 'gmd:dataQualityInfo/gmd:DQ_DataQuality')
+        if val is not None:
+            return DQ_DataQuality(val)
+        return None
 
 class CI_Date(object):
     """ process CI_Date """
@@ -153,17 +200,17 @@ class CI_Date(object):
             self.date = None
             self.type = None
         else:
-            val = md.find(util.nspath_eval('gmd:date/gco:Date', namespaces))
+            val = _paths.find(md, 'gmd:date/gco:Date')
             if val is not None:
                 self.date = util.testXMLValue(val)
             else:
-                val = md.find(util.nspath_eval('gmd:date/gco:DateTime', namespaces))
+                val = _paths.find(md, 'gmd:date/gco:DateTime')
                 if val is not None:
                     self.date = util.testXMLValue(val)
                 else:
                     self.date = None
 
-            val = md.find(util.nspath_eval('gmd:dateType/gmd:CI_DateTypeCode', namespaces))
+            val = _paths.find(md, 'gmd:dateType/gmd:CI_DateTypeCode')
             self.type = _testCodeListValue(val)
 
 class CI_ResponsibleParty(object):
@@ -185,47 +232,47 @@ class CI_ResponsibleParty(object):
             self.onlineresource = None
             self.role = None
         else:
-            val = md.find(util.nspath_eval('gmd:individualName/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:individualName/gco:CharacterString')
             self.name = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:organisationName/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:organisationName/gco:CharacterString')
             self.organization = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:positionName/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:positionName/gco:CharacterString')
             self.position = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice/gco:CharacterString')
 
             self.phone = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:facsimile/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:facsimile/gco:CharacterString')
             self.fax = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString')
             self.address = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city/gco:CharacterString')
             self.city = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea/gco:CharacterString')
             self.region = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode/gco:CharacterString')
             self.postcode = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country/gco:CharacterString')
             self.country = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString')
             self.email = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource', namespaces))
+            val = _paths.find(md, 'gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource')
             if val is not None:
               self.onlineresource = CI_OnlineResource(val)
             else:
               self.onlineresource = None
           
-            self.role = _testCodeListValue(md.find(util.nspath_eval('gmd:role/gmd:CI_RoleCode', namespaces)))
+            self.role = _testCodeListValue(_paths.find(md, 'gmd:role/gmd:CI_RoleCode'))
 
 class MD_DataIdentification(object):
     """ process MD_DataIdentification """
@@ -266,185 +313,236 @@ class MD_DataIdentification(object):
             self.temporalextent_end = None
         else:
             self.identtype = identtype
-            val = md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
-            self.title = util.testXMLValue(val)
-            
-            val = md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:alternateTitle/gco:CharacterString', namespaces))
-            self.alternatetitle = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:aggregationInfo', namespaces))
-            self.aggregationinfo = util.testXMLValue(val)
-
-            self.uricode = []
-            for i in md.findall(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gco:CharacterString', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.uricode.append(val)
+            # sections are parsed from the element on first access
+            self._md = md
 
-            self.uricodespace = []
-            for i in md.findall(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.uricodespace.append(val)
+    def __getstate__(self):
+        return util.resolved_state(self, '_md')
 
-            self.date = []
-            self.datetype = []
-            
-            for i in md.findall(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:date/gmd:CI_Date', namespaces)):
-                self.date.append(CI_Date(i))
-            
-            self.uselimitation = []
-            for i in md.findall(util.nspath_eval('gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gco:CharacterString', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.uselimitation.append(val)
-            
-            self.accessconstraints = []
-            for i in md.findall(util.nspath_eval('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_RestrictionCode', namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.accessconstraints.append(val)
-            
-            self.classification = []
-            for i in md.findall(util.nspath_eval('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_ClassificationCode', namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.classification.append(val)
-            
-            self.otherconstraints = []
-            for i in md.findall(util.nspath_eval('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:otherConstraints/gco:CharacterString', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.otherconstraints.append(val)
-
-            self.securityconstraints = []
-            for i in md.findall(util.nspath_eval('gmd:resourceConstraints/gmd:MD_SecurityConstraints/gmd:classification/gmd:MD_ClassificationCode', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.securityconstraints.append(val)
-
-            self.useconstraints = []
-            for i in md.findall(util.nspath_eval('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useConstraints/gmd:MD_RestrictionCode', namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.useconstraints.append(val)
-            
-            self.denominators = []
-            for i in md.findall(util.nspath_eval('gmd:spatialResolution/gmd:MD_Resolution/gmd:equivalentScale/gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.denominators.append(val)
-            
-            self.distance = []
-            self.uom = []
-            for i in md.findall(util.nspath_eval('gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.distance.append(val)
-                self.uom.append(i.get("uom"))
-            
-            self.resourcelanguage = []
-            for i in md.findall(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces)):
-                val = _testCodeListValue(i)
+    def _findvalues(self, path, codelist=False):
+        values = []
+        for i in _paths.findall(self._md, path):
+            val = _testCodeListValue(i) if codelist else util.testXMLValue(i)
+            if val is not None:
+                values.append(val)
+        return values
+
+    @util.cached_property
+    def title(self):
+        val = _paths.find(self._md, 'gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def alternatetitle(self):
+        val = _paths.find(self._md, 'gmd:citation/gmd:CI_Citation/gmd:alternateTitle/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def aggregationinfo(self):
+        val = _paths.find(self._md, 'gmd:aggregationInfo')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def uricode(self):
+        return self._findvalues('gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gco:CharacterString')
+
+    @util.cached_property
+    def uricodespace(self):
+        return self._findvalues('gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString')
+
+    @util.cached_property
+    def date(self):
+        date = []
+        for i in _paths.findall(self._md, 'gmd:citation/gmd:CI_Citation/gmd:date/gmd:CI_Date'):
+            date.append(CI_Date(i))
+        return date
+
+    @util.cached_property
+    def datetype(self):
+        return []
+
+    @util.cached_property
+    def uselimitation(self):
+        return self._findvalues('gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gco:CharacterString')
+
+    @util.cached_property
+    def accessconstraints(self):
+        return self._findvalues('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_RestrictionCode', True)
+
+    @util.cached_property
+    def classification(self):
+        return self._findvalues('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_ClassificationCode', True)
+
+    @util.cached_property
+    def otherconstraints(self):
+        return self._findvalues('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:otherConstraints/gco:CharacterString')
+
+    @util.cached_property
+    def securityconstraints(self):
+        return self._findvalues('gmd:resourceConstraints/gmd:MD_SecurityConstraints/gmd:classification/gmd:MD_ClassificationCode')
+
+    @util.cached_property
+    def useconstraints(self):
+        return self._findvalues('gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useConstraints/gmd:MD_RestrictionCode', True)
+
+    @util.cached_property
+    def denominators(self):
+        return self._findvalues('gmd:spatialResolution/gmd:MD_Resolution/gmd:equivalentScale/gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer')
+
+    @util.cached_property
+    def distance(self):
+        return self._findvalues('gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance')
+
+    @util.cached_property
+    def uom(self):
+        uom = []
+        for i in _paths.findall(self._md, 'gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance'):
+            uom.append(i.get("uom"))
+        return uom
+
+    @util.cached_property
+    def resourcelanguage(self):
+        return self._findvalues('gmd:language/gmd:LanguageCode', True)
+
+    @util.cached_property
+    def _roles(self):
+        roles = {'originator': [], 'publisher': [], 'author': []}
+        for val in _paths.findall(self._md, 'gmd:pointOfContact/gmd:CI_ResponsibleParty'):
+            role = _paths.find(val, 'gmd:role/gmd:CI_RoleCode')
+            if role is not None:
+                clv = _testCodeListValue(role)
+                if clv in roles:
+                    roles[clv].append(CI_ResponsibleParty(val))
+        return roles
+
+    @util.cached_property
+    def creator(self):
+        return self._roles['originator']
+
+    @util.cached_property
+    def publisher(self):
+        return self._roles['publisher']
+
+    @util.cached_property
+    def contributor(self):
+        return self._roles['author']
+
+    @util.cached_property
+    def edition(self):
+        val = _paths.find(self._md, 'gmd:edition/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def abstract(self):
+        val = _paths.find(self._md, 'gmd:abstract/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def purpose(self):
+        val = _paths.find(self._md, 'gmd:purpose/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def status(self):
+        return _testCodeListValue(_paths.find(self._md, 'gmd:status/gmd:MD_ProgressCode'))
+
+    @util.cached_property
+    def contact(self):
+        contact = []
+        for i in _paths.findall(self._md, 'gmd:pointOfContact/gmd:CI_ResponsibleParty'):
+            o = CI_ResponsibleParty(i)
+            contact.append(o)
+        return contact
+
+    @util.cached_property
+    def keywords(self):
+        keywords = []
+
+        for i in _paths.findall(self._md, 'gmd:descriptiveKeywords'):
+            mdkw = {}
+            mdkw['type'] = _testCodeListValue(_paths.find(i, 'gmd:MD_Keywords/gmd:type/gmd:MD_KeywordTypeCode'))
+
+            mdkw['thesaurus'] = {}
+
+            val = _paths.find(i, 'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:title/gco:CharacterString')
+            mdkw['thesaurus']['title'] = util.testXMLValue(val)
+
+            val = _paths.find(i, 'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date')
+            mdkw['thesaurus']['date'] = util.testXMLValue(val)
+
+            val = _paths.find(i, 'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode')
+            mdkw['thesaurus']['datetype'] = util.testXMLValue(val)
+
+            mdkw['keywords'] = []
+
+            for k in _paths.findall(i, 'gmd:MD_Keywords/gmd:keyword'):
+                val = _paths.find(k, 'gco:CharacterString')
                 if val is not None:
-                    self.resourcelanguage.append(val)
-
-            self.creator = []
-            self.publisher = []
-            self.contributor = []
-            for val in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
-                role = val.find(util.nspath_eval('gmd:role/gmd:CI_RoleCode', namespaces))
-                if role is not None:
-                    clv = _testCodeListValue(role)
-                    rp = CI_ResponsibleParty(val)
-                    if clv == 'originator':
-                        self.creator.append(rp)
-                    elif clv == 'publisher':
-                        self.publisher.append(rp)
-                    elif clv == 'author':
-                        self.contributor.append(rp)
-
-            val = md.find(util.nspath_eval('gmd:edition/gco:CharacterString', namespaces))
-            self.edition = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:abstract/gco:CharacterString', namespaces))
-            self.abstract = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:purpose/gco:CharacterString', namespaces))
-            self.purpose = util.testXMLValue(val)
-
-            self.status = _testCodeListValue(md.find(util.nspath_eval('gmd:status/gmd:MD_ProgressCode', namespaces)))
-
-            self.contact = []
-            for i in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
-                o = CI_ResponsibleParty(i)
-                self.contact.append(o)
-            
-            self.keywords = []
-
-            for i in md.findall(util.nspath_eval('gmd:descriptiveKeywords', namespaces)):
-                mdkw = {}
-                mdkw['type'] = _testCodeListValue(i.find(util.nspath_eval('gmd:MD_Keywords/gmd:type/gmd:MD_KeywordTypeCode', namespaces)))
-
-                mdkw['thesaurus'] = {}
-
-                val = i.find(util.nspath_eval('gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
-                mdkw['thesaurus']['title'] = util.testXMLValue(val)
-
-                val = i.find(util.nspath_eval('gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date', namespaces))
-                mdkw['thesaurus']['date'] = util.testXMLValue(val)
-
-                val = i.find(util.nspath_eval('gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode', namespaces))
-                mdkw['thesaurus']['datetype'] = util.testXMLValue(val)
-
-                mdkw['keywords'] = []
+                    val2 = util.testXMLValue(val) 
+                    if val2 is not None:
+                        mdkw['keywords'].append(val2)
+
+            keywords.append(mdkw)
+        return keywords
+
+    @util.cached_property
+    def topiccategory(self):
+        return self._findvalues('gmd:topicCategory/gmd:MD_TopicCategoryCode')
+
+    @util.cached_property
+    def supplementalinformation(self):
+        val = _paths.find(self._md, 'gmd:supplementalInformation/gco:CharacterString')
+        return util.testXMLValue(val)
+
+    @util.cached_property
+    def _extents(self):
+        # There may be multiple geographicElement, create an extent
+        # from the one containing either an EX_GeographicBoundingBox or EX_BoundingPolygon.
+        # The schema also specifies an EX_GeographicDescription. This is not implemented yet.
+        extents = {'extent': None, 'temporalextent_start': None, 'temporalextent_end': None}
+        val = None
+        val2 = None
+        val3 = None
+        elems = _paths.findall(self._md, 'gmd:extent')
+        elems.extend(_paths.findall(self._md, 'srv:extent'))
+        for extent in elems:
+            if val is None:
+                for e in _paths.findall(extent, 'gmd:EX_Extent/gmd:geographicElement'):
+                    if _paths.find(e, 'gmd:EX_GeographicBoundingBox') is not None or _paths.find(e, 'gmd:EX_BoundingPolygon') is not None:
+                        val = e
+                        break
+                extents['extent'] = EX_Extent(val)
+
+            if val2 is None:
+                val2 = _paths.find(extent, 'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition')
+                if val2 is None:
+                    val2 = _paths.find(extent, 'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:beginPosition')
+                extents['temporalextent_start'] = util.testXMLValue(val2)
 
-                for k in i.findall(util.nspath_eval('gmd:MD_Keywords/gmd:keyword', namespaces)):
-                    val = k.find(util.nspath_eval('gco:CharacterString', namespaces))
-                    if val is not None:
-                        val2 = util.testXMLValue(val) 
-                        if val2 is not None:
-                            mdkw['keywords'].append(val2)
+            if val3 is None:
+                val3 = _paths.find(extent, 'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition')
+                if val3 is None:
+                    val3 = _paths.find(extent, 'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:endPosition')
+                extents['temporalextent_end'] = util.testXMLValue(val3)
+        return extents
 
-                self.keywords.append(mdkw)
+    @util.cached_property
+    def extent(self):
+        return self._extents['extent']
 
-            self.topiccategory = []
-            for i in md.findall(util.nspath_eval('gmd:topicCategory/gmd:MD_TopicCategoryCode', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.topiccategory.append(val)
-            
-            val = md.find(util.nspath_eval('gmd:supplementalInformation/gco:CharacterString', namespaces))
-            self.supplementalinformation = util.testXMLValue(val)
-            
-            # There may be multiple geographicElement, create an extent
-            # from the one containing either an EX_GeographicBoundingBox or EX_BoundingPolygon.
-            # The schema also specifies an EX_GeographicDescription. This is not implemented yet.
-            val = None
-            val2 = None
-            val3 = None
-            extents = md.findall(util.nspath_eval('gmd:extent', namespaces))
-            extents.extend(md.findall(util.nspath_eval('srv:extent', namespaces)))
-            for extent in extents:
-                if val is None:
-                    for e in extent.findall(util.nspath_eval('gmd:EX_Extent/gmd:geographicElement', namespaces)):
-                        if e.find(util.nspath_eval('gmd:EX_GeographicBoundingBox', namespaces)) is not None or e.find(util.nspath_eval('gmd:EX_BoundingPolygon', namespaces)) is not None:
-                            val = e
-                            break
-                    self.extent = EX_Extent(val)
-                    self.bbox = self.extent.boundingBox  # for backwards compatibility
+    @util.cached_property
+    def bbox(self):
+        if self.extent is None:
+            return None
+        return self.extent.boundingBox  # for backwards compatibility
 
-                if val2 is None:
-                    val2 = extent.find(util.nspath_eval('gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition', namespaces))
-                    if val2 is None:
-                        val2 = extent.find(util.nspath_eval('gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:beginPosition', namespaces))
-                    self.temporalextent_start = util.testXMLValue(val2)
+    @util.cached_property
+    def temporalextent_start(self):
+        return self._extents['temporalextent_start']
 
-                if val3 is None:
-                    val3 = extent.find(util.nspath_eval('gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition', namespaces))
-                    if val3 is None:
-                        val3 = extent.find(util.nspath_eval('gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:endPosition', namespaces))
-                    self.temporalextent_end = util.testXMLValue(val3)
+    @util.cached_property
+    def temporalextent_end(self):
+        return self._extents['temporalextent_end']
 
 class MD_Distributor(object):        
     """ process MD_Distributor """
@@ -454,13 +552,13 @@ class MD_Distributor(object):
             self.online = []
         else:
             self.contact = None
-            val = md.find(util.nspath_eval('gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty', namespaces))
+            val = _paths.find(md, 'gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty')
             if val is not None:
                 self.contact = CI_ResponsibleParty(val)
 
             self.online = []
 
-            for ol in md.findall(util.nspath_eval('gmd:MD_Distributor/gmd:distributorTransferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource', namespaces)):
+            for ol in _paths.findall(md, 'gmd:MD_Distributor/gmd:distributorTransferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource'):
                 self.online.append(CI_OnlineResource(ol))
 
 class MD_Distribution(object):
@@ -473,19 +571,19 @@ class MD_Distribution(object):
             self.online = []
             pass
         else:
-            val = md.find(util.nspath_eval('gmd:distributionFormat/gmd:MD_Format/gmd:name/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:distributionFormat/gmd:MD_Format/gmd:name/gco:CharacterString')
             self.format = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:distributionFormat/gmd:MD_Format/gmd:version/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:distributionFormat/gmd:MD_Format/gmd:version/gco:CharacterString')
             self.version = util.testXMLValue(val)
 
             self.distributor = []
-            for dist in md.findall(util.nspath_eval('gmd:distributor', namespaces)):
+            for dist in _paths.findall(md, 'gmd:distributor'):
                 self.distributor.append(MD_Distributor(dist))
 
             self.online = []
 
-            for ol in md.findall(util.nspath_eval('gmd:transferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource', namespaces)):
+            for ol in _paths.findall(md, 'gmd:transferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource'):
                 self.online.append(CI_OnlineResource(ol))
 
         
@@ -502,37 +600,37 @@ class DQ_DataQuality(object):
             self.specificationdate = []
         else:
             self.conformancetitle = []
-            for i in md.findall(util.nspath_eval('gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces)):
+            for i in _paths.findall(md, 'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:title/gco:CharacterString'):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.conformancetitle.append(val)
             
             self.conformancedate = []
-            for i in md.findall(util.nspath_eval('gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date', namespaces)):
+            for i in _paths.findall(md, 'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date'):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.conformancedate.append(val)
             
             self.conformancedatetype = []
-            for i in md.findall(util.nspath_eval('gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode', namespaces)):
+            for i in _paths.findall(md, 'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode'):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.conformancedatetype.append(val)
             
             self.conformancedegree = []
-            for i in md.findall(util.nspath_eval('gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:pass/gco:Boolean', namespaces)):
+            for i in _paths.findall(md, 'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:pass/gco:Boolean'):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.conformancedegree.append(val)
             
-            val = md.find(util.nspath_eval('gmd:lineage/gmd:LI_Lineage/gmd:statement/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:lineage/gmd:LI_Lineage/gmd:statement/gco:CharacterString')
             self.lineage = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:title/gco:CharacterString')
             self.specificationtitle = util.testXMLValue(val)
 
             self.specificationdate = []
-            for i in md.findall(util.nspath_eval('gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date', namespaces)):
+            for i in _paths.findall(md, 'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date'):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.specificationdate.append(val)
@@ -553,57 +651,57 @@ class SV_ServiceIdentification(object):
             self.operations = []
             self.operateson = []
         else:
-            val=md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
+            val=_paths.find(md, 'gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString')
             self.title=util.testXMLValue(val)
             
-            val=md.find(util.nspath_eval('gmd:abstract/gco:CharacterString', namespaces))
+            val=_paths.find(md, 'gmd:abstract/gco:CharacterString')
             self.abstract=util.testXMLValue(val)
             
             self.contact = None
-            val = md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty', namespaces))
+            val = _paths.find(md, 'gmd:citation/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty')
             if val is not None:
                 self.contact = CI_ResponsibleParty(val)
             
             self.identtype = 'service'
-            val = md.find(util.nspath_eval('srv:serviceType/gco:LocalName', namespaces))
+            val = _paths.find(md, 'srv:serviceType/gco:LocalName')
             self.type = util.testXMLValue(val)
           
-            val = md.find(util.nspath_eval('srv:serviceTypeVersion/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'srv:serviceTypeVersion/gco:CharacterString')
             self.version = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('srv:accessProperties/gmd:MD_StandardOrderProcess/gmd:fees/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'srv:accessProperties/gmd:MD_StandardOrderProcess/gmd:fees/gco:CharacterString')
             self.fees = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('srv:extent/gmd:EX_Extent', namespaces))
+            val = _paths.find(md, 'srv:extent/gmd:EX_Extent')
 
             if val is not None:
                 self.bbox = EX_Extent(val)
             else:
                 self.bbox = None
 
-            self.couplingtype = _testCodeListValue(md.find(util.nspath_eval('gmd:couplingType/gmd:SV_CouplingType', namespaces)))
+            self.couplingtype = _testCodeListValue(_paths.find(md, 'gmd:couplingType/gmd:SV_CouplingType'))
 
             self.operations = []
 
-            for i in md.findall(util.nspath_eval('srv:containsOperations', namespaces)):
+            for i in _paths.findall(md, 'srv:containsOperations'):
                 tmp = {}
-                val = i.find(util.nspath_eval('srv:SV_OperationMetadata/srv:operationName/gco:CharacterString', namespaces))
+                val = _paths.find(i, 'srv:SV_OperationMetadata/srv:operationName/gco:CharacterString')
                 tmp['name'] = util.testXMLValue(val)
                 tmp['dcplist'] = []
-                for d in i.findall(util.nspath_eval('srv:SV_OperationMetadata/srv:DCP', namespaces)):
-                    tmp2 = _testCodeListValue(d.find(util.nspath_eval('srv:DCPList', namespaces)))
+                for d in _paths.findall(i, 'srv:SV_OperationMetadata/srv:DCP'):
+                    tmp2 = _testCodeListValue(_paths.find(d, 'srv:DCPList'))
                     tmp['dcplist'].append(tmp2)
              
                 tmp['connectpoint'] = []
      
-                for d in i.findall(util.nspath_eval('srv:SV_OperationMetadata/srv:connectPoint', namespaces)):
-                    tmp3 = d.find(util.nspath_eval('gmd:CI_OnlineResource', namespaces))
+                for d in _paths.findall(i, 'srv:SV_OperationMetadata/srv:connectPoint'):
+                    tmp3 = _paths.find(d, 'gmd:CI_OnlineResource')
                     tmp['connectpoint'].append(CI_OnlineResource(tmp3))
                 self.operations.append(tmp)
 
             self.operateson = []
              
-            for i in md.findall(util.nspath_eval('srv:operatesOn', namespaces)):
+            for i in _paths.findall(md, 'srv:operatesOn'):
                 tmp = {}
                 tmp['uuidref'] = i.attrib.get('uuidref')
                 tmp['href'] = i.attrib.get(util.nspath_eval('xlink:href', namespaces))
@@ -620,19 +718,19 @@ class CI_OnlineResource(object):
             self.description = None
             self.function = None
         else:
-            val = md.find(util.nspath_eval('gmd:linkage/gmd:URL', namespaces))
+            val = _paths.find(md, 'gmd:linkage/gmd:URL')
             self.url = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:protocol/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:protocol/gco:CharacterString')
             self.protocol = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:name/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:name/gco:CharacterString')
             self.name = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:description/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:description/gco:CharacterString')
             self.description = util.testXMLValue(val)
 
-            self.function = _testCodeListValue(md.find(util.nspath_eval('gmd:function/gmd:CI_OnLineFunctionCode', namespaces)))
+            self.function = _testCodeListValue(_paths.find(md, 'gmd:function/gmd:CI_OnLineFunctionCode'))
 
 
 class EX_GeographicBoundingBox(object):
@@ -643,13 +741,13 @@ class EX_GeographicBoundingBox(object):
             self.miny = None
             self.maxy = None
         else:
-            val = md.find(util.nspath_eval('gmd:westBoundLongitude/gco:Decimal', namespaces))
+            val = _paths.find(md, 'gmd:westBoundLongitude/gco:Decimal')
             self.minx = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gmd:eastBoundLongitude/gco:Decimal', namespaces))
+            val = _paths.find(md, 'gmd:eastBoundLongitude/gco:Decimal')
             self.maxx = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gmd:southBoundLatitude/gco:Decimal', namespaces))
+            val = _paths.find(md, 'gmd:southBoundLatitude/gco:Decimal')
             self.miny = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gmd:northBoundLatitude/gco:Decimal', namespaces))
+            val = _paths.find(md, 'gmd:northBoundLatitude/gco:Decimal')
             self.maxy = util.testXMLValue(val)
     
 class EX_Polygon(object):
@@ -658,19 +756,19 @@ class EX_Polygon(object):
             self.exterior_ring = None
             self.interior_rings = []
         else:
-            linear_ring = md.find(util.nspath_eval('gml32:Polygon/gml32:exterior/gml32:LinearRing', namespaces))
+            linear_ring = _paths.find(md, 'gml32:Polygon/gml32:exterior/gml32:LinearRing')
             if linear_ring is not None:
                 self.exterior_ring = self._coordinates_for_ring(linear_ring)
                         
-            interior_ring_elements = md.findall(util.nspath_eval('gml32:Polygon/gml32:interior', namespaces))
+            interior_ring_elements = _paths.findall(md, 'gml32:Polygon/gml32:interior')
             self.interior_rings = []
             for iring_element in interior_ring_elements:
-                linear_ring = iring_element.find(util.nspath_eval('gml32:LinearRing', namespaces))
+                linear_ring = _paths.find(iring_element, 'gml32:LinearRing')
                 self.interior_rings.append(self._coordinates_for_ring(linear_ring))
             
     def _coordinates_for_ring(self, linear_ring):
         coordinates = []
-        positions = linear_ring.findall(util.nspath_eval('gml32:pos', namespaces))
+        positions = _paths.findall(linear_ring, 'gml32:pos')
         for pos in positions:
             tokens = pos.text.split()
             coords = tuple([float(t) for t in tokens])
@@ -683,10 +781,10 @@ class EX_GeographicBoundingPolygon(object):
             self.is_extent = None
             self.polygons = []
         else:
-            val = md.find(util.nspath_eval('gmd:extentTypeCode', namespaces))
+            val = _paths.find(md, 'gmd:extentTypeCode')
             self.is_extent = util.testXMLValue(val)
             
-            md_polygons = md.findall(util.nspath_eval('gmd:polygon', namespaces))
+            md_polygons = _paths.findall(md, 'gmd:polygon')
             
             self.polygons = []
             for val in md_polygons:
@@ -704,15 +802,15 @@ class EX_Extent(object):
             self.boundingPolygon = None
 
             if md is not None:
-                bboxElement = md.find(util.nspath_eval('gmd:EX_GeographicBoundingBox', namespaces))
+                bboxElement = _paths.find(md, 'gmd:EX_GeographicBoundingBox')
                 if bboxElement is not None:
                     self.boundingBox = EX_GeographicBoundingBox(bboxElement)
             
-                polygonElement = md.find(util.nspath_eval('gmd:EX_BoundingPolygon', namespaces))
+                polygonElement = _paths.find(md, 'gmd:EX_BoundingPolygon')
                 if polygonElement is not None:
                     self.boundingPolygon = EX_GeographicBoundingPolygon(polygonElement)
      
-                val = md.find(util.nspath_eval('gmd:EX_GeographicDescription/gmd:geographicIdentifier/gmd:MD_Identifier/gmd:code/gco:CharacterString', namespaces))
+                val = _paths.find(md, 'gmd:EX_GeographicDescription/gmd:geographicIdentifier/gmd:MD_Identifier/gmd:code/gco:CharacterString')
                 self.description_code = util.testXMLValue(val)
 
 class MD_ReferenceSystem(object):
@@ -723,19 +821,19 @@ class MD_ReferenceSystem(object):
             self.codeSpace = None
             self.version = None
         else:
-            val = md.find(util.nspath_eval('gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:code/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:code/gco:CharacterString')
             if val is not None:
                 self.code = util.testXMLValue(val)
             else:
                 self.code = None
 
-            val = md.find(util.nspath_eval('gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString')
             if val is not None:
                 self.codeSpace = util.testXMLValue(val)
             else:
                 self.codeSpace = None
 
-            val = md.find(util.nspath_eval('gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:version/gco:CharacterString', namespaces))
+            val = _paths.find(md, 'gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:version/gco:CharacterString')
             if val is not None:
                 self.version = util.testXMLValue(val)
             else:
@@ -755,38 +853,38 @@ def _testCodeListValue(elpath):
 class CodelistCatalogue(object):
     """ process CT_CodelistCatalogue """
     def __init__(self, ct):
-        val = ct.find(util.nspath_eval('gmx:name/gco:CharacterString', namespaces))
+        val = _paths.find(ct, 'gmx:name/gco:CharacterString')
         self.name = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:scope/gco:CharacterString', namespaces))
+        val = _paths.find(ct, 'gmx:scope/gco:CharacterString')
         self.scope = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:fieldOfApplication/gco:CharacterString', namespaces))
+        val = _paths.find(ct, 'gmx:fieldOfApplication/gco:CharacterString')
         self.fieldapp = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:versionNumber/gco:CharacterString', namespaces))
+        val = _paths.find(ct, 'gmx:versionNumber/gco:CharacterString')
         self.version = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:versionDate/gco:Date', namespaces))
+        val = _paths.find(ct, 'gmx:versionDate/gco:Date')
         self.date = util.testXMLValue(val)
 
         self.dictionaries = {}
 
-        for i in ct.findall(util.nspath_eval('gmx:codelistItem/gmx:CodeListDictionary', namespaces)):
+        for i in _paths.findall(ct, 'gmx:codelistItem/gmx:CodeListDictionary'):
             id = i.attrib.get(util.nspath_eval('gml32:id', namespaces))
             self.dictionaries[id] = {}
-            val = i.find(util.nspath_eval('gml32:description', namespaces))
+            val = _paths.find(i, 'gml32:description')
             self.dictionaries[id]['description'] = util.testXMLValue(val)
-            val = i.find(util.nspath_eval('gml32:identifier', namespaces))
+            val = _paths.find(i, 'gml32:identifier')
             self.dictionaries[id]['identifier'] = util.testXMLValue(val)
             self.dictionaries[id]['entries'] = {}
 
-            for j in i.findall(util.nspath_eval('gmx:codeEntry', namespaces)):
-                id2 = j.find(util.nspath_eval('gmx:CodeDefinition', namespaces)).attrib.get(util.nspath_eval('gml32:id', namespaces))
+            for j in _paths.findall(i, 'gmx:codeEntry'):
+                id2 = _paths.find(j, 'gmx:CodeDefinition').attrib.get(util.nspath_eval('gml32:id', namespaces))
                 self.dictionaries[id]['entries'][id2] = {}
-                val = j.find(util.nspath_eval('gmx:CodeDefinition/gml32:description', namespaces))
+                val = _paths.find(j, 'gmx:CodeDefinition/gml32:description')
                 self.dictionaries[id]['entries'][id2]['description'] = util.testXMLValue(val)
 
-                val = j.find(util.nspath_eval('gmx:CodeDefinition/gml32:identifier', namespaces))
+                val = _paths.find(j, 'gmx:CodeDefinition/gml32:identifier')
                 self.dictionaries[id]['entries'][id2]['identifier'] = util.testXMLValue(val)
 
-                val = j.find(util.nspath_eval('gmx:CodeDefinition', namespaces)).attrib.get('codeSpace')
+                val = _paths.find(j, 'gmx:CodeDefinition').attrib.get('codeSpace')
                 self.dictionaries[id]['entries'][id2]['codespace'] = util.testXMLValue(val, True)
 
     def getcodelistdictionaries(self):
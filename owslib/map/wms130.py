@@ -57,8 +57,7 @@ class WebMapService_1_3_0(object):
         else:  # read from server
             self._capabilities = reader.read(self.url, timeout=self.timeout)
 
-        print("1.3.0 CAPABILITIES OF", self.url)
-        print("  ",self._capabilities)
+        log.debug('1.3.0 capabilities of %s: %s' % (self.url, self._capabilities))
 
         # avoid building capabilities metadata if the
         # response is a ServiceExceptionReport
@@ -262,12 +261,12 @@ class WebMapService_1_3_0(object):
 
         if True:
             d = dict()
-            for k,v in request.iteritems():
+            for k,v in six.iteritems(request):
                 d[k.upper()] = v
             request = d
 
         data = urlencode(request)
-        print ("URL: ", data)
+        log.debug('GetMap request: %s' % data)
 
         u = openURL(base_url,
                     data,
@@ -0,0 +1,222 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+""" Local SQLite mirror of a CSW catalogue, synced incrementally """
+
+from __future__ import (absolute_import, division, print_function)
+
+import sqlite3
+
+from owslib.etree import etree
+from owslib import fes
+from owslib.csw import namespaces
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    identifier TEXT PRIMARY KEY,
+    title TEXT,
+    modified TEXT,
+    date TEXT,
+    minx REAL,
+    miny REAL,
+    maxx REAL,
+    maxy REAL,
+    xml BLOB
+);
+CREATE INDEX IF NOT EXISTS records_title ON records (title);
+CREATE INDEX IF NOT EXISTS records_modified ON records (modified);
+CREATE INDEX IF NOT EXISTS records_date ON records (date);
+CREATE INDEX IF NOT EXISTS records_x ON records (minx, maxx);
+CREATE INDEX IF NOT EXISTS records_y ON records (miny, maxy);
+CREATE TABLE IF NOT EXISTS watermarks (
+    url TEXT,
+    outputschema TEXT,
+    constraints TEXT,
+    modified TEXT,
+    PRIMARY KEY (url, outputschema, constraints)
+);
+"""
+
+# queryables of the modification date of records, per output schema
+MODIFIED = {
+    namespaces['csw']: ('csw:Record', 'dct:modified'),
+    namespaces['gmd']: ('gmd:MD_Metadata', 'apiso:Modified'),
+}
+
+
+class CatalogueMirror(object):
+    """
+
+    Local mirror of the records of a CatalogueServiceWeb, stored in a
+    SQLite database
+
+    Syncs request the records modified since the newest modification date
+    of the records already mirrored by previous syncs with the same
+    constraints, their watermark.  Local queries answer from indexed
+    columns of the records, without requests to the catalogue.
+
+    Parameters
+    ----------
+
+    - csw: the CatalogueServiceWeb to mirror
+    - database: the path of the SQLite database (default is ':memory:')
+    - outputschema: the schema of the records, Dublin Core (default) or ISO 19139
+
+    """
+
+    def __init__(self, csw, database=':memory:', outputschema=namespaces['csw']):
+        if outputschema not in MODIFIED:
+            raise ValueError('Unsupported outputschema: %s' % outputschema)
+        self.csw = csw
+        self.outputschema = outputschema
+        self.typenames, self.modified = MODIFIED[outputschema]
+        self.db = sqlite3.connect(database)
+        self.db.executescript(SCHEMA)
+
+    @property
+    def watermark(self):
+        """ The watermark of syncs without constraints, or None """
+        return self.getwatermark()
+
+    def getwatermark(self, constraints=[]):
+        """ Return the newest modification date of the records mirrored by
+        syncs with the given constraints, or None """
+        row = self.db.execute('SELECT modified FROM watermarks WHERE url = ? AND outputschema = ? '
+                              'AND constraints = ?', (self.csw.url, self.outputschema,
+                                                      self._constraintkey(constraints))).fetchone()
+        return row[0] if row else None
+
+    def _constraintkey(self, constraints):
+        """ Return the filter of a constraint list, which keys its watermark """
+        if not constraints:
+            return ''
+        flt = fes.FilterRequest().setConstraintList(constraints, tostring=True)
+        return flt.decode('utf-8') if isinstance(flt, bytes) else flt
+
+    def sync(self, constraints=[], full=False, pagesize=100, workers=4):
+        """
+
+        Store the records of the catalogue modified since the watermark
+        of the constraints, and return their number.  Records are replaced
+        by identifier, and the watermark moved to the newest modification
+        date, in a single transaction
+
+        Every constraint set has its own watermark, so that syncs of some
+        records do not skip the others in later syncs.  Records deleted
+        from the catalogue are only removed by full syncs, which replace
+        all the mirrored records and reset every watermark.
+
+        Parameters
+        ----------
+
+        - constraints: list of fes filters of the records to mirror, as in getrecords2
+        - full: whether to request all the records, ignoring the watermark (default is False)
+        - pagesize, workers: as in CatalogueServiceWeb.iterrecords
+
+        """
+
+        key = self._constraintkey(constraints)
+        watermark = None if full else self.getwatermark(constraints)
+        if watermark is not None:
+            since = fes.PropertyIsGreaterThanOrEqualTo(self.modified, watermark)
+            # the watermark is and-ed with every or-ed constraint
+            constraints = [[since] + (list(c) if isinstance(c, (list, tuple)) else [c])
+                           for c in constraints] or [since]
+        sortby = fes.SortBy([fes.SortProperty(self.modified, 'ASC')])
+
+        count = 0
+        with self.db:
+            if full:
+                self.db.execute('DELETE FROM records')
+                self.db.execute('DELETE FROM watermarks WHERE url = ? AND outputschema = ?',
+                                (self.csw.url, self.outputschema))
+            for identifier, record in self.csw.iterrecords(
+                    constraints=constraints, sortby=sortby, typenames=self.typenames, esn='full',
+                    outputschema=self.outputschema, pagesize=pagesize, workers=workers):
+                row = self._row(identifier, record)
+                self.db.execute('INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+                if row[2] is not None and (watermark is None or row[2] > watermark):
+                    watermark = row[2]
+                count += 1
+            if watermark is not None:
+                self.db.execute('INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)',
+                                (self.csw.url, self.outputschema, key, watermark))
+        return count
+
+    def _row(self, identifier, record):
+        """ Return the indexed columns and the XML of a record """
+        if self.outputschema == namespaces['gmd']:
+            identification = record.identification
+            title = getattr(identification, 'title', None)
+            modified = record.datestamp
+            dates = getattr(identification, 'date', None) or []
+            date = dates[0].date if dates else None
+            bbox = getattr(identification, 'bbox', None)
+        else:
+            title, modified, date, bbox = record.title, record.modified, record.date, record.bbox
+        try:
+            coords = [float(getattr(bbox, k)) for k in ('minx', 'miny', 'maxx', 'maxy')]
+        except (TypeError, ValueError):
+            coords = [None] * 4
+        return [identifier, title, modified, date] + coords + [sqlite3.Binary(record.xml)]
+
+    def _record(self, xml):
+        return self.csw._parserecord(etree.fromstring(bytes(xml)), self.outputschema)[1]
+
+    def query(self, title=None, bbox=None, modifiedfrom=None, modifiedto=None,
+              datefrom=None, dateto=None, limit=None):
+        """
+
+        Query the mirrored records, yielding (identifier, record) tuples
+        ordered by identifier, with records parsed from their stored XML
+
+        Parameters
+        ----------
+
+        - title: text contained in the title, case insensitive for ASCII
+        - bbox: the bounding box the records intersect, as [minx,miny,maxx,maxy]
+        - modifiedfrom, modifiedto: the range of modification dates, inclusive
+        - datefrom, dateto: the range of dates, inclusive
+        - limit: the maximum number of records (default is None, all of them)
+
+        """
+
+        where, params = [], []
+        if title is not None:
+            where.append('title LIKE ?')
+            params.append('%%%s%%' % title)
+        if bbox is not None:
+            where.append('minx <= ? AND maxx >= ? AND miny <= ? AND maxy >= ?')
+            params.extend([bbox[2], bbox[0], bbox[3], bbox[1]])
+        for column, operator, value in (('modified', '>=', modifiedfrom), ('modified', '<=', modifiedto),
+                                        ('date', '>=', datefrom), ('date', '<=', dateto)):
+            if value is not None:
+                where.append('%s %s ?' % (column, operator))
+                params.append(value)
+        sql = 'SELECT identifier, xml FROM records'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY identifier'
+        if limit is not None:
+            sql += ' LIMIT %d' % limit
+        for identifier, xml in self.db.execute(sql, params):
+            yield identifier, self._record(xml)
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM records').fetchone()[0]
+
+    def __contains__(self, identifier):
+        return self.db.execute('SELECT 1 FROM records WHERE identifier = ?', (identifier,)).fetchone() is not None
+
+    def __getitem__(self, identifier):
+        row = self.db.execute('SELECT xml FROM records WHERE identifier = ?', (identifier,)).fetchone()
+        if row is None:
+            raise KeyError(identifier)
+        return self._record(row[0])
+
+    def close(self):
+        self.db.close()
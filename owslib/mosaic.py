@@ -0,0 +1,213 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+"""
+Assembly of WMTS and TMS tiles into a single NumPy array covering a
+bounding box.
+
+Tiles are fetched concurrently and decoded straight into a preallocated
+array, cropped to the pixel window of the requested bounding box.  The
+array is returned together with its affine transform, given as the six
+coefficients (a, b, c, d, e, f) mapping a (column, row) pixel position
+to x = a * column + b * row + c and y = d * column + e * row + f.
+
+NumPy is required.  Pillow is used to decode tiles unless a decode
+callable is supplied.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+import math
+import requests
+from six import BytesIO
+from owslib.crs import Crs
+from owslib.util import threaded_map, ServiceException
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# standardized rendering pixel size in meters (WMTS 1.0.0, 6.1)
+_PIXEL_SIZE = 0.00028
+
+# meters per unit of geographic CRSs (WMTS 1.0.0, Annex E)
+_METERS_PER_DEGREE = 6378137 * 2 * math.pi / 360
+
+_GEOGRAPHIC_CODES = frozenset([4326, 4258, 4267, 4269, 'CRS84', 'CRS83', 'CRS27'])
+
+# tolerance, in pixels, when snapping a bounding box to the pixel grid
+_EPSILON = 1e-6
+
+
+class TileGrid(object):
+    """Pixel geometry of one zoom level of a tiled map
+
+    Rows are counted downwards from the top left origin and columns to the
+    right, both in whole tiles.  limits is an optional
+    (minrow, maxrow, mincol, maxcol) tuple of the tiles that exist, where
+    None means unbounded.
+    """
+
+    def __init__(self, origin, resolution, tilewidth, tileheight, limits=None):
+        self.origin = origin
+        self.resolution = resolution
+        self.tilewidth = tilewidth
+        self.tileheight = tileheight
+        self.limits = limits or (None, None, None, None)
+
+    def window(self, bbox):
+        """Return the (firstrow, lastrow, firstcol, lastcol) pixel window,
+        end exclusive, covering bbox (minx, miny, maxx, maxy)"""
+        ox, oy = self.origin
+        res = self.resolution
+        c0 = int(math.floor((bbox[0] - ox) / res + _EPSILON))
+        c1 = int(math.ceil((bbox[2] - ox) / res - _EPSILON))
+        r0 = int(math.floor((oy - bbox[3]) / res + _EPSILON))
+        r1 = int(math.ceil((oy - bbox[1]) / res - _EPSILON))
+        if c1 <= c0 or r1 <= r0:
+            raise ValueError('bbox %s is empty at resolution %s' % (bbox, res))
+        return r0, r1, c0, c1
+
+    def tiles(self, window):
+        """Return the (row, column) indices of the tiles covering a pixel window"""
+        r0, r1, c0, c1 = window
+        minrow, maxrow, mincol, maxcol = self.limits
+        rows = range(r0 // self.tileheight, (r1 - 1) // self.tileheight + 1)
+        cols = range(c0 // self.tilewidth, (c1 - 1) // self.tilewidth + 1)
+        return [(row, col) for row in rows for col in cols
+                if (minrow is None or row >= minrow) and
+                   (maxrow is None or row <= maxrow) and
+                   (mincol is None or col >= mincol) and
+                   (maxcol is None or col <= maxcol)]
+
+    def locate(self, x, y):
+        """Return the (row, column, i, j) tile and pixel within the tile
+        containing point x, y, or None when it lies outside the grid"""
+        ox, oy = self.origin
+        column = int(math.floor((x - ox) / self.resolution))
+        row = int(math.floor((oy - y) / self.resolution))
+        tile = (row // self.tileheight, column // self.tilewidth)
+        if not self.tiles((row, row + 1, column, column + 1)):
+            return None
+        return tile + (column % self.tilewidth, row % self.tileheight)
+
+
+def wmts_grid(tilematrixset, tilematrix, limits=None):
+    """Return the TileGrid of a WMTS TileMatrix
+
+    tilematrixset and tilematrix are owslib.wmts TileMatrixSet and
+    TileMatrix instances, limits an optional owslib.wmts TileMatrixLimits.
+    """
+    crs = Crs(tilematrixset.crs)
+    resolution = tilematrix.scaledenominator * _PIXEL_SIZE
+    if crs.code in _GEOGRAPHIC_CODES:
+        resolution /= _METERS_PER_DEGREE
+    x, y = tilematrix.topleftcorner
+    if crs.axisorder == 'yx':
+        x, y = y, x
+    if limits is not None:
+        bounds = (limits.mintilerow, limits.maxtilerow,
+                  limits.mintilecol, limits.maxtilecol)
+    else:
+        bounds = (0, tilematrix.matrixheight - 1, 0, tilematrix.matrixwidth - 1)
+    return TileGrid((x, y), resolution, tilematrix.tilewidth,
+                    tilematrix.tileheight, bounds)
+
+
+def tms_grid(tilemap, tileset):
+    """Return the TileGrid of one TileSet of a TMS TileMap
+
+    TMS tiles are numbered upwards from a bottom left origin, so the TMS
+    tile y index of grid row r is -r - 1.
+    """
+    return TileGrid(tilemap.origin, tileset['units-per-pixel'],
+                    tilemap.width, tilemap.height, (None, -1, 0, None))
+
+
+def missing_tile(error):
+    """Return whether an error fetching a tile means the tile does not
+    exist: a 404 response, or a WMTS TileOutOfRange exception, raised by
+    openURL or by WebMapTileService with its exception report"""
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code == 404
+    if not isinstance(error, ServiceException):
+        return False
+    report = getattr(error, 'xml', None) or b''
+    if not isinstance(report, bytes):
+        report = report.encode('utf-8')
+    return 'TileOutOfRange' in str(error) or b'TileOutOfRange' in report
+
+
+def decode_image(data, mode='RGBA'):
+    """Decode an encoded tile image into a (height, width, bands) array using Pillow"""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError('Pillow is required to decode tiles, '
+                           'alternatively pass a decode callable')
+    image = Image.open(BytesIO(data))
+    if image.mode != mode:
+        image = image.convert(mode)
+    array = np.asarray(image)
+    if array.ndim == 2:
+        array = array[:, :, np.newaxis]
+    return array
+
+
+def assemble(grid, bbox, fetch, decode=None, mode='RGBA', workers=8):
+    """Fetch and decode the tiles of grid covering bbox into one array
+
+    Parameters
+    ----------
+    grid : TileGrid
+        Geometry of the zoom level to read.
+    bbox : tuple
+        (minx, miny, maxx, maxy) in the CRS of the grid.
+    fetch : callable
+        fetch(row, column) returning the encoded tile, or None when the
+        tile is missing, as told by missing_tile.
+    decode : callable
+        Optional decode(data, mode) returning a (height, width, bands)
+        array.  Defaults to decoding with Pillow.
+    mode : string
+        Pillow image mode of the result, such as 'RGBA', 'RGB' or 'L'.
+        The number of bands is the length of the mode.
+    workers : int
+        Number of tiles fetched and decoded concurrently.
+
+    Returns a (array, transform) tuple.  Pixels of missing tiles are 0.
+    """
+    if np is None:
+        raise RuntimeError('NumPy is required to assemble tile mosaics')
+    decode = decode or decode_image
+    window = grid.window(bbox)
+    r0, r1, c0, c1 = window
+    height, width = r1 - r0, c1 - c0
+    th, tw = grid.tileheight, grid.tilewidth
+    out = np.zeros((height, width, len(mode)), dtype=np.uint8)
+
+    def paste(tile):
+        row, col = tile
+        data = fetch(row, col)
+        if data is None:
+            return
+        array = decode(data, mode)
+        top, left = row * th - r0, col * tw - c0
+        sy0, sy1 = max(0, -top), min(th, height - top)
+        sx0, sx1 = max(0, -left), min(tw, width - left)
+        # tiles cover disjoint parts of the output, so workers can write
+        # without locking
+        out[top + sy0:top + sy1, left + sx0:left + sx1] = array[sy0:sy1, sx0:sx1]
+
+    for _ in threaded_map(paste, grid.tiles(window), workers, ordered=False):
+        pass
+
+    res = grid.resolution
+    ox, oy = grid.origin
+    transform = (res, 0.0, ox + c0 * res, 0.0, -res, oy - r0 * res)
+    return out, transform
@@ -17,8 +17,10 @@
 
 from __future__ import (absolute_import, division, print_function)
 
+import threading
 from .etree import etree
-from .util import openURL, testXMLValue, ServiceException
+from .util import openURL, testXMLValue, ServiceException, threaded_map, log
+from . import mosaic
 
 
 FORCE900913 = False
@@ -50,6 +52,8 @@ class TileMapService(object):
         self.services = None
         self._capabilities = None
         self.contents={}
+        # TileMaps resolved so far, keyed by href
+        self.tilemaps = {}
 
         # Authentication handled by Reader
         reader = TMSCapabilitiesReader(
@@ -80,14 +84,20 @@ class TileMapService(object):
         self.identification=ServiceIdentification(self._capabilities, self.version)
 
         self.contents={}
+        # lookup indexes for gettile: (title, srs) -> contents in document
+        # order, and (title, srs, mimetype) -> TileMap once resolved
+        self._titleindex = {}
+        self._tilemapindex = {}
         tilemaps = self._capabilities.find('TileMaps')
         if tilemaps is not None:
             for tilemap in tilemaps.findall('TileMap'):
-                cm = ContentMetadata(tilemap, un=self.username, pw=self.password)
+                cm = ContentMetadata(tilemap, un=self.username, pw=self.password,
+                                     cache=self.tilemaps, timeout=self.timeout)
                 if cm.id:
                     if cm.id in self.contents:
                         raise KeyError('Content metadata for layer "%s" already exists' % cm.id)
                     self.contents[cm.id] = cm
+                    self._titleindex.setdefault((cm.title, cm.srs), []).append(cm)
 
     def getServiceXML(self):
         xml = None
@@ -116,43 +126,89 @@ class TileMapService(object):
                     items.append((item,self.contents[item]))
         return items
 
-    def _gettilefromset(self, tilesets, x, y,z, ext, timeout=None):
-        for tileset in tilesets:
-            if tileset['order'] == z:
-                url = tileset['href'] + '/' + str(x) +'/' + str(y) + '.' + ext
-                u = openURL(url, '', username = self.username,
-                            password = self.password, timeout=timeout or self.timeout)
-                return u
-        else:
-            raise ValueError('cannot find zoomlevel %i for TileMap' % z)
-
-    def gettile(self, x,y,z, id=None, title=None, srs=None, mimetype=None, timeout=None):
+    def prefetch(self, ids=None, workers=8):
+        '''Resolve the TileMaps of the given content ids, or of all contents,
+        with up to `workers` concurrent requests.  TileMaps which are
+        already resolved are not fetched again.  Returns the number of
+        TileMaps fetched.'''
+        if ids is None:
+            ids = list(self.contents)
+        pending = [self.contents[id] for id in ids
+                   if self.contents[id]._tile_map is None]
+
+        def resolve(cm):
+            try:
+                cm._get_tilemap()
+                return True
+            except Exception as err:
+                log.warning('Cannot fetch TileMap %s: %s' % (cm.id, err))
+                return False
+
+        return sum(threaded_map(resolve, pending, workers))
+
+    def _findtilemap(self, id=None, title=None, srs=None, mimetype=None):
+        if id:
+            return self.contents[id].tilemap
+        key = (title, srs, mimetype)
+        tilemap = self._tilemapindex.get(key)
+        if tilemap is None:
+            for cm in self._titleindex.get((title, srs), []):
+                #if no format is given we use the first tilemap that
+                # matches name and srs
+                if not mimetype or cm.mimetype == mimetype:
+                    tilemap = self._tilemapindex[key] = cm.tilemap
+                    break
+        return tilemap
+
+    def gettileurl(self, x, y, z, id=None, title=None, srs=None, mimetype=None):
+        '''Return the URL of a tile, without fetching it'''
         if not id and not title and not srs:
             raise ValueError('either id or title and srs must be specified')
-        if id:
-            return self._gettilefromset(self.contents[id].tilemap.tilesets,
-                x, y, z, self.contents[id].tilemap.extension, timeout=timeout)
-
-        elif title and srs:
-            for tm in self.contents.values():
-                if tm.title == title and tm.srs == srs:
-                    if mimetype:
-                        if tm.tilemap.mimetype == mimetype:
-                            return self._gettilefromset(tm.tilemap.tilesets,
-                                x, y, z, tm.tilemap.extension, timeout=timeout)
-                    else:
-                        #if no format is given we return the tile from the
-                        # first tilemap that matches name and srs
-                        return self._gettilefromset(tm.tilemap.tilesets,
-                            x, y,z, tm.tilemap.extension, timeout=timeout)
-            else:
-                raise ValueError('cannot find %s with projection %s for zoomlevel %i'
-                        %(title, srs, z) )
-        elif title or srs:
-            ValueError('both title and srs must be specified')
-        raise ValueError('''Specified Tile with id %s, title %s
-                projection %s format %s at zoomlevel %i cannot be found'''
-                %(id, title, srs, format, z))
+        if not id and not (title and srs):
+            raise ValueError('both title and srs must be specified')
+        tilemap = self._findtilemap(id, title, srs, mimetype)
+        if tilemap is None:
+            raise ValueError('cannot find %s with projection %s for zoomlevel %i'
+                    %(title, srs, z) )
+        return tilemap.gettileurl(x, y, z)
+
+    def getmosaic(self, bbox, z, id=None, title=None, srs=None, mimetype=None,
+                  mode='RGBA', decode=None, workers=8, timeout=None):
+        """Return the tiles covering a bounding box as one NumPy array.
+
+        The TileMap is chosen like in gettile, by id or by title and srs.
+        Tiles of zoom level z are fetched concurrently and decoded into a
+        preallocated array cropped to the pixel window of bbox
+        (minx, miny, maxx, maxy).  Requires NumPy, and Pillow unless a
+        decode(data, mode) callable is given.  Pixels of tiles missing
+        from the server are 0.
+
+        Returns a (array, transform) tuple, see owslib.mosaic.
+        """
+        if not id and not (title and srs):
+            raise ValueError('either id or title and srs must be specified')
+        tilemap = self._findtilemap(id, title, srs, mimetype)
+        if tilemap is None:
+            raise ValueError('cannot find %s with projection %s' % (title, srs))
+        tileset = tilemap.gettileset(z)
+        grid = mosaic.tms_grid(tilemap, tileset)
+
+        def fetch(row, column):
+            url = tilemap.gettileurl(column, -row - 1, z)
+            try:
+                return openURL(url, '', username=self.username, password=self.password,
+                               timeout=timeout or self.timeout).read()
+            except Exception as err:
+                if mosaic.missing_tile(err):
+                    return None
+                raise
+
+        return mosaic.assemble(grid, bbox, fetch, decode, mode, workers)
+
+    def gettile(self, x,y,z, id=None, title=None, srs=None, mimetype=None, timeout=None):
+        url = self.gettileurl(x, y, z, id, title, srs, mimetype)
+        return openURL(url, '', username = self.username,
+                       password = self.password, timeout=timeout or self.timeout)
 
 
 class ServiceIdentification(object):
@@ -178,7 +234,7 @@ class ContentMetadata(object):
     def __str__(self):
         return 'Layer Title: %s, URL: %s' % (self.title, self.id)
 
-    def __init__(self, elem, un=None, pw=None):
+    def __init__(self, elem, un=None, pw=None, cache=None, timeout=30):
         if elem.tag != 'TileMap':
             raise ValueError('%s should be a TileMap' % (elem,))
         self.id = elem.attrib['href']
@@ -186,16 +242,32 @@ class ContentMetadata(object):
         self.srs = force900913(elem.attrib['srs'])
         self.profile = elem.attrib['profile']
         self.password = pw
-        self.username = pw
+        self.username = un
+        self.timeout = timeout
+        self._cache = cache
+        self._lock = threading.Lock()
         self._tile_map = None
         self.type = elem.attrib.get('type')
 
     def _get_tilemap(self):
         if self._tile_map is None:
-            self._tile_map = TileMap(self.id, un=self.username, pw=self.password)
-            assert(self._tile_map.srs == self.srs)
+            # resolve once, even when called from several threads
+            with self._lock:
+                if self._tile_map is None:
+                    self._resolve_tilemap()
         return self._tile_map
 
+    def _resolve_tilemap(self):
+        tile_map = None
+        if self._cache is not None:
+            tile_map = self._cache.get(self.id)
+        if tile_map is None:
+            tile_map = TileMap(self.id, un=self.username, pw=self.password,
+                               timeout=self.timeout)
+            if self._cache is not None:
+                self._cache[self.id] = tile_map
+        assert(tile_map.srs == self.srs)
+        self._tile_map = tile_map
 
     @property
     def tilemap(self):
@@ -247,11 +319,14 @@ class TileMap(object):
     tilesets = None
     profile = None
 
-    def __init__(self, url=None, xml=None, un=None, pw=None):
+    def __init__(self, url=None, xml=None, un=None, pw=None, timeout=30):
         self.url = url
         self.username = un
         self.password = pw
+        self.timeout = timeout
         self.tilesets = []
+        self._tilesetsbyorder = {}
+        self._urltemplates = {}
         if xml and not url:
             self.readString(xml)
         elif url:
@@ -292,9 +367,27 @@ class TileMap(object):
                     'href': href,
                     'units-per-pixel': upp,
                     'order': order})
+                self._tilesetsbyorder[order] = self.tilesets[-1]
+                self._urltemplates[order] = '%s/%%s/%%s.%s' % (
+                    href.replace('%', '%%'), self.extension.replace('%', '%%'))
+
+    def gettileset(self, z):
+        '''Return the tileset of zoomlevel z'''
+        try:
+            return self._tilesetsbyorder[z]
+        except KeyError:
+            raise ValueError('cannot find zoomlevel %i for TileMap' % z)
+
+    def gettileurl(self, x, y, z):
+        '''Return the URL of tile x, y at zoomlevel z'''
+        try:
+            return self._urltemplates[z] % (x, y)
+        except KeyError:
+            raise ValueError('cannot find zoomlevel %i for TileMap' % z)
 
     def read(self, url):
-        u = openURL(url, '', method='Get', username = self.username, password = self.password)
+        u = openURL(url, '', method='Get', username = self.username,
+                    password = self.password, timeout=self.timeout)
         self._parse(etree.fromstring(u.read()))
 
     def readString(self, st):
@@ -35,6 +35,9 @@ import time
 import six
 import requests
 import codecs
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+from collections import deque
 
 """
 Utility functions and classes
@@ -42,7 +45,9 @@ Utility functions and classes
 
 class ServiceException(Exception):
     #TODO: this should go in ows common module when refactored.  
-    pass
+
+    #: the exception report of the server, when raised by openURL
+    xml = None
 
 # http://stackoverflow.com/questions/6256183/combine-two-dictionaries-of-dictionaries-python
 dict_union = lambda d1,d2: dict((x,(dict_union(d1.get(x,{}),d2[x]) if
@@ -50,6 +55,44 @@ dict_union = lambda d1,d2: dict((x,(dict_union(d1.get(x,{}),d2[x]) if
   set(list(d1.keys())+list(d2.keys())))
 
 
+class cached_property(object):
+    """
+    Decorator turning a method into an attribute computed on first access,
+    then stored in the instance __dict__ where it can also be assigned
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.__name__] = self.func(obj)
+        return value
+
+
+def cached_properties(obj):
+    """
+    Return the names of the cached_property fields of an object
+    """
+    names = []
+    for cls in type(obj).__mro__:
+        names.extend(k for k, v in vars(cls).items() if isinstance(v, cached_property))
+    return names
+
+
+def resolved_state(obj, *elements):
+    """
+    Return the __dict__ of an object with lazy fields for pickling, every
+    cached_property resolved and the attributes holding elements dropped
+    """
+    for name in cached_properties(obj):
+        getattr(obj, name)
+    return dict((k, v) for k, v in obj.__dict__.items() if k not in elements)
+
+
 # Infinite DateTimes for Python.  Used in SWE 2.0 and other OGC specs as "INF" and "-INF"
 class InfiniteDateTime(object):
     def __lt__(self, other):
@@ -123,14 +166,37 @@ class ResponseWrapper(object):
     Return object type from openURL.
 
     Provides a thin shim around requests response object to maintain code compatibility.
+    The body of streamed responses is read from the connection as it is
+    downloaded, as the bytes sent by the server.
     """
-    def __init__(self, response):
+    def __init__(self, response, stream=False, head=b''):
         self._response = response
+        self._stream = stream
+        self._head = head
+        self._body = None
 
     def info(self):
         return self._response.headers
 
-    def read(self):
+    def read(self, size=-1):
+        if size is None or size < 0:
+            if self._stream:
+                data, self._head = self._head + self._response.raw.read(decode_content=True), b''
+                return data
+            if self._body is not None:
+                return self._body.read()
+            return self._content()
+
+        if self._stream:
+            if self._head:
+                data, self._head = self._head[:size], self._head[size:]
+                return data
+            return self._response.raw.read(size, decode_content=True)
+        if self._body is None:
+            self._body = BytesIO(self._content())
+        return self._body.read(size)
+
+    def _content(self):
         if not self._response.encoding:
             return self._response.content           # bytes
 
@@ -141,12 +207,46 @@ class ResponseWrapper(object):
 
     # @TODO: __getattribute__ for poking at response
 
-def openURL(url_base, data=None, method='Get', cookies=None, username=None, password=None, timeout=30):
+# local names of the root elements of exception reports
+EXCEPTION_REPORTS = ('ExceptionReport', 'ServiceExceptionReport')
+
+# the first start tag of a document, after its declarations and comments
+ROOT_TAG = re.compile(br'<(?:[^\s/>:]+:)?([A-Za-z_][^\s/>:]*)[\s/>]')
+
+def _roottag(head):
+    """ Return the local name of the root element in the head of a
+    document, or None when the head does not reach it """
+    head = re.sub(br'<!--.*?-->', b'', head, flags=re.S)
+    head = re.sub(br'<[?!][^>]*>', b'', head)
+    if b'<!--' in head or b'<?' in head:
+        return None
+    match = ROOT_TAG.search(head)
+    return match.group(1).decode('ascii', 'replace') if match else None
+
+def _peekroot(raw, size=1024, limit=65536):
+    """ Read the head of a streamed document up to its root element,
+    returning the head and the local name of the root element """
+    head = b''
+    while len(head) < limit:
+        chunk = raw.read(size, decode_content=True)
+        if not chunk:
+            break
+        head += chunk
+        root = _roottag(head)
+        if root is not None:
+            return head, root
+    return head, _roottag(head)
+
+def openURL(url_base, data=None, method='Get', cookies=None, username=None, password=None, timeout=30, stream=False):
     """
     Function to open URLs.
 
     Uses requests library but with additional checks for OGC service exceptions and url formatting.
     Also handles cookies and simple user password authentication.
+
+    With stream=True, the body of the response is not downloaded before
+    returning: it is read from the connection as the response is read.
+    Only the head of XML responses is read, to check for exception reports.
     """
     headers = {}
     rkwargs = {}
@@ -180,6 +280,9 @@ def openURL(url_base, data=None, method='Get', cookies=None, username=None, pass
     if cookies is not None:
         rkwargs['cookies'] = cookies
 
+    if stream:
+        rkwargs['stream'] = True
+
     req = requests.request(method.upper(),
                            url_base,
                            **rkwargs)
@@ -192,8 +295,17 @@ def openURL(url_base, data=None, method='Get', cookies=None, username=None, pass
 
     # check for service exceptions without the http header set
     if 'Content-Type' in req.headers and req.headers['Content-Type'] in ['text/xml', 'application/xml', 'application/vnd.ogc.se_xml']:
+        if stream:
+            # only exception reports are read whole
+            head, root = _peekroot(req.raw)
+            if root not in EXCEPTION_REPORTS:
+                return ResponseWrapper(req, stream=True, head=head)
+            content = head + req.raw.read(decode_content=True)
+        else:
+            content = req.content
+
         #just in case 400 headers were not set, going to have to read the xml to see if it's an exception report.
-        se_tree = etree.fromstring(req.content)
+        se_tree = etree.fromstring(content)
 
         # to handle the variety of namespaces and terms across services
         # and versions, especially for "legacy" responses like WMS 1.3.0
@@ -208,9 +320,14 @@ def openURL(url_base, data=None, method='Get', cookies=None, username=None, pass
             serviceException = se_tree.find(possible_error)
             if serviceException is not None:
                 # and we need to deal with some message nesting
-                raise ServiceException('\n'.join([str(t).strip() for t in serviceException.itertext() if str(t).strip()]))
+                error = ServiceException('\n'.join([str(t).strip() for t in serviceException.itertext() if str(t).strip()]))
+                error.xml = content
+                raise error
 
-    return ResponseWrapper(req)
+        if stream:
+            return ResponseWrapper(req, stream=True, head=content)
+
+    return ResponseWrapper(req, stream=stream)
 
 #default namespace for nspath is OWS common
 OWS_NAMESPACE = 'http://www.opengis.net/ows/1.1'
@@ -246,6 +363,58 @@ def nspath_eval(xpath, namespaces):
         out.append('{%s}%s' % (namespaces[namespace], element))
     return '/'.join(out)
 
+class ElementPaths(object):
+    """
+    Element paths of a namespace mapping, such as 'gmd:title/gco:CharacterString',
+    compiled once and memoized: as lxml XPath objects with lxml, as ElementPath
+    expressions in Clark notation with ElementTree.
+    """
+
+    lxml = etree.__name__ == 'lxml.etree'
+
+    def __init__(self, namespaces=None):
+        self.namespaces = dict((k, v) for k, v in (namespaces or {}).items() if k is not None)
+        self._compiled = {}
+
+    def compile(self, path):
+        """ Return the compiled path """
+        try:
+            return self._compiled[path]
+        except KeyError:
+            pass
+        if self.lxml:
+            compiled = etree.XPath(path, namespaces=self.namespaces)
+        else:
+            steps = []
+            for step in path.split('/'):
+                if ':' in step:
+                    prefix, name = step.split(':', 1)
+                    step = '{%s}%s' % (self.namespaces[prefix], name)
+                steps.append(step)
+            compiled = '/'.join(steps)
+        self._compiled[path] = compiled
+        return compiled
+
+    def find(self, elem, path):
+        """ Return the first element matching path from elem, or None """
+        compiled = self.compile(path)
+        if self.lxml:
+            if hasattr(elem, 'getroot'):
+                elem = elem.getroot()
+            found = compiled(elem)
+            return found[0] if found else None
+        return elem.find(compiled)
+
+    def findall(self, elem, path):
+        """ Return the list of elements matching path from elem """
+        compiled = self.compile(path)
+        if self.lxml:
+            if hasattr(elem, 'getroot'):
+                elem = elem.getroot()
+            return compiled(elem)
+        return elem.findall(compiled)
+
+
 def cleanup_namespaces(element):
     """ Remove unused namespaces from an element """
     if etree.__name__ == 'lxml.etree':
@@ -268,7 +437,7 @@ def add_namespaces(root, ns_keys):
         # We can't re-add an existing namespaces.  Get a list of current
         # namespaces in use
         existing_namespaces = set()
-        for elem in root.getiterator():
+        for elem in root.iter():
             if elem.tag[0] == "{":
                 uri, tag = elem.tag[1:].split("}")
                 existing_namespaces.add(namespaces.get_namespace_from_url(uri))
@@ -353,7 +522,7 @@ def testXMLAttribute(element, attribute):
 
     return None
 
-def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, password=None):
+def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, password=None, stream=False):
     """
 
     Invoke an HTTP POST request 
@@ -365,6 +534,9 @@ def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, p
     - request: the request message
     - lang: the language
     - timeout: timeout in seconds
+    - stream: whether to return the response without downloading its body,
+      which is then read from the connection as the bytes sent by the
+      server, rather than returned as bytes (default is False)
 
     """
 
@@ -387,12 +559,120 @@ def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, p
     if username is not None and password is not None:
         rkwargs['auth'] = (username, password)
 
-    up = requests.post(url, request, headers=headers, **rkwargs)
+    if stream:
+        rkwargs['stream'] = True
+
+    up = requests.post(url, request, headers=headers, timeout=timeout, **rkwargs)
+    if stream:
+        return ResponseWrapper(up, stream=True)
+
     if not up.encoding:
         return up.content           # bytes
 
     return up.text.encode('utf-8')  # str
 
+def threaded_map(func, iterable, workers=4, ordered=True, prefetch=None):
+    """
+
+    Apply func to every item of iterable using a pool of worker threads,
+    yielding the results as they become available
+
+    Parameters
+    ----------
+
+    - func: callable taking one item of iterable
+    - iterable: the items to process
+    - workers: the number of worker threads (default is 4)
+    - ordered: whether results are yielded in input order (default) or
+      in completion order
+    - prefetch: optional maximum number of results computed ahead of the
+      consumer, bounding the memory held by results not yet yielded
+
+    """
+
+    pool = ThreadPool(max(1, workers))
+    try:
+        for result in _pooled(pool, func, iterable, ordered, prefetch):
+            yield result
+    finally:
+        pool.terminate()
+
+def process_map(func, iterable, workers=None, ordered=True, prefetch=None):
+    """
+
+    Apply func to every item of iterable using a pool of worker processes,
+    yielding the results as they become available.  As threaded_map, for
+    work bound by the interpreter rather than by I/O: func must be a module
+    level function, and items and results must be picklable
+
+    Parameters
+    ----------
+
+    - func: module level callable taking one item of iterable
+    - iterable: the items to process
+    - workers: the number of worker processes (default is the number of CPUs)
+    - ordered: whether results are yielded in input order (default) or
+      in completion order
+    - prefetch: optional maximum number of items processed ahead of the
+      consumer, bounding the memory held by items and results in flight
+
+    """
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        for result in _pooled(pool, func, iterable, ordered, prefetch):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+def _pooled(pool, func, iterable, ordered, prefetch):
+    if prefetch is not None and ordered:
+        return _prefetched(pool, func, iterable, max(1, prefetch))
+    elif prefetch is not None:
+        return _prefetched_unordered(pool, func, iterable, max(1, prefetch))
+    elif ordered:
+        return pool.imap(func, iterable)
+    return pool.imap_unordered(func, iterable)
+
+def _prefetched(pool, func, iterable, prefetch):
+    pending = deque()
+    for item in iterable:
+        if len(pending) == prefetch:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(func, (item,)))
+    while pending:
+        yield pending.popleft().get()
+
+def _trycall(func, item):
+    try:
+        return func(item), None
+    except Exception as err:
+        return None, err
+
+def _prefetched_unordered(pool, func, iterable, prefetch):
+    done = six.moves.queue.Queue()
+    kwargs = {}
+    if six.PY3:  # items failing to be sent to a worker process
+        kwargs['error_callback'] = lambda err: done.put((None, err))
+
+    def result():
+        value, error = done.get()
+        if error is not None:
+            raise error
+        return value
+
+    pending = 0
+    for item in iterable:
+        if pending == prefetch:
+            yield result()
+            pending -= 1
+        pool.apply_async(_trycall, (func, item), callback=done.put, **kwargs)
+        pending += 1
+    while pending:
+        yield result()
+        pending -= 1
+
 def element_to_string(element, encoding=None, xml_declaration=False):
     """
     Returns a string from a XML object
@@ -568,7 +848,7 @@ def strip_bom(raw_text):
         codecs.BOM_UTF32_BE
     ]
 
-    if not isinstance(raw_text, unicode):
+    if not isinstance(raw_text, six.text_type):
         for bom in boms:
             if raw_text.startswith(bom):
                 return raw_text.replace(bom, '')
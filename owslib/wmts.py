@@ -31,6 +31,7 @@ would be appreciated.
 
 from __future__ import (absolute_import, division, print_function)
 
+import re
 import warnings
 import six
 from six.moves import filter
@@ -41,10 +42,12 @@ except ImportError:      # Python 2
     from urllib import urlencode
     from urlparse import urlparse, urlunparse, parse_qs, ParseResult
 from .etree import etree
-from .util import openURL, testXMLValue, getXMLInteger
+from .util import openURL, testXMLValue, getXMLInteger, threaded_map
+from . import util
 from .fgdc import Metadata
 from .iso import MD_Metadata
 from .ows import ServiceProvider, ServiceIdentification, OperationsMetadata
+from . import mosaic
 
 
 _OWS_NS = '{http://www.opengis.net/ows/1.1}'
@@ -90,8 +93,11 @@ _TOP_LEFT_CORNER_TAG = _WMTS_NS + 'TopLeftCorner'
 
 _HREF_TAG = _XLINK_NS + 'href'
 
+# {variable} of a ResourceURL template
+_TEMPLATE_VARIABLE = re.compile(r'\{(\w+)\}')
 
-class ServiceException(Exception):
+
+class ServiceException(util.ServiceException):
     """WMTS ServiceException
 
     Attributes:
@@ -377,33 +383,41 @@ TILEMATRIX=6&TILEROW=4&TILECOL=4&FORMAT=image%2Fjpeg'
             >>> out.close()
 
         """
-        vendor_kwargs = self.vendor_kwargs or {}
+        # copy, as the instance may be shared between threads
+        vendor_kwargs = dict(self.vendor_kwargs or {})
         vendor_kwargs.update(kwargs)
         data = self.buildTileRequest(layer, style, format, tilematrixset,
                                      tilematrix, row, column, **vendor_kwargs)
 
         if base_url is None:
-            base_url = self.url
-            try:
-                methods = self.getOperationByName('GetTile').methods
-                get_verbs = [x for x in methods
-                             if x.get('type').lower() == 'get']
-                if len(get_verbs) > 1:
-                    # Filter by constraints
-                    base_url = next(
-                        x for x in filter(
-                            list,
-                            ([pv.get('url')
-                                for const in pv.get('constraints')
-                                if 'kvp' in [x.lower() for x in const.values]]
-                             for pv in get_verbs if pv.get('constraints'))))[0]
-                elif len(get_verbs) == 1:
-                    base_url = get_verbs[0].get('url')
-            except StopIteration:
-                pass
+            base_url = self._getKVPURL('GetTile')
         u = openURL(base_url, data, username=self.username,
                     password=self.password)
-
+        return self._checkServiceException(u)
+
+    def _getKVPURL(self, operation):
+        """Return the KVP GET URL of an operation, defaulting to self.url"""
+        base_url = self.url
+        try:
+            methods = self.getOperationByName(operation).methods
+            get_verbs = [x for x in methods
+                         if x.get('type').lower() == 'get']
+            if len(get_verbs) > 1:
+                # Filter by constraints
+                base_url = next(
+                    x for x in filter(
+                        list,
+                        ([pv.get('url')
+                            for const in pv.get('constraints')
+                            if 'kvp' in [x.lower() for x in const.values]]
+                         for pv in get_verbs if pv.get('constraints'))))[0]
+            elif len(get_verbs) == 1:
+                base_url = get_verbs[0].get('url')
+        except (KeyError, StopIteration):
+            pass
+        return base_url
+
+    def _checkServiceException(self, u):
         # check for service exceptions, and return
         if u.info()['Content-Type'] == 'application/vnd.ogc.se_xml':
             se_xml = u.read()
@@ -412,14 +426,253 @@ TILEMATRIX=6&TILEROW=4&TILECOL=4&FORMAT=image%2Fjpeg'
             raise ServiceException(err_message.strip(), se_xml)
         return u
 
+    def getmosaic(self, layer=None, bbox=None, tilematrix=None,
+                  tilematrixset=None, style=None, format=None, mode='RGBA',
+                  decode=None, workers=8, **kwargs):
+        """Return the tiles covering a bounding box as one NumPy array.
+
+        Tiles are fetched concurrently with `gettile` and decoded into a
+        preallocated array cropped to the pixel window of `bbox`.
+        Requires NumPy, and Pillow unless `decode` is given.  Pixels of
+        tiles missing from the server are 0.
+
+        Parameters
+        ----------
+        layer : string
+            Content layer name.
+        bbox : tuple
+            (minx, miny, maxx, maxy) in the CRS of the tile matrix set,
+            always in easting, northing order.
+        tilematrix : string
+            Name of the tile matrix (zoom level) to use.
+        tilematrixset : string
+            Optional name of tile matrix set to use.
+            Defaults to the first tile matrix set defined for the
+            relevant layer in the GetCapabilities response.
+        style : string
+            Optional style name.
+        format : string
+            Optional tile image format.
+        mode : string
+            Image mode of the result, e.g. 'RGBA', 'RGB' or 'L'.
+        decode : callable
+            Optional decode(data, mode) returning a (height, width, bands)
+            array for an encoded tile.
+        workers : int
+            Number of tiles fetched concurrently.
+        **kwargs : extra arguments
+            anything else e.g. vendor specific parameters
+
+        Returns a (array, transform) tuple, see `owslib.mosaic`.
+
+        """
+        if layer is None:
+            raise ValueError("layer is mandatory (cannot be None)")
+        if bbox is None:
+            raise ValueError("bbox is mandatory (cannot be None)")
+        if tilematrix is None:
+            msg = 'tilematrix (zoom level) is mandatory (cannot be None)'
+            raise ValueError(msg)
+        if tilematrixset is None:
+            tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
+        tms = self.tilematrixsets[tilematrixset]
+        limits = None
+        link = self[layer].tilematrixsetlinks.get(tilematrixset)
+        if link is not None:
+            limits = link.tilematrixlimits.get(tilematrix)
+        grid = mosaic.wmts_grid(tms, tms.tilematrix[tilematrix], limits)
+
+        def fetch(row, column):
+            try:
+                return self.gettile(layer=layer, style=style, format=format,
+                                    tilematrixset=tilematrixset,
+                                    tilematrix=tilematrix, row=row,
+                                    column=column, **kwargs).read()
+            except Exception as err:
+                if mosaic.missing_tile(err):
+                    return None
+                raise
+
+        return mosaic.assemble(grid, bbox, fetch, decode, mode, workers)
+
     def getServiceXML(self):
         xml = None
         if self._capabilities is not None:
             xml = etree.tostring(self._capabilities)
         return xml
 
-    def getfeatureinfo(self):
-        raise NotImplementedError
+    def buildFeatureInfoRequest(self, layer=None, style=None, format=None,
+                                tilematrixset=None, tilematrix=None,
+                                row=None, column=None, i=None, j=None,
+                                infoformat=None, **kwargs):
+        """Return the URL-encoded parameters for a GetFeatureInfo request.
+
+        Takes the parameters of `buildTileRequest`, plus the pixel
+        position i (column) and j (row) within the tile and the info
+        format, which defaults to the first one defined for the layer.
+
+        """
+        if layer is None:
+            raise ValueError("layer is mandatory (cannot be None)")
+        if i is None or j is None:
+            raise ValueError("i and j are mandatory (cannot be None)")
+        if infoformat is None:
+            if not self[layer].infoformats:
+                raise ValueError('layer %s does not support '
+                                 'GetFeatureInfo' % layer)
+            infoformat = self[layer].infoformats[0]
+        if style is None:
+            style = list(self[layer].styles.keys())[0]
+        if format is None:
+            format = self[layer].formats[0]
+        if tilematrixset is None:
+            tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
+        if tilematrix is None:
+            msg = 'tilematrix (zoom level) is mandatory (cannot be None)'
+            raise ValueError(msg)
+        if row is None or column is None:
+            raise ValueError("row and column are mandatory (cannot be None)")
+
+        request = list()
+        request.append(('SERVICE', 'WMTS'))
+        request.append(('REQUEST', 'GetFeatureInfo'))
+        request.append(('VERSION', '1.0.0'))
+        request.append(('LAYER', layer))
+        request.append(('STYLE', style))
+        request.append(('FORMAT', format))
+        request.append(('TILEMATRIXSET', tilematrixset))
+        request.append(('TILEMATRIX', tilematrix))
+        request.append(('TILEROW', str(row)))
+        request.append(('TILECOL', str(column)))
+        request.append(('J', str(j)))
+        request.append(('I', str(i)))
+        request.append(('INFOFORMAT', infoformat))
+
+        for key, value in six.iteritems(kwargs):
+            request.append((key, value))
+
+        return urlencode(request, True)
+
+    def getfeatureinfo(self, base_url=None, layer=None, style=None,
+                       format=None, tilematrixset=None, tilematrix=None,
+                       row=None, column=None, i=None, j=None,
+                       infoformat=None, **kwargs):
+        """Return the feature info at a pixel of a tile from the WMTS.
+
+        Returns the response as a file-like object.
+
+        Parameters are those of `gettile`, plus:
+
+        i : integer
+            Column of the pixel within the tile.
+        j : integer
+            Row of the pixel within the tile.
+        infoformat : string
+            Optional format of the response, such as 'text/html'.
+            Defaults to the first info format defined for the layer in
+            the GetCapabilities response.
+
+        Without a base_url, a FeatureInfo ResourceURL template of the
+        layer matching infoformat is used when there is one, otherwise a
+        KVP request is sent to the URL of the GetFeatureInfo operation.
+
+        """
+        if layer is None:
+            raise ValueError("layer is mandatory (cannot be None)")
+        if infoformat is None and self[layer].infoformats:
+            infoformat = self[layer].infoformats[0]
+        # copy, as the instance may be shared between threads
+        vendor_kwargs = dict(self.vendor_kwargs or {})
+        vendor_kwargs.update(kwargs)
+
+        template = None
+        if base_url is None:
+            template = self._getResourceURL(layer, 'FeatureInfo', infoformat)
+        if template is not None:
+            if style is None:
+                style = list(self[layer].styles.keys())[0]
+            if tilematrixset is None:
+                tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
+            values = {'style': style, 'tilematrixset': tilematrixset,
+                      'tilematrix': tilematrix, 'tilerow': row,
+                      'tilecol': column, 'i': i, 'j': j}
+            for key, value in six.iteritems(vendor_kwargs):
+                values.setdefault(key.lower(), value)
+            url = _TEMPLATE_VARIABLE.sub(
+                lambda m: str(values[m.group(1).lower()]), template)
+            u = openURL(url, username=self.username, password=self.password)
+        else:
+            data = self.buildFeatureInfoRequest(
+                layer, style, format, tilematrixset, tilematrix, row, column,
+                i, j, infoformat, **vendor_kwargs)
+            if base_url is None:
+                base_url = self._getKVPURL('GetFeatureInfo')
+            u = openURL(base_url, data, username=self.username,
+                        password=self.password)
+        return self._checkServiceException(u)
+
+    def getfeatureinfos(self, positions, layer=None, tilematrix=None,
+                        tilematrixset=None, style=None, format=None,
+                        infoformat=None, workers=8, **kwargs):
+        """Return the feature info at many positions of a tile matrix.
+
+        Each position is located in its tile and the GetFeatureInfo
+        requests are sent concurrently, grouped tile by tile so that
+        servers see requests for the same tile together.  Positions
+        falling on the same pixel share one request.
+
+        Parameters
+        ----------
+        positions : iterable
+            (x, y) positions in the CRS of the tile matrix set, always in
+            easting, northing order.
+        layer, tilematrix, tilematrixset, style, format, infoformat :
+            see `getfeatureinfo`.
+        workers : int
+            Number of requests sent concurrently.
+        **kwargs : extra arguments
+            anything else e.g. vendor specific parameters
+
+        Returns a list holding the content of the response for each
+        position, in the order of positions, or None for the positions
+        outside of the tile matrix.
+
+        """
+        if layer is None:
+            raise ValueError("layer is mandatory (cannot be None)")
+        if tilematrix is None:
+            msg = 'tilematrix (zoom level) is mandatory (cannot be None)'
+            raise ValueError(msg)
+        if tilematrixset is None:
+            tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
+        tms = self.tilematrixsets[tilematrixset]
+        limits = None
+        link = self[layer].tilematrixsetlinks.get(tilematrixset)
+        if link is not None:
+            limits = link.tilematrixlimits.get(tilematrix)
+        grid = mosaic.wmts_grid(tms, tms.tilematrix[tilematrix], limits)
+
+        pixels = [grid.locate(x, y) for x, y in positions]
+        requests = sorted(set(p for p in pixels if p is not None))
+
+        def fetch(pixel):
+            row, column, i, j = pixel
+            return self.getfeatureinfo(
+                layer=layer, style=style, format=format,
+                tilematrixset=tilematrixset, tilematrix=tilematrix,
+                row=row, column=column, i=i, j=j, infoformat=infoformat,
+                **kwargs).read()
+
+        responses = dict(zip(requests, threaded_map(fetch, requests, workers)))
+        return [responses.get(pixel) for pixel in pixels]
+
+    def _getResourceURL(self, layer, resourcetype, format):
+        """Return the template of a ResourceURL of layer, or None"""
+        for resource in self[layer].resourceURLs:
+            if (resource['resourceType'] == resourcetype and
+                    resource['format'] == format):
+                return resource['template']
+        return None
 
     def getOperationByName(self, name):
         """Return a named content item."""
@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+# Throughput of compact.bulkparse over a directory of ISO, FGDC and DIF
+# documents, copied from tests/resources, against parsing them one by one
+# in this process, for 1 up to the number of CPUs of worker processes.
+#
+# Usage: python -m tests.benchmarks.bench_bulkparse
+
+from __future__ import (absolute_import, division, print_function)
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+from owslib.compact import bulkparse, compact, _parsedocument
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir, 'resources')
+
+DOCUMENTS = ['9250AA67-F3AC-6C12-0CB9-0662231AA181_iso.xml',
+             '9250AA67-F3AC-6C12-0CB9-0662231AA181_fgdc.xml',
+             '9250AA67-F3AC-6C12-0CB9-0662231AA181_dif.xml',
+             'iso_xml_srv.xml']
+
+
+def main(count=2000):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        paths = []
+        for i in range(count):
+            path = os.path.join(tmpdir, '%06d.xml' % i)
+            shutil.copy(os.path.join(RESOURCES, DOCUMENTS[i % len(DOCUMENTS)]), path)
+            paths.append(path)
+
+        print('%d documents, %d CPUs' % (count, multiprocessing.cpu_count()))
+        print('%8s %14s %10s' % ('workers', 'documents/s', 'speedup'))
+        start = time.time()
+        for path in paths:
+            compact(_parsedocument(path))
+        serial = count / (time.time() - start)
+        print('%8s %14.1f %10.2f' % ('-', serial, 1))
+
+        workers = 1
+        while workers <= multiprocessing.cpu_count():
+            start = time.time()
+            parsed = sum(1 for key, record in bulkparse(paths, workers=workers))
+            assert parsed == count
+            rate = count / (time.time() - start)
+            print('%8d %14.1f %10.2f' % (workers, rate, rate / serial))
+            workers *= 2
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+# Benchmark of GML feature decoding, object by object against columnar.
+#
+# Usage: python -m tests.benchmarks.bench_gml
+
+from __future__ import (absolute_import, division, print_function)
+
+import time
+from six import BytesIO
+
+from owslib.feature import gml, columnar
+
+FEATURE = ('<wfs:member><app:parcel gml:id="parcel.%(id)d">'
+           '<app:area>%(area)s</app:area><app:owner>owner %(id)d</app:owner>'
+           '<app:geometry><gml:Polygon srsName="urn:ogc:def:crs:EPSG::4258"><gml:exterior>'
+           '<gml:LinearRing><gml:posList>%(poslist)s</gml:posList></gml:LinearRing>'
+           '</gml:exterior></gml:Polygon></app:geometry></app:parcel></wfs:member>')
+
+
+def build_collection(features, vertices):
+    """Return a GML 3.2 collection of polygon features, of vertices each"""
+    members = []
+    for i in range(features):
+        poslist = ' '.join(['%.6f %.6f' % (50 + i * 1e-4 + v * 1e-6, 14 + v * 1e-6)
+                            for v in range(vertices)])
+        members.append(FEATURE % {'id': i, 'area': i * 1.5, 'poslist': poslist})
+    return ('<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs/2.0" '
+            'xmlns:gml="http://www.opengis.net/gml/3.2" xmlns:app="http://www.example.com/app">'
+            '%s</wfs:FeatureCollection>' % ''.join(members)).encode('utf-8')
+
+
+def main(sizes=((10000, 10), (2000, 500), (200, 5000))):
+    print('%9s %9s %10s %14s %14s' % ('features', 'vertices', 'MB', 'objects (s)', 'columnar (s)'))
+    for features, vertices in sizes:
+        data = build_collection(features, vertices)
+        timings = []
+        for decode in (lambda: list(gml.iterfeatures(BytesIO(data))),
+                       lambda: columnar.decode(BytesIO(data))):
+            start = time.time()
+            decode()
+            timings.append(time.time() - start)
+        print('%9d %9d %10.1f %14.3f %14.3f' % tuple([features, vertices, len(data) / 1e6] + timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+# Benchmark of the ISO, FGDC and DIF parsers over the records of
+# tests/resources, and of their compiled element paths against paths
+# evaluated by util.nspath_eval on every lookup.
+#
+# Usage: python -m tests.benchmarks.bench_metadata
+
+from __future__ import (absolute_import, division, print_function)
+
+import glob
+import os
+import time
+
+from owslib.etree import etree
+from owslib import util, iso, fgdc, dif
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir, 'resources')
+
+PARSERS = [
+    ('iso', '{http://www.isotc211.org/2005/gmd}MD_Metadata', iso.MD_Metadata, iso),
+    ('fgdc', 'metadata', fgdc.Metadata, fgdc),
+    ('dif', '{http://gcmd.gsfc.nasa.gov/Aboutus/xml/dif/}DIF', dif.DIF, dif),
+]
+
+
+def load_records():
+    """Return the (kind, element) of the metadata records in tests/resources"""
+    records = []
+    for filename in sorted(glob.glob(os.path.join(RESOURCES, '*.xml'))):
+        try:
+            tree = etree.parse(filename)
+        except Exception:
+            continue
+        for kind, tag, parser, module in PARSERS:
+            for elem in tree.iter(tag):
+                records.append((kind, elem))
+    return records
+
+
+def touch(obj, depth=0):
+    """Access every field of a parsed record, as lazy fields are parsed on
+    first access"""
+    if depth > 6:
+        return
+    if isinstance(obj, (list, tuple)):
+        for item in obj:
+            touch(item, depth + 1)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            touch(item, depth + 1)
+    elif type(obj).__module__.startswith('owslib'):
+        for name in dir(obj):
+            if not name.startswith('_') and name != 'xml':
+                touch(getattr(obj, name, None), depth + 1)
+
+
+def main(repeat=200):
+    records = load_records()
+    parsers = dict((kind, parser) for kind, tag, parser, module in PARSERS)
+    print('%d records, %s paths' % (len(records), 'lxml XPath' if util.ElementPaths.lxml else 'ElementPath'))
+
+    print('%6s %8s %14s' % ('kind', 'records', 'records/s'))
+    for kind in parsers:
+        elems = [elem for k, elem in records if k == kind]
+        if not elems:
+            continue
+        start = time.time()
+        for i in range(repeat):
+            for elem in elems:
+                touch(parsers[kind](elem))
+        elapsed = time.time() - start
+        print('%6s %8d %14.1f' % (kind, len(elems), repeat * len(elems) / elapsed))
+
+    # every lookup made by the parsers, compiled or evaluated each time
+    print('%6s %8s %14s %14s' % ('kind', 'paths', 'compiled (s)', 'nspath (s)'))
+    for kind, tag, parser, module in PARSERS:
+        elems = [elem for k, elem in records if k == kind]
+        paths = list(module._paths._compiled)
+        if not elems or not paths:
+            continue
+        namespaces = getattr(module, 'namespaces', {})
+        timings = []
+        for find in (lambda elem, path: module._paths.findall(elem, path),
+                     lambda elem, path: elem.findall(util.nspath_eval(path, namespaces) if ':' in path else path)):
+            start = time.time()
+            for i in range(repeat):
+                for elem in elems:
+                    for path in paths:
+                        find(elem, path)
+            timings.append(time.time() - start)
+        print('%6s %8d %14.3f %14.3f' % tuple([kind, len(paths)] + timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+# Memory held by harvested ISO, FGDC and DIF records, in bytes per record,
+# parsed and fully accessed, and as compact.compact snapshots with and
+# without their raw XML.
+#
+# Usage: python -m tests.benchmarks.bench_records_memory
+
+from __future__ import (absolute_import, division, print_function)
+
+import gc
+import tracemalloc
+
+from owslib.etree import etree
+from owslib.compact import compact
+from tests.benchmarks.bench_metadata import PARSERS, load_records, touch
+
+
+def held(documents, parser, keep):
+    """Return the bytes per record held by the records kept of documents"""
+    gc.collect()
+    tracemalloc.start()
+    records = []
+    for document in documents:
+        record = parser(etree.fromstring(document))
+        touch(record)
+        records.append(keep(record))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(records)
+
+
+def main(count=200):
+    records = load_records()
+    parsers = dict((kind, parser) for kind, tag, parser, module in PARSERS)
+    if etree.__name__ == 'lxml.etree':
+        print('allocations of libxml2 are not traced: parsed records are underestimated')
+
+    print('%6s %8s %14s %14s %14s' % ('kind', 'records', 'parsed', 'compact+xml', 'compact'))
+    for kind, elem in records:
+        documents = [etree.tostring(elem)] * count
+        sizes = [held(documents, parsers[kind], keep) for keep in (
+            lambda record: record,
+            lambda record: compact(record, xml=True),
+            lambda record: compact(record))]
+        print('%6s %8d %14.0f %14.0f %14.0f' % tuple([kind, count] + sizes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+# =============================================================================
+# OWSLib. Copyright (C) 2005 Sean C. Gillies
+#
+# Contact email: sgillies@frii.com
+# =============================================================================
+
+# Benchmark of TMS tile URL lookups against catalogues of increasing size.
+#
+# Usage: python -m tests.benchmarks.bench_tms
+
+from __future__ import (absolute_import, division, print_function)
+
+import timeit
+
+from owslib.tms import TileMapService, TileMap
+
+TILEMAP = ('<TileMap version="1.0.0"><Title>%(name)s</Title><SRS>EPSG:4326</SRS>'
+           '<BoundingBox minx="-180" miny="-90" maxx="180" maxy="90" />'
+           '<Origin x="-180" y="-90" />'
+           '<TileFormat width="256" height="256" mime-type="image/%(ext)s" extension="%(ext)s" />'
+           '<TileSets profile="global-geodetic">%(tilesets)s</TileSets></TileMap>')
+TILESET = '<TileSet href="%s/%d" units-per-pixel="%s" order="%d" />'
+
+
+def build_service(size, zoomlevels=20):
+    """Return a TileMapService of size TileMaps with their TileMaps resolved"""
+    hrefs = []
+    entries = []
+    for i in range(size):
+        for ext in ('png', 'jpeg'):
+            href = 'http://tms.example.com/1.0.0/layer%d@EPSG%%3A4326@%s' % (i, ext)
+            hrefs.append((href, 'layer%d' % i, ext))
+            entries.append('<TileMap title="layer%d" srs="EPSG:4326" profile="global-geodetic" '
+                           'href="%s" />' % (i, href))
+    caps = ('<TileMapService version="1.0.0" services="http://tms.example.com">'
+            '<Title>Benchmark</Title><TileMaps>%s</TileMaps></TileMapService>' % ''.join(entries))
+    service = TileMapService('http://tms.example.com/1.0.0', xml=caps)
+    for href, name, ext in hrefs:
+        tilesets = ''.join([TILESET % (href, z, 0.703125 / 2 ** z, z) for z in range(zoomlevels)])
+        service.tilemaps[href] = TileMap(xml=TILEMAP % {'name': name, 'ext': ext, 'tilesets': tilesets})
+    return service
+
+
+def main(sizes=(10, 100, 1000), number=20000):
+    print('%8s %14s %14s %14s' % ('tilemaps', 'id (us)', 'title (us)', 'mimetype (us)'))
+    for size in sizes:
+        service = build_service(size)
+        last = 'layer%d' % (size - 1)
+        href = 'http://tms.example.com/1.0.0/%s@EPSG%%3A4326@png' % last
+        lookups = [
+            lambda: service.gettileurl(10, 10, 19, href),
+            lambda: service.gettileurl(10, 10, 19, title=last, srs='EPSG:4326'),
+            lambda: service.gettileurl(10, 10, 19, title=last, srs='EPSG:4326', mimetype='image/jpeg'),
+        ]
+        timings = [min(timeit.repeat(lookup, number=number, repeat=3)) / number * 1e6
+                   for lookup in lookups]
+        print('%8d %14.2f %14.2f %14.2f' % tuple([size * 2] + timings))
+
+
+if __name__ == '__main__':
+    main()
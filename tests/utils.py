@@ -73,3 +73,17 @@ def cast_tuple_int_list_srs(tup):
 
 def sorted_url_query(url):
     return sorted(urlparse(url).query.split("&"))
+
+def http_response(body, content_type='text/xml', status_code=200):
+    """Helper function to return a requests response whose body, bytes or
+    a binary file, is streamed as by a server"""
+    import requests
+    from io import BytesIO
+    from urllib3 import HTTPResponse
+    if isinstance(body, bytes):
+        body = BytesIO(body)
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers['Content-Type'] = content_type
+    response.raw = HTTPResponse(body, status=status_code, preload_content=False)
+    return response